@@ -58,8 +58,9 @@ class CacheControlMiddleware(BaseHTTPMiddleware):
             
             # Add ETag for conditional requests (based on response body hash)
             # Note: This is a simple implementation. For production, consider
-            # using Redis or proper ETag generation
-            if hasattr(response, 'body'):
+            # using Redis or proper ETag generation. Endpoints that already set
+            # their own ETag (e.g. from data file fingerprints) keep it.
+            if hasattr(response, 'body') and "ETag" not in response.headers:
                 etag = self._generate_etag(response.body)
                 response.headers["ETag"] = etag
             
@@ -103,7 +103,7 @@ class VEIDistribution(BaseModel):
     volcano_name: str
     vei_counts: Dict[int, int]  # {vei: count}
     total_eruptions: int
-    date_range: Optional[Dict[str, str]] = None  # {"start": "2000-01-01", "end": "2023-12-31"}
+    date_range: Optional[Dict[str, Any]] = None  # ISO start/end dates and numeric start_year/end_year
     
     model_config = ConfigDict(
         json_schema_extra={
@@ -120,7 +120,9 @@ class VEIDistribution(BaseModel):
                 "total_eruptions": 60,
                 "date_range": {
                     "start": "1616-07-22",
-                    "end": "2023-06-06"
+                    "end": "2023-06-06",
+                    "start_year": 1616,
+                    "end_year": 2023
                 }
             }
         }
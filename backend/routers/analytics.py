@@ -4,9 +4,11 @@ Analytics router - API endpoints for analytical data
 These endpoints return data for chemical analysis plots (TAS, AFM),
 VEI distributions, and comparative analysis between volcanoes.
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import JSONResponse
 from pymongo.database import Database
 from typing import List, Dict, Any, Optional
+from functools import lru_cache
 
 from backend.dependencies import get_database
 from backend.models.responses import RockTypeDistributionResponse
@@ -76,14 +78,9 @@ async def get_rock_type_distribution(
     }
 
 
-@router.get("/tas-polygons")
-async def get_tas_polygons():
-    """
-    Get TAS (Total Alkali-Silica) diagram polygon definitions.
-    
-    Returns the polygon coordinates and names for TAS diagram regions.
-    Frontend can use this to draw the TAS classification diagram.
-    """
+@lru_cache(maxsize=1)
+def _tas_polygons_body() -> bytes:
+    """Render the fixed TAS diagram definition once as a ready-to-send JSON body."""
     # TAS polygon definitions (from analytic_plots.py)
     polygons = [
         {"name": "picro-basalt",            "coordinates": [[41,0],[41,3],[45,3],[45,0],[41,0]]},
@@ -112,24 +109,30 @@ async def get_tas_polygons():
         ]
     }
     
-    return {
+    return JSONResponse({
         "polygons": polygons,
         "alkali_line": alkali_line,
         "axes": {
             "x": {"label": "SiO2 (WT%)", "range": [39, 80]},
             "y": {"label": "Na2O+K2O (WT%)", "range": [0, 16]}
         }
-    }
+    }).body
 
 
-@router.get("/afm-boundary")
-async def get_afm_boundary():
+@router.get("/tas-polygons")
+async def get_tas_polygons():
     """
-    Get AFM (Alkali-Ferro-Magnesium) diagram boundary line.
+    Get TAS (Total Alkali-Silica) diagram polygon definitions.
     
-    Returns the boundary line coordinates that separates tholeiitic
-    and calc-alkaline rock series on the AFM ternary diagram.
+    Returns the polygon coordinates and names for TAS diagram regions.
+    Frontend can use this to draw the TAS classification diagram.
     """
+    return Response(content=_tas_polygons_body(), media_type="application/json")
+
+
+@lru_cache(maxsize=1)
+def _afm_boundary_body() -> bytes:
+    """Render the fixed AFM boundary definition once as a ready-to-send JSON body."""
     boundary_line = {
         "name": "Tholeiitic/Calc-Alkaline Boundary",
         "coordinates": [
@@ -142,7 +145,7 @@ async def get_afm_boundary():
         ]
     }
     
-    return {
+    return JSONResponse({
         "boundary": boundary_line,
         "axes": {
             "A": "FeOT (WT%)",
@@ -150,7 +153,18 @@ async def get_afm_boundary():
             "M": "MgO (WT%)"
         },
         "note": "Points above line are calc-alkaline, below are tholeiitic"
-    }
+    }).body
+
+
+@router.get("/afm-boundary")
+async def get_afm_boundary():
+    """
+    Get AFM (Alkali-Ferro-Magnesium) diagram boundary line.
+    
+    Returns the boundary line coordinates that separates tholeiitic
+    and calc-alkaline rock series on the AFM ternary diagram.
+    """
+    return Response(content=_afm_boundary_body(), media_type="application/json")
 
 
 @router.get("/volcano/{volcano_number}/samples-with-vei")
@@ -188,10 +202,13 @@ async def get_volcano_samples_with_vei(
     
     # Get eruptions for this volcano with VEI
     # Note: eruptions collection stores volcano_number as int, samples as string
-    eruptions = list(db.eruptions.find({
-        "volcano_number": volcano_number,
-        "vei": {"$ne": None, "$gte": 0, "$lte": 8}
-    }).sort("start_date.year", -1))
+    eruptions = list(db.eruptions.find(
+        {
+            "volcano_number": volcano_number,
+            "vei": {"$ne": None, "$gte": 0, "$lte": 8}
+        },
+        {"_id": 0, "vei": 1, "start_date.year": 1}
+    ))
     
     if not eruptions:
         # No VEI data available for this volcano
@@ -205,48 +222,25 @@ async def get_volcano_samples_with_vei(
             "message": "No eruption records with VEI found for this volcano"
         }
     
-    # Join samples with eruptions by volcano number and year
+    # Map each eruption year to its VEI once, keeping the first eruption seen for a year,
+    # instead of running a correlated eruptions lookup for every sample
+    vei_by_year = {}
+    for eruption in eruptions:
+        year = (eruption.get("start_date") or {}).get("year")
+        if year is not None:
+            vei_by_year.setdefault(year, eruption["vei"])
+    
     # Note: volcano_number is int in eruptions, string in samples.matching_metadata.volcano.number
     pipeline = [
         {
             "$match": {
                 "matching_metadata.volcano.number": volcano_num_str,
-                "eruption_date.year": {"$ne": None},
+                "eruption_date.year": {"$in": list(vei_by_year)},
                 "oxides.SIO2": {"$exists": True},
                 "oxides.NA2O": {"$exists": True},
                 "oxides.K2O": {"$exists": True}
             }
         },
-        {
-            "$lookup": {
-                "from": "eruptions",
-                "let": {
-                    "sample_year": "$eruption_date.year"
-                },
-                "pipeline": [
-                    {
-                        "$match": {
-                            "$expr": {
-                                "$and": [
-                                    {"$eq": ["$volcano_number", volcano_number]},
-                                    {"$eq": ["$start_date.year", "$$sample_year"]},
-                                    {"$ne": ["$vei", None]},
-                                    {"$gte": ["$vei", 0]},
-                                    {"$lte": ["$vei", 8]}
-                                ]
-                            }
-                        }
-                    },
-                    {"$project": {"vei": 1, "start_date": 1}}
-                ],
-                "as": "matching_eruptions"
-            }
-        },
-        {
-            "$match": {
-                "matching_eruptions.0": {"$exists": True}
-            }
-        },
         {
             "$project": {
                 "_id": 0,
@@ -256,7 +250,6 @@ async def get_volcano_samples_with_vei(
                 "material": 1,
                 "geometry": 1,
                 "oxides": 1,  # Preserve original MongoDB oxide field names like SIO2(WT%)
-                "vei": {"$arrayElemAt": ["$matching_eruptions.vei", 0]},
                 "eruption_year": "$eruption_date.year",
                 "matching_metadata": 1
             }
@@ -264,6 +257,8 @@ async def get_volcano_samples_with_vei(
     ]
     
     samples = list(db.samples.aggregate(pipeline))
+    for sample in samples:
+        sample["vei"] = vei_by_year[sample["eruption_year"]]
     matched_samples = len(samples)
     
     # Get VEI distribution
@@ -2,23 +2,48 @@
 Metadata router - API endpoints for metadata (countries, rock types, etc.)
 """
 from fastapi import APIRouter, Depends
+from pymongo.collection import Collection
 from pymongo.database import Database
+from cachetools import TTLCache
+import threading
 
 from backend.dependencies import get_database
 
 router = APIRouter()
 
+# In-memory cache for distinct-value lists (1 hour TTL, matching the metadata
+# Cache-Control max-age). Each list needs a full distinct scan of its collection
+# but only changes when the database is reloaded.
+metadata_cache = TTLCache(maxsize=32, ttl=3600)  # 1 hour
+cache_lock = threading.Lock()
+
+
+def _distinct_values(collection: Collection, field: str) -> dict:
+    """
+    Return the sorted, non-empty distinct values of a field, cached per collection and field.
+    """
+    cache_key = f"{collection.name}:{field}"
+    with cache_lock:
+        cached = metadata_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    values = collection.distinct(field)
+    result = {
+        "count": len(values),
+        "data": sorted([v for v in values if v])
+    }
+    with cache_lock:
+        metadata_cache[cache_key] = result
+    return result
+
 
 @router.get("/countries")
 async def get_countries(db: Database = Depends(get_database)):
     """
     Get list of all countries
     """
-    countries = db.volcanoes.distinct("country")
-    return {
-        "count": len(countries),
-        "data": sorted([c for c in countries if c])
-    }
+    return _distinct_values(db.volcanoes, "country")
 
 
 @router.get("/regions")
@@ -26,11 +51,7 @@ async def get_regions(db: Database = Depends(get_database)):
     """
     Get list of all volcano regions
     """
-    regions = db.volcanoes.distinct("region")
-    return {
-        "count": len(regions),
-        "data": sorted([r for r in regions if r])
-    }
+    return _distinct_values(db.volcanoes, "region")
 
 
 @router.get("/tectonic-settings")
@@ -38,22 +59,14 @@ async def get_tectonic_settings(db: Database = Depends(get_database)):
     """
     Get list of all tectonic settings (from volcanoes tectonic_setting.ui field)
     """
-    volcano_settings = db.volcanoes.distinct("tectonic_setting.ui")
-    return {
-        "count": len(volcano_settings),
-        "data": sorted([s for s in volcano_settings if s])
-    }
+    return _distinct_values(db.volcanoes, "tectonic_setting.ui")
 
 @router.get("/tectonic-settings-volcanoes")
 async def get_tectonic_settings_volcanoes(db: Database = Depends(get_database)):
     """
     Get list of all tectonic settings from volcanoes (tecto.ui)
     """
-    volcano_settings = db.volcanoes.distinct("tectonic_setting.ui")
-    return {
-        "count": len(volcano_settings),
-        "data": sorted([s for s in volcano_settings if s])
-    }
+    return _distinct_values(db.volcanoes, "tectonic_setting.ui")
 
 @router.get("/tectonic-settings-samples")
 async def get_tectonic_settings_samples(db: Database = Depends(get_database)):
@@ -61,14 +74,8 @@ async def get_tectonic_settings_samples(db: Database = Depends(get_database)):
     Get list of all tectonic settings from samples.
     Returns the sample's tecto.ui values.
     """
-    # Get tectonic settings from samples (tecto.ui field)
-    sample_settings = db.samples.distinct("tecto.volcano_ui")
-    # Combine and deduplicate
-    all_settings = set(sample_settings)
-    return {
-        "count": len(all_settings),
-        "data": sorted([s for s in all_settings if s])
-    }
+    # distinct() already deduplicates the sample settings
+    return _distinct_values(db.samples, "tecto.volcano_ui")
 
 
 @router.get("/rock-types")
@@ -76,11 +83,7 @@ async def get_rock_types(db: Database = Depends(get_database)):
     """
     Get list of all rock types from samples (using petro.rock_type field)
     """
-    rock_types = db.samples.distinct("petro.rock_type")
-    return {
-        "count": len(rock_types),
-        "data": sorted([r for r in rock_types if r])
-    }
+    return _distinct_values(db.samples, "petro.rock_type")
 
 
 @router.get("/databases")
@@ -88,11 +91,7 @@ async def get_databases(db: Database = Depends(get_database)):
     """
     Get list of available samples databases (GEOROC, PetDB)
     """
-    databases = db.samples.distinct("db")
-    return {
-        "count": len(databases),
-        "data": sorted([d for d in databases if d])
-    }
+    return _distinct_values(db.samples, "db")
 
 
 @router.get("/volcano-names")
@@ -100,8 +99,4 @@ async def get_volcano_names(db: Database = Depends(get_database)):
     """
     Get list of all volcano names for autocomplete
     """
-    volcano_names = db.volcanoes.distinct("volcano_name")
-    return {
-        "count": len(volcano_names),
-        "data": sorted([v for v in volcano_names if v])
-    }
+    return _distinct_values(db.volcanoes, "volcano_name")
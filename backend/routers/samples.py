@@ -4,13 +4,54 @@ Samples router - API endpoints for rock sample data
 from fastapi import APIRouter, Depends, Query, HTTPException
 from pymongo.database import Database
 from bson import ObjectId
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List
 
 from backend.dependencies import get_database
-from backend.services.sample_filters import build_sample_match_query
+from backend.services.sample_filters import build_cluster_stages, build_sample_match_query, cluster_cell_size
 
 router = APIRouter()
 
+# Runs the pagination count alongside the page query; both are network-bound
+# MongoDB calls, so a small thread pool overlaps their round-trips
+_count_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sample-count")
+
+# Oxides returned with each sample in the list endpoint
+SAMPLE_OXIDES = ('SIO2', 'NA2O', 'K2O', 'MGO', 'FE2O3', 'FEOT', 'CAO', 'AL2O3', 'TIO2', 'P2O5', 'MNO')
+
+
+def _attach_volcano_petro(db: Database, samples: List[dict]) -> None:
+    """
+    Set matching_metadata.volcano.petro on each sample from the volcanoes collection.
+    
+    Samples store the volcano number as a string while volcanoes store it as an int,
+    so instead of a per-sample $lookup (which cannot use an index across the type
+    conversion) the distinct volcanoes are fetched once and joined through a dict.
+    """
+    volcano_numbers = set()
+    for sample in samples:
+        number = ((sample.get("matching_metadata") or {}).get("volcano") or {}).get("number")
+        if number is not None:
+            volcano_numbers.add(str(number))
+    
+    petro_by_number = {}
+    numeric = [int(n) for n in volcano_numbers if n.lstrip("-").isdigit()]
+    if numeric:
+        for volcano in db.volcanoes.find(
+            {"volcano_number": {"$in": numeric}},
+            {"volcano_number": 1, "petro": 1, "_id": 0}
+        ):
+            petro_by_number[str(int(volcano["volcano_number"]))] = volcano.get("petro")
+    
+    for sample in samples:
+        # Stored nulls are replaced like missing fields
+        metadata = sample.get("matching_metadata") or {}
+        sample["matching_metadata"] = metadata
+        volcano = metadata.get("volcano") or {}
+        metadata["volcano"] = volcano
+        number = volcano.get("number")
+        volcano["petro"] = petro_by_number.get(str(number)) if number is not None else None
+
 
 @router.get("/")
 async def get_samples(
@@ -48,7 +89,8 @@ async def get_samples(
     # Project only necessary fields for performance
     # Minimize data transfer by excluding large nested objects unless specifically needed
     projection = {
-        "_id": 1,
+        # Stringify the ObjectId server-side for JSON serialization
+        "_id": {"$toString": "$_id"},
         "sample_id": 1,
         "sample_code": 1,
         "petro": 1,
@@ -60,34 +102,15 @@ async def get_samples(
         "references": 1,
         "geo_age": 1,  # Include temporal data for score explanations
         "eruption_date": 1,   # Include eruption date for temporal calculations
-        # Include key oxides for TAS/AFM plots (only what's needed)
-        # Support both structures: oxides in nested object or at root level
-        "oxides.SIO2": 1,
-        "oxides.NA2O": 1,
-        "oxides.K2O": 1,
-        "oxides.MGO": 1,
-        "oxides.FE2O3": 1,
-        "oxides.FEOT": 1,
-        "oxides.CAO": 1,
-        "oxides.AL2O3": 1,
-        "oxides.TIO2": 1,
-        "oxides.P2O5": 1,
-        "oxides.MNO": 1,
-        # Also include root-level oxide fields (some samples store oxides at root)
-        "SIO2": 1,
-        "NA2O": 1,
-        "K2O": 1,
-        "MGO": 1,
-        "FE2O3": 1,
-        "FEOT": 1,
-        "CAO": 1,
-        "AL2O3": 1,
-        "TIO2": 1,
-        "P2O5": 1,
-        "MNO": 1
+        # Key oxides for TAS/AFM plots, normalized into the 'oxides' object: some
+        # samples store oxides at root level, so a missing nested value falls back
+        # to the root field. Done in the projection rather than per sample here.
+        "oxides": {
+            oxide: {"$ifNull": [f"$oxides.{oxide}", f"${oxide}"]}
+            for oxide in SAMPLE_OXIDES
+        },
     }
     
-    # Use aggregation pipeline to enrich samples with volcano rock_type via lookup
     pipeline = [
         {"$match": query},
         {"$skip": offset},
@@ -96,64 +119,19 @@ async def get_samples(
     if limit is not None:
         pipeline.append({"$limit": limit})
     
-    # Add lookup to join with volcanoes collection to get rock_type
-    pipeline.extend([
-        {
-            "$lookup": {
-                "from": "volcanoes",
-                "let": {"volcano_number": "$matching_metadata.volcano.number"},
-                "pipeline": [
-                    {
-                        "$match": {
-                            "$expr": {
-                                "$eq": [{"$toString": "$volcano_number"}, "$$volcano_number"]
-                            }
-                        }
-                    },
-                    {"$project": {"petro": 1, "_id": 0}}
-                ],
-                "as": "volcano_info"
-            }
-        },
-        {
-            "$addFields": {
-                "matching_metadata.volcano.petro": {
-                    "$cond": {
-                        "if": {"$gt": [{"$size": "$volcano_info"}, 0]},
-                        "then": {"$arrayElemAt": ["$volcano_info.petro", 0]},
-                        "else": None
-                    }
-                }
-            }
-        },
-        {"$project": projection},  # Apply projection
-        {"$unset": "volcano_info"}  # Remove temporary field after projection
-    ])
+    pipeline.append({"$project": projection})
+    
+    # Get total count for the query (useful for pagination); it does not depend on
+    # the page, so it runs while the aggregation below is fetched
+    total_count_future = _count_executor.submit(db.samples.count_documents, query)
     
     # Execute aggregation pipeline
     samples = list(db.samples.aggregate(pipeline, batchSize=10000))
     
-    # Normalize oxide structure: ensure all oxides are in 'oxides' object
-    oxide_fields = ['SIO2', 'NA2O', 'K2O', 'MGO', 'FE2O3', 'FEOT', 'CAO', 'AL2O3', 'TIO2', 'P2O5', 'MNO']
-    for sample in samples:
-        # Convert ObjectId to string for JSON serialization
-        if "_id" in sample:
-            sample["_id"] = str(sample["_id"])
-        
-        # Normalize oxides: if oxides are at root level, move them to 'oxides' object
-        if not sample.get("oxides"):
-            sample["oxides"] = {}
-        
-        for oxide in oxide_fields:
-            # If oxide exists at root level, move it to oxides object
-            if oxide in sample and sample[oxide] is not None:
-                if oxide not in sample["oxides"] or sample["oxides"][oxide] is None:
-                    sample["oxides"][oxide] = sample[oxide]
-                # Remove from root level to avoid duplication
-                del sample[oxide]
-    
-    # Get total count for the query (useful for pagination)
-    total_count = db.samples.count_documents(query)
+    # Enrich samples with their volcano's petro (rock_type)
+    _attach_volcano_petro(db, samples)
+    
+    total_count = total_count_future.result()
     
     return {
         "count": len(samples),
@@ -165,6 +143,49 @@ async def get_samples(
     }
 
 
+@router.get("/clusters")
+async def get_sample_clusters(
+    db: Database = Depends(get_database),
+    zoom: int = Query(..., ge=0, le=22, description="Map zoom level; sets the clustering grid size"),
+    rock_type: Optional[str] = Query(None, description="Filter by rock type (comma-separated for multiple)"),
+    database: Optional[str] = Query(None, description="Filter by database (GEOROC, PetDB, GVP)"),
+    tectonic_setting: Optional[str] = Query(None, description="Filter by tectonic setting (comma-separated for multiple)"),
+    min_sio2: Optional[float] = Query(None, description="Minimum SiO2 content (%)"),
+    max_sio2: Optional[float] = Query(None, description="Maximum SiO2 content (%)"),
+    bbox: Optional[str] = Query(
+        None,
+        description="Bounding box as 'min_lon,min_lat,max_lon,max_lat' (e.g., '-10,35,20,60')",
+        pattern=r"^-?\d+(\.\d+)?,-?\d+(\.\d+)?,-?\d+(\.\d+)?,-?\d+(\.\d+)?$"
+    ),
+):
+    """
+    Get filtered samples aggregated into zoom-dependent grid clusters.
+    
+    At low zoom many samples fall on the same screen pixel, so instead of sending
+    every sample each grid cell returns one point per source database with its
+    sample count. Cells shrink by half per zoom level.
+    """
+    query = build_sample_match_query(
+        rock_type=rock_type,
+        database=database,
+        tectonic_setting=tectonic_setting,
+        min_sio2=min_sio2,
+        max_sio2=max_sio2,
+        bbox=bbox,
+    )
+    
+    pipeline = [{"$match": query}, *build_cluster_stages(zoom)]
+    clusters = list(db.samples.aggregate(pipeline, batchSize=10000))
+    
+    return {
+        "zoom": zoom,
+        "cell_size": cluster_cell_size(zoom),
+        "count": len(clusters),
+        "total": sum(cluster["count"] for cluster in clusters),
+        "data": clusters
+    }
+
+
 @router.get("/{id}")
 async def get_sample_by_id(
     id: str,
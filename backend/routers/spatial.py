@@ -1,11 +1,12 @@
 """
 Spatial router - API endpoints for spatial queries
 """
-from fastapi import APIRouter, Depends, Query, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response
 from pymongo.database import Database
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+from functools import lru_cache
 import json
+import os
 from pathlib import Path
 
 from backend.dependencies import get_database
@@ -16,6 +17,59 @@ router = APIRouter()
 TECTONIC_DATA_PATH = Path(__file__).parent.parent.parent / "data" / "tectonicplates"
 
 
+def _dump_json(content: Any) -> bytes:
+    """Serialize content the way FastAPI's JSONResponse renders it."""
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+@lru_cache(maxsize=8)
+def _load_json_bytes(file_path: Path, mtime: float) -> bytes:
+    """
+    Parse a static JSON data file once per on-disk version and keep it
+    as a compact, ready-to-send response body.
+
+    The modification time is part of the cache key so that replacing the
+    file on disk is picked up without restarting the server.
+    """
+    with open(file_path, 'r') as f:
+        return _dump_json(json.load(f))
+
+
+def _stat_file(file_path: Path) -> Optional[os.stat_result]:
+    """
+    Return the stat of a data file, or None when it does not exist.
+
+    One stat call answers both the existence check and the size and
+    modification time needed for caching.
+    """
+    try:
+        return file_path.stat()
+    except FileNotFoundError:
+        return None
+
+
+def _file_etag(*files: Tuple[Path, os.stat_result]) -> str:
+    """
+    Build a weak ETag from the size and modification time of data files,
+    given as (path, stat) pairs.
+
+    The fingerprint only changes when a file is replaced on disk, so a
+    client revalidating with it can be answered without rebuilding or
+    re-serializing the response.
+    """
+    fingerprint = "-".join(
+        f"{path.name}:{stat.st_size:x}:{stat.st_mtime_ns:x}"
+        for path, stat in files
+    )
+    return f'W/"{fingerprint}"'
+
+
 @router.get("/bounds")
 async def get_samples_in_bounds(
     db: Database = Depends(get_database),
@@ -64,8 +118,44 @@ async def get_samples_in_bounds(
     }
 
 
+@router.get("/nearby")
+async def get_samples_nearby(
+    db: Database = Depends(get_database),
+    lon: float = Query(..., ge=-180, le=180, description="Longitude of the search center"),
+    lat: float = Query(..., ge=-90, le=90, description="Latitude of the search center"),
+    radius: float = Query(..., gt=0, description="Search radius in meters"),
+    limit: int = Query(5000, le=10000)
+):
+    """
+    Get samples within a radius of a point, nearest first
+    Uses $nearSphere on the geometry 2dsphere index, so only the samples inside
+    the radius are visited instead of measuring the distance to every sample
+    """
+    query = {
+        "geometry": {
+            "$nearSphere": {
+                "$geometry": {"type": "Point", "coordinates": [lon, lat]},
+                "$maxDistance": radius
+            }
+        }
+    }
+    
+    samples = list(db.samples.find(query).limit(limit))
+    
+    for sample in samples:
+        if "_id" in sample:
+            sample["_id"] = str(sample["_id"])
+    
+    return {
+        "count": len(samples),
+        "center": {"lon": lon, "lat": lat},
+        "radius": radius,
+        "data": samples
+    }
+
+
 @router.get("/tectonic-plates")
-async def get_tectonic_plates():
+async def get_tectonic_plates(request: Request):
     """
     Get tectonic plate boundaries as GeoJSON FeatureCollection.
     
@@ -74,16 +164,20 @@ async def get_tectonic_plates():
     try:
         plates_file = TECTONIC_DATA_PATH / "PB2002_plates.json"
         
-        if not plates_file.exists():
+        plates_stat = _stat_file(plates_file)
+        if plates_stat is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Tectonic plates data file not found: {plates_file}"
             )
         
-        with open(plates_file, 'r') as f:
-            plates_data = json.load(f)
+        etag = _file_etag((plates_file, plates_stat))
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
         
-        return JSONResponse(content=plates_data)
+        plates_body = _load_json_bytes(plates_file, plates_stat.st_mtime)
+        
+        return Response(content=plates_body, media_type="application/json", headers={"ETag": etag})
     
     except json.JSONDecodeError as e:
         raise HTTPException(
@@ -167,8 +261,41 @@ def _parse_gmt_file(file_path: Path) -> List[Dict[str, Any]]:
     return features
 
 
+@lru_cache(maxsize=8)
+def _load_boundary_features(file_path: Path, mtime: float, boundary_type: str) -> List[Dict[str, Any]]:
+    """
+    Parse one boundary GMT file once per on-disk version, tagging each
+    feature with its boundary type.
+    """
+    features = _parse_gmt_file(file_path)
+    for feature in features:
+        feature["properties"]["boundary_type"] = boundary_type
+    return features
+
+
+@lru_cache(maxsize=8)
+def _boundary_collection_bytes(files: Tuple[Tuple[str, Path, float], ...]) -> Optional[bytes]:
+    """
+    Serialize the FeatureCollection for a set of (boundary type, file, mtime)
+    entries once, so repeated requests skip re-encoding thousands of
+    coordinates. Returns None when the files contain no features.
+    """
+    all_features = []
+    for btype, file_path, mtime in files:
+        all_features.extend(_load_boundary_features(file_path, mtime, btype))
+    
+    if not all_features:
+        return None
+    
+    return _dump_json({
+        "type": "FeatureCollection",
+        "features": all_features
+    })
+
+
 @router.get("/tectonic-boundaries")
 async def get_tectonic_boundaries(
+    request: Request,
     boundary_type: str = Query(
         None,
         description="Type of boundary: 'ridge', 'trench', 'transform', or 'all'",
@@ -184,39 +311,37 @@ async def get_tectonic_boundaries(
     Returns GeoJSON FeatureCollection of LineString features.
     """
     try:
-        all_features = []
-        
         if boundary_type is None or boundary_type == "all":
             types_to_load = ["ridge", "trench", "transform"]
         else:
             types_to_load = [boundary_type]
         
+        files_to_load = []
         for btype in types_to_load:
             file_path = TECTONIC_DATA_PATH / f"{btype}.gmt"
             
-            if not file_path.exists():
+            file_stat = _stat_file(file_path)
+            if file_stat is None:
                 continue
             
-            features = _parse_gmt_file(file_path)
-            
-            # Add boundary type to properties
-            for feature in features:
-                feature["properties"]["boundary_type"] = btype
-            
-            all_features.extend(features)
+            files_to_load.append((btype, file_path, file_stat))
+        
+        etag = _file_etag(*((path, stat) for _, path, stat in files_to_load)) if files_to_load else None
+        if etag and request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
         
-        if not all_features:
+        geojson_body = _boundary_collection_bytes(tuple(
+            (btype, file_path, file_stat.st_mtime)
+            for btype, file_path, file_stat in files_to_load
+        ))
+        
+        if geojson_body is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"No tectonic boundary data found for type: {boundary_type}"
             )
         
-        geojson = {
-            "type": "FeatureCollection",
-            "features": all_features
-        }
-        
-        return JSONResponse(content=geojson)
+        return Response(content=geojson_body, media_type="application/json", headers={"ETag": etag})
     
     except HTTPException:
         raise
@@ -2,19 +2,31 @@
 Volcanoes router - API endpoints for volcano data
 """
 from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
 from pymongo.database import Database
 from typing import Optional
 from cachetools import TTLCache
 import threading
 
 from backend.dependencies import get_database
+from backend.services.sample_filters import parse_csv_values
 
 router = APIRouter()
 
-# In-memory cache for expensive chemical-analysis queries (5 minute TTL, max 100 volcanoes)
+# In-memory cache for expensive chemical-analysis queries (5 minute TTL, max 100 volcanoes).
+# Stores the serialized JSON body so cache hits skip re-encoding thousands of samples.
 chemical_analysis_cache = TTLCache(maxsize=100, ttl=300)  # 5 minutes
 cache_lock = threading.Lock()
 
+# Oxides returned by the chemical-analysis endpoint, each mapped to one bit of a
+# per-sample presence mask so the diagram requirements are single integer tests
+CHEMICAL_OXIDES = ("SIO2", "NA2O", "K2O", "FEOT", "MGO", "TIO2", "AL2O3", "CAO", "P2O5", "MNO")
+OXIDE_BITS = {oxide: 1 << i for i, oxide in enumerate(CHEMICAL_OXIDES)}
+TAS_MASK = OXIDE_BITS["SIO2"] | OXIDE_BITS["NA2O"] | OXIDE_BITS["K2O"]
+AFM_MASK = OXIDE_BITS["FEOT"] | OXIDE_BITS["NA2O"] | OXIDE_BITS["K2O"] | OXIDE_BITS["MGO"]
+HARKER_MASK = sum(OXIDE_BITS.values()) & ~OXIDE_BITS["SIO2"]  # Any oxide plotted against SiO2
+
 
 @router.get("/summary")
 async def get_volcanoes_summary(
@@ -43,10 +55,10 @@ async def get_volcanoes_summary(
     if tectonic_setting:
         # Support comma-separated values for multiple tectonic settings
         # Filter using tectonic_setting.ui field
-        settings = [s.strip() for s in tectonic_setting.split(',')]
+        settings = parse_csv_values(tectonic_setting)
         if len(settings) == 1:
             query["tectonic_setting.ui"] = settings[0]
-        else:
+        elif settings:
             query["tectonic_setting.ui"] = {"$in": settings}
     
     if volcano_name:
@@ -54,7 +66,8 @@ async def get_volcanoes_summary(
         query["volcano_name"] = {"$regex": volcano_name, "$options": "i"}
     
     projection = {
-        "_id": 1,
+        # Stringify the ObjectId server-side for JSON serialization
+        "_id": {"$toString": "$_id"},
         "volcano_number": 1,
         "volcano_name": 1,
         "country": 1,
@@ -70,12 +83,7 @@ async def get_volcanoes_summary(
         cursor = cursor.limit(limit)
     if offset > 0:
         cursor = cursor.skip(offset)
-    cursor = cursor.batch_size(5000)
-    volcanoes = []
-    for v in cursor:
-        if "_id" in v:
-            v["_id"] = str(v["_id"])
-        volcanoes.append(v)
+    volcanoes = list(cursor.batch_size(5000))
 
     return {"count": len(volcanoes), "limit": limit, "offset": offset, "data": volcanoes}
 
@@ -118,7 +126,18 @@ async def get_volcanoes_geojson(
     if country:
         query["country"] = country
     
-    volcanoes = db.volcanoes.find(query)
+    # Only the geometry and the feature properties are read, so the rest of each
+    # volcano document is left on the server
+    projection = {
+        "_id": 0,
+        "geometry": 1,
+        "volcano_number": 1,
+        "volcano_name": 1,
+        "country": 1,
+        "elevation": 1,
+        "primary_volcano_type": 1,
+    }
+    volcanoes = db.volcanoes.find(query, projection)
     if limit is not None:
         volcanoes = volcanoes.limit(limit)
         
@@ -159,14 +178,47 @@ async def get_volcano_vei_distribution(
         raise HTTPException(status_code=400, detail="Invalid volcano number format")
     
     # Check if volcano exists
-    volcano = db.volcanoes.find_one({"volcano_number": volcano_num})
+    volcano = db.volcanoes.find_one({"volcano_number": volcano_num}, {"volcano_name": 1})
     if not volcano:
         raise HTTPException(status_code=404, detail="Volcano not found")
     
-    # Get all eruptions for this volcano
-    eruptions = list(db.eruptions.find({"volcano_number": volcano_num}))
+    # Count eruptions by VEI (including None/unknown) and find the first and last
+    # dated eruptions in one aggregation, instead of pulling every eruption document.
+    # The date range is ordered on the numeric date parts: ISO strings do not sort
+    # chronologically for BCE years ("-0100..." sorts before "-0500...")
+    dated = {"start_date.iso8601": {"$nin": [None, ""]}, "start_date.year": {"$ne": None}}
+    date_fields = {"_id": 0, "iso8601": "$start_date.iso8601", "year": "$start_date.year"}
+    pipeline = [
+        {"$match": {"volcano_number": volcano_num}},
+        {
+            "$facet": {
+                "vei": [
+                    {"$group": {"_id": "$vei", "count": {"$sum": 1}}},
+                    {"$sort": {"_id": 1}}
+                ],
+                "earliest": [
+                    {"$match": dated},
+                    {"$sort": {"start_date.year": 1, "start_date.month": 1, "start_date.day": 1}},
+                    {"$limit": 1},
+                    {"$project": date_fields}
+                ],
+                "latest": [
+                    {"$match": dated},
+                    {"$sort": {"start_date.year": -1, "start_date.month": -1, "start_date.day": -1}},
+                    {"$limit": 1},
+                    {"$project": date_fields}
+                ],
+            }
+        }
+    ]
+    
+    facets = next(db.eruptions.aggregate(pipeline), {})
+    vei_counts = {
+        str(row["_id"]) if row["_id"] is not None else "unknown": row["count"]
+        for row in facets.get("vei", [])
+    }
     
-    if not eruptions:
+    if not vei_counts:
         return {
             "volcano_number": volcano_num,
             "volcano_name": volcano.get("volcano_name", "Unknown"),
@@ -175,35 +227,23 @@ async def get_volcano_vei_distribution(
             "date_range": None
         }
     
-    # Count eruptions by VEI
-    vei_counts = {}
-    dates = []
-    
-    for eruption in eruptions:
-        vei = eruption.get("vei")
-        
-        # Count VEI (including None/unknown)
-        vei_key = str(vei) if vei is not None else "unknown"
-        vei_counts[vei_key] = vei_counts.get(vei_key, 0) + 1
-        
-        # Collect dates
-        if eruption.get("start_date") and eruption["start_date"].get("iso8601"):
-            dates.append(eruption["start_date"]["iso8601"])
-    
-    # Determine date range
+    # Determine date range. The numeric years are returned alongside the ISO
+    # strings so clients do not have to parse the year back out of them.
     date_range = None
-    if dates:
-        dates.sort()
+    if facets.get("earliest") and facets.get("latest"):
+        earliest, latest = facets["earliest"][0], facets["latest"][0]
         date_range = {
-            "start": dates[0],
-            "end": dates[-1]
+            "start": earliest["iso8601"],
+            "end": latest["iso8601"],
+            "start_year": earliest["year"],
+            "end_year": latest["year"]
         }
     
     return {
         "volcano_number": volcano_num,
         "volcano_name": volcano.get("volcano_name", "Unknown"),
         "vei_counts": vei_counts,
-        "total_eruptions": len(eruptions),
+        "total_eruptions": sum(vei_counts.values()),
         "date_range": date_range
     }
 
@@ -230,11 +270,12 @@ async def get_volcano_chemical_analysis(
     # Check cache first (thread-safe)
     cache_key = f"{volcano_num}:{limit}"
     with cache_lock:
-        if cache_key in chemical_analysis_cache:
-            return chemical_analysis_cache[cache_key]
+        cached_body = chemical_analysis_cache.get(cache_key)
+    if cached_body is not None:
+        return Response(content=cached_body, media_type="application/json")
     
     # Check if volcano exists
-    volcano = db.volcanoes.find_one({"volcano_number": volcano_num})
+    volcano = db.volcanoes.find_one({"volcano_number": volcano_num}, {"volcano_name": 1})
     if not volcano:
         raise HTTPException(status_code=404, detail="Volcano not found")
     
@@ -269,9 +310,7 @@ async def get_volcano_chemical_analysis(
             "rock_types": {}
         }
         # Cache empty result too
-        with cache_lock:
-            chemical_analysis_cache[cache_key] = result
-        return result
+        return _cache_chemical_analysis(cache_key, result)
     
     tas_data = []
     afm_data = []
@@ -287,17 +326,15 @@ async def get_volcano_chemical_analysis(
             # Try to get oxides from root level
             oxides = sample
         
-        # Extract oxide values
-        sio2 = oxides.get("SIO2")
-        na2o = oxides.get("NA2O")
-        k2o = oxides.get("K2O")
-        feot = oxides.get("FEOT")
-        mgo = oxides.get("MGO")
-        tio2 = oxides.get("TIO2")
-        al2o3 = oxides.get("AL2O3")
-        cao = oxides.get("CAO")
-        p2o5 = oxides.get("P2O5")
-        mno = oxides.get("MNO")
+        # Round each available oxide once and fold its presence into a bitmask
+        # (bit i is set when CHEMICAL_OXIDES[i] is present)
+        rounded = {}
+        present = 0
+        for bit, oxide in enumerate(CHEMICAL_OXIDES):
+            value = oxides.get(oxide)
+            if value is not None:
+                rounded[oxide] = round(value, 2)
+                present |= 1 << bit
         
         sample_code = str(sample.get("sample_code", ""))
         # Extract rock_type from petro field
@@ -312,148 +349,38 @@ async def get_volcano_chemical_analysis(
         if material == "WR":
             rock_types_wr[rock_type] = rock_types_wr.get(rock_type, 0) + 1
         
-        # Add ALL samples to all_samples array (for complete CSV export)
-        all_sample_entry = {
+        # Sample metadata and every available oxide, preserving MongoDB field names.
+        # TAS, AFM and Harker points carry the same fields, so one entry is shared.
+        entry = {
             "sample_code": sample_code,
             "sample_id": sample.get("sample_id", sample_code),
             "db": sample.get("db", "Unknown"),
             "petro": sample.get("petro"),
-            "material": sample.get("material", "Unknown"),
+            "material": material,
             "tecto": sample.get("tecto"),
             "geometry": sample.get("geometry"),
             "matching_metadata": sample.get("matching_metadata"),
             "references": sample.get("references"),
             "geographic_location": sample.get("geographic_location"),
+            **rounded
         }
-        # Add all available oxides (even if incomplete)
-        if sio2 is not None:
-            all_sample_entry["SIO2"] = round(sio2, 2)
-        if na2o is not None:
-            all_sample_entry["NA2O"] = round(na2o, 2)
-        if k2o is not None:
-            all_sample_entry["K2O"] = round(k2o, 2)
-        if feot is not None:
-            all_sample_entry["FEOT"] = round(feot, 2)
-        if mgo is not None:
-            all_sample_entry["MGO"] = round(mgo, 2)
-        if tio2 is not None:
-            all_sample_entry["TIO2"] = round(tio2, 2)
-        if al2o3 is not None:
-            all_sample_entry["AL2O3"] = round(al2o3, 2)
-        if cao is not None:
-            all_sample_entry["CAO"] = round(cao, 2)
-        if p2o5 is not None:
-            all_sample_entry["P2O5"] = round(p2o5, 2)
-        if mno is not None:
-            all_sample_entry["MNO"] = round(mno, 2)
-        all_samples.append(all_sample_entry)
         
-        # TAS data (preserve MongoDB field names and include all metadata)
-        if sio2 is not None and na2o is not None and k2o is not None:
-            tas_entry = {
-                "sample_code": sample_code,
-                "sample_id": sample.get("sample_id", sample_code),
-                "db": sample.get("db", "Unknown"),
-                "petro": sample.get("petro"),
-                "material": sample.get("material", "Unknown"),
-                "tecto": sample.get("tecto"),
-                "geometry": sample.get("geometry"),
-                "matching_metadata": sample.get("matching_metadata"),
-                "references": sample.get("references"),
-                "geographic_location": sample.get("geographic_location"),
-                "SIO2": round(sio2, 2),
-                "NA2O": round(na2o, 2),
-                "K2O": round(k2o, 2)
-            }
-            # Add all other oxides if available
-            if feot is not None:
-                tas_entry["FEOT"] = round(feot, 2)
-            if mgo is not None:
-                tas_entry["MGO"] = round(mgo, 2)
-            if tio2 is not None:
-                tas_entry["TIO2"] = round(tio2, 2)
-            if al2o3 is not None:
-                tas_entry["AL2O3"] = round(al2o3, 2)
-            if cao is not None:
-                tas_entry["CAO"] = round(cao, 2)
-            if p2o5 is not None:
-                tas_entry["P2O5"] = round(p2o5, 2)
-            if mno is not None:
-                tas_entry["MNO"] = round(mno, 2)
-            tas_data.append(tas_entry)
+        # Add ALL samples to all_samples array (for complete CSV export)
+        all_samples.append(entry)
         
-        # AFM data (preserve MongoDB field names and include all metadata)
-        if feot is not None and na2o is not None and k2o is not None and mgo is not None:
-            afm_entry = {
-                "sample_code": sample_code,
-                "sample_id": sample.get("sample_id", sample_code),
-                "db": sample.get("db", "Unknown"),
-                "petro": sample.get("petro"),
-                "material": sample.get("material", "Unknown"),
-                "tecto": sample.get("tecto"),
-                "geometry": sample.get("geometry"),
-                "matching_metadata": sample.get("matching_metadata"),
-                "references": sample.get("references"),
-                "geographic_location": sample.get("geographic_location"),
-                "FEOT": round(feot, 2),
-                "NA2O": round(na2o, 2),
-                "K2O": round(k2o, 2),
-                "MGO": round(mgo, 2)
-            }
-            # Add other oxides if available
-            if sio2 is not None:
-                afm_entry["SIO2"] = round(sio2, 2)
-            if tio2 is not None:
-                afm_entry["TIO2"] = round(tio2, 2)
-            if al2o3 is not None:
-                afm_entry["AL2O3"] = round(al2o3, 2)
-            if cao is not None:
-                afm_entry["CAO"] = round(cao, 2)
-            if p2o5 is not None:
-                afm_entry["P2O5"] = round(p2o5, 2)
-            if mno is not None:
-                afm_entry["MNO"] = round(mno, 2)
-            afm_data.append(afm_entry)
+        # TAS data requires SiO2, Na2O and K2O
+        if present & TAS_MASK == TAS_MASK:
+            tas_data.append(entry)
         
-        # Harker data - ONLY Whole Rock (WR) samples for accurate geochemical comparison
-        if material == "WR" and sio2 is not None and 35 <= sio2 <= 80:  # Valid SiO2 range
-            harker_point = {
-                "sample_code": sample_code,
-                "sample_id": sample.get("sample_id", sample_code),
-                "db": sample.get("db", "Unknown"),
-                "petro": sample.get("petro"),
-                "material": material,
-                "tecto": sample.get("tecto"),
-                "geometry": sample.get("geometry"),
-                "matching_metadata": sample.get("matching_metadata"),
-                "references": sample.get("references"),
-                "geographic_location": sample.get("geographic_location"),
-                "SIO2": round(sio2, 2)
-            }
-            
-            # Add available oxides (preserve MongoDB field names)
-            if tio2 is not None:
-                harker_point["TIO2"] = round(tio2, 2)
-            if al2o3 is not None:
-                harker_point["AL2O3"] = round(al2o3, 2)
-            if feot is not None:
-                harker_point["FEOT"] = round(feot, 2)
-            if mgo is not None:
-                harker_point["MGO"] = round(mgo, 2)
-            if cao is not None:
-                harker_point["CAO"] = round(cao, 2)
-            if na2o is not None:
-                harker_point["NA2O"] = round(na2o, 2)
-            if k2o is not None:
-                harker_point["K2O"] = round(k2o, 2)
-            if p2o5 is not None:
-                harker_point["P2O5"] = round(p2o5, 2)
-            if mno is not None:
-                harker_point["MNO"] = round(mno, 2)
-            
-            # Only add if at least one other oxide is present
-            if len(harker_point) > 9:  # More than sample_code, sample_id, db, SiO2, rock_type, material, tecto, geometry, matching_metadata
-                harker_data.append(harker_point)
+        # AFM data requires FeOT, Na2O, K2O and MgO
+        if present & AFM_MASK == AFM_MASK:
+            afm_data.append(entry)
+        
+        # Harker data - ONLY Whole Rock (WR) samples with a valid SiO2 range (35-80 wt%)
+        # and at least one other oxide to plot against it
+        sio2 = oxides.get("SIO2")
+        if material == "WR" and sio2 is not None and 35 <= sio2 <= 80 and present & HARKER_MASK:
+            harker_data.append(entry)
     
     result = {
         "volcano_number": volcano_num,
@@ -468,10 +395,17 @@ async def get_volcano_chemical_analysis(
     }
     
     # Cache the result for 5 minutes (thread-safe)
+    return _cache_chemical_analysis(cache_key, result)
+
+
+def _cache_chemical_analysis(cache_key: str, result: dict) -> JSONResponse:
+    """
+    Serialize a chemical-analysis result once and cache the JSON body.
+    """
+    response = JSONResponse(content=jsonable_encoder(result))
     with cache_lock:
-        chemical_analysis_cache[cache_key] = result
-    
-    return result
+        chemical_analysis_cache[cache_key] = response.body
+    return response
 
 
 @router.get("/{volcano_number}/rock-types")
@@ -527,64 +461,58 @@ async def get_volcano_sample_timeline(
         raise HTTPException(status_code=400, detail="Invalid volcano number format")
     
     # Verify volcano exists
-    volcano = db.volcanoes.find_one({"volcano_number": volcano_num})
+    volcano = db.volcanoes.find_one({"volcano_number": volcano_num}, {"volcano_name": 1})
     if not volcano:
         raise HTTPException(status_code=404, detail="Volcano not found")
     
-    # Try to aggregate by eruption year first (preferred but rarely available)
-    year_pipeline = [
-        {
-            "$match": {
-                "matching_metadata.volcano.number": volcano_num,
-                "eruption_date.year": {"$ne": None, "$exists": True, "$type": "number"}
-            }
-        },
-        {
-            "$group": {
-                "_id": "$eruption_date.year",
-                "sample_count": {"$sum": 1},
-                "rock_types": {"$addToSet": "$rock_type"}
-            }
-        },
-        {
-            "$project": {
-                "year": "$_id",
-                "sample_count": 1,
-                "rock_types": 1,
-                "_id": 0
-            }
-        },
-        {"$sort": {"year": 1}}
-    ]
-    
-    timeline_data = list(db.samples.aggregate(year_pipeline))
+    # matching_metadata.volcano.number is stored as string in samples
+    volcano_num_str = str(volcano_num)
     
-    # Get total sample count and rock type distribution (always available)
-    total_samples = db.samples.count_documents({
-        "matching_metadata.volcano.number": volcano_num
-    })
-    
-    # Get rock type distribution
-    rock_type_pipeline = [
-        {
-            "$match": {
-                "matching_metadata.volcano.number": volcano_num,
-                "rock_type": {"$ne": None, "$exists": True}
-            }
-        },
+    # One pass over the volcano's samples feeds the year timeline, the total
+    # count and the rock type ranking, instead of three separate queries
+    facet_pipeline = [
+        {"$match": {"matching_metadata.volcano.number": volcano_num_str}},
         {
-            "$group": {
-                "_id": "$rock_type",
-                "count": {"$sum": 1}
+            "$facet": {
+                # Aggregate by eruption year (preferred but rarely available)
+                "timeline": [
+                    {"$match": {"eruption_date.year": {"$ne": None, "$exists": True, "$type": "number"}}},
+                    {
+                        "$group": {
+                            "_id": "$eruption_date.year",
+                            "sample_count": {"$sum": 1},
+                            "rock_types": {"$addToSet": "$petro.rock_type"}
+                        }
+                    },
+                    {
+                        "$project": {
+                            "year": "$_id",
+                            "sample_count": 1,
+                            "rock_types": 1,
+                            "_id": 0
+                        }
+                    },
+                    {"$sort": {"year": 1}}
+                ],
+                # Total sample count (always available)
+                "total": [{"$count": "count"}],
+                # Rock type distribution, ranked by count
+                "rock_types": [
+                    {"$match": {"petro.rock_type": {"$exists": True, "$nin": [None, ""]}}},
+                    {"$sortByCount": "$petro.rock_type"}
+                ],
             }
-        },
-        {"$sort": {"count": -1}}
+        }
     ]
     
-    rock_type_dist = list(db.samples.aggregate(rock_type_pipeline))
+    facets = next(db.samples.aggregate(facet_pipeline), {})
+    timeline_data = facets.get("timeline", [])
+    total_samples = facets["total"][0]["count"] if facets.get("total") else 0
+    rock_type_dist = facets.get("rock_types", [])
     
-    # Calculate statistics
-    years = [item["year"] for item in timeline_data]
+    # Calculate statistics; timeline_data is sorted by year, so the range is its two ends
+    min_year = timeline_data[0]["year"] if timeline_data else None
+    max_year = timeline_data[-1]["year"] if timeline_data else None
     
     return {
         "volcano_number": volcano_num,
@@ -597,9 +525,9 @@ async def get_volcano_sample_timeline(
             for item in rock_type_dist
         ],
         "date_range": {
-            "min_year": min(years) if years else None,
-            "max_year": max(years) if years else None,
-            "span_years": max(years) - min(years) if years else 0
+            "min_year": min_year,
+            "max_year": max_year,
+            "span_years": max_year - min_year if timeline_data else 0
         },
         "has_timeline_data": len(timeline_data) > 0
     }
@@ -2,19 +2,28 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Dict, Optional, Sequence
 
 from fastapi import HTTPException
 
 
 VALID_CONFIDENCE_LEVELS = ("high", "medium", "low", "unknown")
-ALL_CONFIDENCE_LEVELS = set(VALID_CONFIDENCE_LEVELS)
+ALL_CONFIDENCE_LEVELS = frozenset(VALID_CONFIDENCE_LEVELS)
+
+
+@lru_cache(maxsize=1024)
+def _split_csv(raw: str) -> tuple[str, ...]:
+    if "," not in raw:
+        value = raw.strip()
+        return (value,) if value else ()
+    return tuple(value for value in (part.strip() for part in raw.split(",")) if value)
 
 
 def parse_csv_values(raw: Optional[str]) -> list[str]:
     if not raw:
         return []
-    return [value.strip() for value in raw.split(",") if value.strip()]
+    return list(_split_csv(raw))
 
 
 def build_bbox_filter(bbox: str) -> Dict[str, Any]:
@@ -89,7 +98,9 @@ def build_sample_match_query(
             query["tecto.volcano_ui"] = settings[0]
 
     if min_sio2 is not None or max_sio2 is not None:
-        sio2_filter: Dict[str, Any] = {"$exists": True, "$ne": None}
+        # Numeric range bounds never match null or missing values, so no separate
+        # existence check is needed
+        sio2_filter: Dict[str, Any] = {}
         if min_sio2 is not None:
             sio2_filter["$gte"] = min_sio2
         if max_sio2 is not None:
@@ -116,7 +127,9 @@ def parse_confidence_levels(raw: Optional[str]) -> Optional[list[str]]:
     if raw is None:
         return None
 
-    levels: list[str] = []
+    # Insertion-ordered dict: de-duplicates with a hash lookup instead of a list
+    # scan per value while keeping the order the levels were given in
+    levels: dict[str, None] = {}
     for value in parse_csv_values(raw):
         normalized = value.lower()
         if normalized not in ALL_CONFIDENCE_LEVELS:
@@ -127,10 +140,9 @@ def parse_confidence_levels(raw: Optional[str]) -> Optional[list[str]]:
                     f"(received: {value})"
                 ),
             )
-        if normalized not in levels:
-            levels.append(normalized)
+        levels[normalized] = None
 
-    return levels
+    return list(levels)
 
 
 def build_normalized_confidence_expression() -> Dict[str, Any]:
@@ -187,4 +199,43 @@ def build_confidence_filter_stages(levels: Optional[Sequence[str]]) -> list[Dict
     return [
         {"$addFields": {"normalized_confidence": build_normalized_confidence_expression()}},
         {"$match": {"normalized_confidence": {"$in": list(levels)}}},
-    ]
\ No newline at end of file
+    ]
+
+
+def cluster_cell_size(zoom: int) -> float:
+    """Width in degrees of the clustering grid cell at a map zoom level."""
+    # A 256 px web map tile spans 360 / 2**zoom degrees, so 2**6 cells per tile
+    # gives cells of roughly 4 px: points closer than that overlap on screen anyway
+    return 360.0 / (2 ** (zoom + 6))
+
+
+def build_cluster_stages(zoom: int) -> list[Dict[str, Any]]:
+    """
+    Aggregation stages collapsing matched samples into one point per grid cell
+    and source database, positioned at the mean of its samples.
+    """
+    cell = cluster_cell_size(zoom)
+    return [
+        {
+            "$project": {
+                "_id": 0,
+                "db": 1,
+                "lon": {"$arrayElemAt": ["$geometry.coordinates", 0]},
+                "lat": {"$arrayElemAt": ["$geometry.coordinates", 1]},
+            }
+        },
+        {"$match": {"lon": {"$type": "number"}, "lat": {"$type": "number"}}},
+        {
+            "$group": {
+                "_id": {
+                    "cx": {"$floor": {"$divide": ["$lon", cell]}},
+                    "cy": {"$floor": {"$divide": ["$lat", cell]}},
+                    "db": "$db",
+                },
+                "lon": {"$avg": "$lon"},
+                "lat": {"$avg": "$lat"},
+                "count": {"$sum": 1},
+            }
+        },
+        {"$project": {"_id": 0, "db": "$_id.db", "lon": 1, "lat": 1, "count": 1}},
+    ]
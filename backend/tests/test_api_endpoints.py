@@ -13,8 +13,11 @@ Run with: pytest backend/tests/test_api_endpoints.py -v
 """
 
 import pytest
+from unittest.mock import MagicMock
 from fastapi.testclient import TestClient
+from backend.dependencies import get_database
 from backend.main import app
+from backend.routers.samples import _attach_volcano_petro
 
 client = TestClient(app)
 
@@ -342,6 +345,76 @@ class TestPagination:
         assert data["offset"] == 5
 
 
+class TestSampleClustersEndpoint:
+    """Test the sample clusters endpoint against a mocked database."""
+    
+    @pytest.fixture
+    def mock_db(self):
+        """Serve two clusters from a mocked samples collection."""
+        db = MagicMock()
+        db.samples.aggregate.return_value = [
+            {"db": "GEOROC", "lon": 10.5, "lat": 45.2, "count": 12},
+            {"db": "PetDB", "lon": -120.1, "lat": 36.8, "count": 3},
+        ]
+        app.dependency_overrides[get_database] = lambda: db
+        yield db
+        app.dependency_overrides.pop(get_database, None)
+    
+    def test_clusters_route_is_not_a_sample_id(self, mock_db):
+        """Test /api/samples/clusters reaches the clusters endpoint, not /{id}."""
+        response = client.get("/api/samples/clusters?zoom=3")
+        assert response.status_code == 200
+        assert mock_db.samples.aggregate.called
+        assert not mock_db.samples.find_one.called
+    
+    def test_clusters_response_fields(self, mock_db):
+        """Test cluster count and total sample count in the response."""
+        response = client.get("/api/samples/clusters?zoom=3&database=GEOROC")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["zoom"] == 3
+        assert data["count"] == 2
+        assert data["total"] == 15
+        assert [cluster["count"] for cluster in data["data"]] == [12, 3]
+        
+        pipeline = mock_db.samples.aggregate.call_args[0][0]
+        assert pipeline[0] == {"$match": {"db": "GEOROC"}}
+    
+    @pytest.mark.parametrize("query", ["", "zoom=-1", "zoom=23", "zoom=abc"])
+    def test_clusters_zoom_validation(self, mock_db, query):
+        """Test that zoom is required and limited to 0-22."""
+        response = client.get(f"/api/samples/clusters?{query}")
+        assert response.status_code == 422
+        assert not mock_db.samples.aggregate.called
+
+
+class TestAttachVolcanoPetro:
+    """Test joining volcano petrology onto samples."""
+    
+    def test_attaches_petro_by_volcano_number(self):
+        """Test that string sample volcano numbers match integer volcano numbers."""
+        db = MagicMock()
+        db.volcanoes.find.return_value = [{"volcano_number": 273030, "petro": {"rock_type": "Andesite"}}]
+        samples = [{"matching_metadata": {"volcano": {"number": "273030"}}}]
+        
+        _attach_volcano_petro(db, samples)
+        
+        assert samples[0]["matching_metadata"]["volcano"]["petro"] == {"rock_type": "Andesite"}
+    
+    @pytest.mark.parametrize("sample", [
+        {"matching_metadata": None},
+        {"matching_metadata": {"volcano": None}},
+    ])
+    def test_null_matching_metadata(self, sample):
+        """Test that null matching_metadata or volcano entries get a null petro."""
+        db = MagicMock()
+        
+        _attach_volcano_petro(db, [sample])
+        
+        assert sample["matching_metadata"]["volcano"] == {"petro": None}
+        assert not db.volcanoes.find.called
+
+
 class TestCacheHeaders:
     """Test HTTP caching headers on responses."""
     
@@ -0,0 +1,93 @@
+"""Unit tests for the shared sample filter helpers."""
+
+import pytest
+from fastapi import HTTPException
+
+from backend.services.sample_filters import (
+    ALL_CONFIDENCE_LEVELS,
+    build_cluster_stages,
+    build_confidence_filter_stages,
+    build_sample_match_query,
+    cluster_cell_size,
+    parse_confidence_levels,
+    parse_csv_values,
+)
+
+
+class TestParseCsvValues:
+    """Test comma-separated query parameter parsing."""
+
+    def test_empty_values(self):
+        """Test that missing or blank input yields no values."""
+        assert parse_csv_values(None) == []
+        assert parse_csv_values("") == []
+        assert parse_csv_values("   ") == []
+
+    def test_single_value(self):
+        """Test that a value without commas is stripped and returned as-is."""
+        assert parse_csv_values(" Basalt ") == ["Basalt"]
+
+    def test_multiple_values(self):
+        """Test splitting, stripping and dropping empty entries."""
+        assert parse_csv_values("Basalt, Andesite,,Dacite ,") == ["Basalt", "Andesite", "Dacite"]
+
+    def test_returns_independent_lists(self):
+        """Test that callers can mutate the result without affecting later calls."""
+        first = parse_csv_values("Basalt,Andesite")
+        first.append("Rhyolite")
+        assert parse_csv_values("Basalt,Andesite") == ["Basalt", "Andesite"]
+
+
+class TestBuildSampleMatchQuery:
+    """Test MongoDB match query construction."""
+
+    def test_single_and_multiple_values(self):
+        """Test equality for one value and $in for several."""
+        query = build_sample_match_query(rock_type="Basalt", material="WR,GL")
+        assert query["petro.rock_type"] == "Basalt"
+        assert query["material"] == {"$in": ["WR", "GL"]}
+
+    def test_volcano_number_is_string(self):
+        """Test that volcano numbers are matched as strings."""
+        query = build_sample_match_query(volcano_number=211060)
+        assert query["matching_metadata.volcano.number"] == "211060"
+
+
+class TestConfidenceLevels:
+    """Test confidence level parsing and filter stages."""
+
+    def test_parse_normalizes_and_dedupes(self):
+        """Test lower-casing and de-duplication while preserving order."""
+        assert parse_confidence_levels("High,low,high") == ["high", "low"]
+
+    def test_parse_rejects_invalid(self):
+        """Test that unknown levels raise a 400 error."""
+        with pytest.raises(HTTPException) as exc_info:
+            parse_confidence_levels("high,bogus")
+        assert exc_info.value.status_code == 400
+
+    def test_all_levels_skip_filtering(self):
+        """Test that selecting every level adds no pipeline stages."""
+        assert build_confidence_filter_stages(list(ALL_CONFIDENCE_LEVELS)) == []
+        assert build_confidence_filter_stages(None) == []
+
+    def test_empty_levels_match_nothing(self):
+        """Test that an empty selection matches no documents."""
+        assert build_confidence_filter_stages([]) == [{"$match": {"_id": None}}]
+
+
+class TestClusterStages:
+    """Test zoom-dependent sample clustering stages."""
+
+    def test_cell_size_halves_per_zoom_level(self):
+        """Test that each zoom level halves the grid cell width."""
+        assert cluster_cell_size(0) == 360.0 / 64
+        assert cluster_cell_size(5) == cluster_cell_size(4) / 2
+
+    def test_groups_by_cell_and_database(self):
+        """Test that clusters are keyed by grid cell and source database."""
+        stages = build_cluster_stages(3)
+        group = next(stage["$group"] for stage in stages if "$group" in stage)
+        assert set(group["_id"]) == {"cx", "cy", "db"}
+        assert group["_id"]["cx"] == {"$floor": {"$divide": ["$lon", cluster_cell_size(3)]}}
+        assert group["count"] == {"$sum": 1}
@@ -235,6 +235,35 @@ class TestCachingTectonicEndpoints:
         assert "cache-control" in response.headers
         assert "vary" in response.headers
 
+    def test_tectonic_plates_not_modified(self):
+        """Test revalidating with the plates ETag returns 304 without a body."""
+        response = client.get("/api/spatial/tectonic-plates")
+        etag = response.headers["etag"]
+        
+        revalidated = client.get("/api/spatial/tectonic-plates", headers={"If-None-Match": etag})
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        assert revalidated.headers["etag"] == etag
+    
+    def test_tectonic_boundaries_etag_per_type(self):
+        """Test each boundary selection has its own ETag and revalidates to 304."""
+        ridge = client.get("/api/spatial/tectonic-boundaries?boundary_type=ridge")
+        trench = client.get("/api/spatial/tectonic-boundaries?boundary_type=trench")
+        assert ridge.headers["etag"] != trench.headers["etag"]
+        
+        revalidated = client.get(
+            "/api/spatial/tectonic-boundaries?boundary_type=ridge",
+            headers={"If-None-Match": ridge.headers["etag"]},
+        )
+        assert revalidated.status_code == 304
+        
+        stale = client.get(
+            "/api/spatial/tectonic-boundaries?boundary_type=ridge",
+            headers={"If-None-Match": trench.headers["etag"]},
+        )
+        assert stale.status_code == 200
+        assert len(stale.json()["features"]) == 187
+
 
 class TestTectonicDataIntegration:
     """Test tectonic data integration with other endpoints."""
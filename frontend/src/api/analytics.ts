@@ -16,6 +16,9 @@ const joinFilterValue = (value?: string | string[]) => {
   return value;
 };
 
+// Diagram reference data is static, so concurrent and repeated callers share one request
+let afmBoundaryPromise: Promise<AFMBoundaryResponse> | null = null;
+
 /**
  * Fetch TAS diagram polygon definitions
  */
@@ -27,9 +30,15 @@ export const fetchTASPolygons = async (): Promise<TASPolygonsResponse> => {
 /**
  * Fetch AFM diagram boundary (tholeiitic vs calc-alkaline)
  */
-export const fetchAFMBoundary = async (): Promise<AFMBoundaryResponse> => {
-  const response = await apiClient.get<AFMBoundaryResponse>('/analytics/afm-boundary');
-  return response.data;
+export const fetchAFMBoundary = (): Promise<AFMBoundaryResponse> => {
+  afmBoundaryPromise ??= apiClient
+    .get<AFMBoundaryResponse>('/analytics/afm-boundary')
+    .then(response => response.data)
+    .catch(err => {
+      afmBoundaryPromise = null;
+      throw err;
+    });
+  return afmBoundaryPromise;
 };
 
 /**
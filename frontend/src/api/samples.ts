@@ -3,6 +3,7 @@ import type {
   Sample,
   FeatureCollection,
   PaginatedResponse,
+  SampleClusterResponse,
   SampleFilters,
   SpatialBoundsParams,
   SpatialNearbyParams,
@@ -64,6 +65,19 @@ export const fetchSamplesNearby = async (
   return response.data;
 };
 
+/**
+ * Fetch filtered samples aggregated into grid clusters sized for a map zoom level
+ */
+export const fetchSampleClusters = async (
+  zoom: number,
+  filters?: SampleFilters
+): Promise<SampleClusterResponse> => {
+  const response = await apiClient.get<SampleClusterResponse>('/samples/clusters', {
+    params: { ...filters, zoom: Math.max(0, Math.min(22, Math.floor(zoom))) },
+  });
+  return response.data;
+};
+
 /**
  * Export samples as CSV
  */
@@ -132,3 +132,99 @@ export const fetchVolcanoSampleTimeline = async (
   );
   return response.data;
 };
+
+/**
+ * Volcano numbers and names used by the volcano pickers, with the names
+ * sorted for display
+ */
+export interface VolcanoDirectoryEntry {
+  volcano_number: number;
+  volcano_name: string;
+}
+
+export interface VolcanoDirectory {
+  volcanoes: VolcanoDirectoryEntry[];
+  names: string[];
+  /** Name -> volcano; the first volcano wins on duplicate names, as with find() */
+  byName: Map<string, VolcanoDirectoryEntry>;
+}
+
+// The volcano list is the same for every page that offers a volcano picker,
+// so it is fetched and sorted once and shared between them
+let volcanoDirectoryPromise: Promise<VolcanoDirectory> | null = null;
+
+// The directory is also kept for the browser tab session, so page reloads
+// skip the summary request. Only the picker fields are stored, as parallel
+// number and name columns rather than one object per volcano.
+const VOLCANO_DIRECTORY_STORAGE_KEY = 'dashvolcano:volcano-directory';
+
+interface StoredVolcanoDirectory {
+  numbers: number[];
+  names: string[];
+}
+
+const readStoredVolcanoDirectory = (): VolcanoDirectoryEntry[] | null => {
+  try {
+    const raw = sessionStorage.getItem(VOLCANO_DIRECTORY_STORAGE_KEY);
+    if (!raw) return null;
+    const { numbers, names } = JSON.parse(raw) as StoredVolcanoDirectory;
+    if (!Array.isArray(numbers) || !Array.isArray(names) || numbers.length !== names.length) {
+      return null;
+    }
+    return numbers.map((volcano_number, i) => ({ volcano_number, volcano_name: names[i] }));
+  } catch {
+    // Storage unavailable or entry corrupted: fall back to the API
+    return null;
+  }
+};
+
+const storeVolcanoDirectory = (volcanoes: VolcanoDirectoryEntry[]): void => {
+  const stored: StoredVolcanoDirectory = {
+    numbers: volcanoes.map(v => v.volcano_number),
+    names: volcanoes.map(v => v.volcano_name),
+  };
+  try {
+    sessionStorage.setItem(VOLCANO_DIRECTORY_STORAGE_KEY, JSON.stringify(stored));
+  } catch {
+    // Storage full or disabled; the in-memory promise still serves this page
+  }
+};
+
+const buildVolcanoDirectory = (volcanoes: VolcanoDirectoryEntry[]): VolcanoDirectory => {
+  const names = volcanoes
+    .map(v => v.volcano_name)
+    .filter(Boolean)
+    .sort((a, b) => a.localeCompare(b));
+  // Group the list by name once so pages resolve a picked name with a hash
+  // lookup instead of scanning every volcano per selection
+  const byName = new Map<string, VolcanoDirectoryEntry>();
+  for (const volcano of volcanoes) {
+    if (!byName.has(volcano.volcano_name)) {
+      byName.set(volcano.volcano_name, volcano);
+    }
+  }
+  return { volcanoes, names, byName };
+};
+
+/**
+ * Load the volcano list for name pickers, reusing the first successful request
+ */
+export const loadVolcanoDirectory = (): Promise<VolcanoDirectory> => {
+  if (volcanoDirectoryPromise) return volcanoDirectoryPromise;
+
+  const stored = readStoredVolcanoDirectory();
+  volcanoDirectoryPromise = stored
+    ? Promise.resolve(buildVolcanoDirectory(stored))
+    : fetchVolcanoes()
+      .then(response => {
+        const volcanoes = response.data || [];
+        storeVolcanoDirectory(volcanoes);
+        return buildVolcanoDirectory(volcanoes);
+      })
+      .catch(err => {
+        // Allow a later mount to retry after a failed request
+        volcanoDirectoryPromise = null;
+        throw err;
+      });
+  return volcanoDirectoryPromise;
+};
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo } from 'react';
 import Plot from 'react-plotly.js';
 import type { Sample } from '../../types';
 import { fetchAFMBoundary } from '../../api/analytics';
@@ -12,6 +12,89 @@ interface AFMPlotProps {
   loading?: boolean;
 }
 
+// Marker symbol per sample material, shared by every trace and render
+const MATERIAL_SHAPES: Record<string, string> = {
+  'WR': 'circle',
+  'GL': 'square',
+  'MIN': 'diamond',
+  'INC': 'triangle-up',
+  'Unknown': 'x',
+};
+
+// Height of the unit equilateral triangle, computed once for every projected point
+const TRIANGLE_HEIGHT = Math.sqrt(3) / 2;
+
+// Convert ternary coordinates (A, F, M) to Cartesian (x, y)
+const ternaryToCartesian = (a: number, f: number, m: number) => {
+  const total = a + f + m;
+  if (total === 0) return { x: 0, y: 0 };
+  
+  // Convert to Cartesian coordinates, normalizing to fractions with a single division
+  // Bottom-left vertex (A - Alkali) at (0, 0)
+  // Bottom-right vertex (M - MgO) at (1, 0)
+  // Top vertex (F - FeOT) at (0.5, √3/2)
+  const scale = 1 / total;
+  const x = (m + f * 0.5) * scale;
+  const y = f * TRIANGLE_HEIGHT * scale;
+  
+  return { x, y };
+};
+
+// Triangle outline and 20% grid lines never change, so they are built once at load
+const AFM_FRAME_TRACES: Plotly.Data[] = [];
+
+// Draw triangle edges
+const triangleX = [0, 1, 0.5, 0];
+const triangleY = [0, 0, TRIANGLE_HEIGHT, 0];
+
+AFM_FRAME_TRACES.push({
+  type: 'scatter',
+  mode: 'lines',
+  x: triangleX,
+  y: triangleY,
+  line: { color: 'black' },
+  name: 'Triangle',
+  hoverinfo: 'skip',
+  showlegend: false,
+});
+
+// Add grid lines and percentage labels
+// Grid lines parallel to each edge at 20%, 40%, 60%, 80%. All twelve segments share
+// one style, so they go into a single trace separated by null gaps instead of one
+// trace per segment.
+const gridPercentages = [20, 40, 60, 80];
+const gridX: (number | null)[] = [];
+const gridY: (number | null)[] = [];
+
+const addGridSegment = (from: { x: number; y: number }, to: { x: number; y: number }) => {
+  gridX.push(from.x, to.x, null);
+  gridY.push(from.y, to.y, null);
+};
+
+for (const pct of gridPercentages) {
+  // Lines parallel to bottom edge (constant FeOT)
+  // From (Alkali=100-pct, FeOT=pct, MgO=0) to (Alkali=0, FeOT=pct, MgO=100-pct)
+  addGridSegment(ternaryToCartesian(100 - pct, pct, 0), ternaryToCartesian(0, pct, 100 - pct));
+  
+  // Lines parallel to left edge (constant MgO)
+  // From (Alkali=100-pct, FeOT=0, MgO=pct) to (Alkali=0, FeOT=100-pct, MgO=pct)
+  addGridSegment(ternaryToCartesian(100 - pct, 0, pct), ternaryToCartesian(0, 100 - pct, pct));
+  
+  // Lines parallel to right edge (constant Alkali)
+  // From (Alkali=pct, FeOT=100-pct, MgO=0) to (Alkali=pct, FeOT=0, MgO=100-pct)
+  addGridSegment(ternaryToCartesian(pct, 100 - pct, 0), ternaryToCartesian(pct, 0, 100 - pct));
+}
+
+AFM_FRAME_TRACES.push({
+  type: 'scatter',
+  mode: 'lines',
+  x: gridX,
+  y: gridY,
+  line: { color: 'lightgray', width: 1, dash: 'dot' },
+  hoverinfo: 'skip',
+  showlegend: false,
+});
+
 /**
  * AFM (Alkali-FeO-MgO) Plot Component - Ternary Diagram
  * 
@@ -29,20 +112,19 @@ export const AFMPlot: React.FC<AFMPlotProps> = React.memo(({
   loading = false,
 }) => {
   const [error, setError] = useState<string | null>(null);
-  const [boundaryData, setBoundaryData] = useState<Array<{a: number; f: number; m: number}>>([]);
+  const [boundaryCoords, setBoundaryCoords] = useState<Array<{x: number; y: number}>>([]);
 
   // Fetch AFM boundary from backend
   useEffect(() => {
     const loadBoundary = async () => {
       try {
         const data = await fetchAFMBoundary();
-        // Convert backend format {A, F, M} to {a, f, m}
-        const boundary = data.boundary.coordinates.map(point => ({
-          a: point.F, // Backend has F for alkali (Na2O+K2O)
-          f: point.A, // Backend has A for FeOT
-          m: point.M, // Backend has M for MgO
-        }));
-        setBoundaryData(boundary);
+        // Convert backend format {A, F, M} to plot coordinates once, when the boundary arrives.
+        // Backend has F for alkali (Na2O+K2O) and A for FeOT
+        const boundary = data.boundary.coordinates.map(point =>
+          ternaryToCartesian(point.F, point.A, point.M)
+        );
+        setBoundaryCoords(boundary);
       } catch (err) {
         console.error('Failed to load AFM boundary:', err);
         setError('Failed to load AFM boundary');
@@ -51,90 +133,127 @@ export const AFMPlot: React.FC<AFMPlotProps> = React.memo(({
     loadBoundary();
   }, []);
 
-  // Convert ternary coordinates (A, F, M) to Cartesian (x, y)
-  const ternaryToCartesian = (a: number, f: number, m: number) => {
-    const total = a + f + m;
-    if (total === 0) return { x: 0, y: 0 };
-    
-    // Normalize to fractions
-    const aNorm = a / total;
-    const fNorm = f / total;
-    const mNorm = m / total;
-    
-    // Convert to Cartesian coordinates
-    // Bottom-left vertex (A - Alkali) at (0, 0)
-    // Bottom-right vertex (M - MgO) at (1, 0)
-    // Top vertex (F - FeOT) at (0.5, √3/2)
-    const x = aNorm * 0 + mNorm * 1 + fNorm * 0.5;
-    const y = aNorm * 0 + mNorm * 0 + fNorm * (Math.sqrt(3) / 2);
-    
-    return { x, y };
-  };
 
-  // Process sample data for AFM plotting
-  const prepareSampleData = () => {
-    return samples
-      .filter(s => 
-        s.oxides?.['FEOT'] !== undefined && 
-        s.oxides?.['MGO'] !== undefined && 
-        s.oxides?.['NA2O'] !== undefined && 
-        s.oxides?.['K2O'] !== undefined
-      )
-      .map(s => {
-        const feot = s.oxides!['FEOT']!;
-        const mgo = s.oxides!['MGO']!;
-        const alkali = s.oxides!['NA2O']! + s.oxides!['K2O']!;
-        const confidence = normalizeConfidence(s.matching_metadata?.confidence_level, s.matching_metadata);
-        const confidenceLabel = getConfidenceLabel(confidence);
-                
-        // Convert to Cartesian coordinates for plotting
-        const { x, y } = ternaryToCartesian(alkali, feot, mgo);
-        
-        return {
-          x,
-          y,
-          feot,
-          mgo,
-          alkali,
-          material: s.material || 'Unknown',
-          rock_type: s.petro?.rock_type || 'Unknown',
-          sample_code: s.sample_code || s.sample_id,
-          sample_id: s.sample_id,
-          volcano_name: getVolcanoName(s.matching_metadata),
-          confidence: confidence,
-          confidenceLabel: confidenceLabel,
-        };
+  // Process sample data for AFM plotting in one pass: each sample's oxides are read
+  // once, checked for completeness and converted, instead of a filter followed by a map
+  const sampleData = useMemo(() => {
+    const points = [];
+    for (const s of samples) {
+      const oxides = s.oxides;
+      const feot = oxides?.['FEOT'];
+      const mgo = oxides?.['MGO'];
+      const na2o = oxides?.['NA2O'];
+      const k2o = oxides?.['K2O'];
+      if (feot === undefined || mgo === undefined || na2o === undefined || k2o === undefined) continue;
+
+      const alkali = na2o + k2o;
+      const confidence = normalizeConfidence(s.matching_metadata?.confidence_level, s.matching_metadata);
+
+      // Convert to Cartesian coordinates for plotting
+      const { x, y } = ternaryToCartesian(alkali, feot, mgo);
+
+      points.push({
+        x,
+        y,
+        feot,
+        mgo,
+        alkali,
+        material: s.material || 'Unknown',
+        rock_type: s.petro?.rock_type || 'Unknown',
+        sample_code: s.sample_code || s.sample_id,
+        sample_id: s.sample_id,
+        volcano_name: getVolcanoName(s.matching_metadata),
+        confidence: confidence,
+        confidenceLabel: getConfidenceLabel(confidence),
       });
-  };
+    }
+    return points;
+  }, [samples]);
 
-  const sampleData = prepareSampleData();
+  // Group samples by rock_type (for colors) and material (for shapes). Each group keeps
+  // its rock type, material and color so the trace loop never has to split the key back apart.
+  const samplesByRockTypeAndMaterial = useMemo(() => {
+    const groups = new Map<string, { rockType: string; material: string; color: string; points: typeof sampleData }>();
+    for (const sample of sampleData) {
+      const key = `${sample.rock_type}|${sample.material}`;
+      let group = groups.get(key);
+      if (!group) {
+        group = {
+          rockType: sample.rock_type,
+          material: sample.material,
+          color: getRockTypeColor(sample.rock_type) || '#999999',
+          points: [],
+        };
+        groups.set(key, group);
+      }
+      group.points.push(sample);
+    }
+    return Array.from(groups.values());
+  }, [sampleData]);
 
-  // Material shapes mapping
-  const materialShapes: Record<string, string> = {
-    'WR': 'circle',
-    'GL': 'square',
-    'MIN': 'diamond',
-    'INC': 'triangle-up',
-    'Unknown': 'x',
-  };
+  // Sample marker traces, rebuilt only when the groups change rather than on every
+  // render. Each group's coordinate and hover columns are filled in one pass instead
+  // of one map() per column.
+  const sampleTraces = useMemo(() => {
+    const traces: Plotly.Data[] = [];
+    // Track which materials have been added to legend
+    const materialLegendShown = new Set<string>();
 
-  // Get unique rock types and assign consistent colors using shared color utility
-  const uniqueRockTypes = Array.from(new Set(sampleData.map(s => s.rock_type)));
-  const rockTypeColors: Record<string, string> = {};
-  
-  for (const rockType of uniqueRockTypes) {
-    rockTypeColors[rockType] = getRockTypeColor(rockType);
-  }
+    // Add sample points grouped by rock_type (colors) and material (shapes)
+    for (const { rockType, material, color, points } of samplesByRockTypeAndMaterial) {
+      const shape = MATERIAL_SHAPES[material] || MATERIAL_SHAPES['Unknown'];
+      const showLegend = !materialLegendShown.has(material);
+      
+      if (showLegend) {
+        materialLegendShown.add(material);
+      }
 
-  // Group samples by rock_type (for colors) and material (for shapes)
-  const samplesByRockTypeAndMaterial = sampleData.reduce((acc, sample) => {
-    const key = `${sample.rock_type}|${sample.material}`;
-    if (!acc[key]) {
-      acc[key] = [];
+      const x: number[] = [];
+      const y: number[] = [];
+      const customdata: (string | number)[][] = [];
+      for (const s of points) {
+        x.push(s.x);
+        y.push(s.y);
+        customdata.push([
+          s.sample_code,
+          s.feot,
+          s.mgo,
+          s.alkali,
+          s.volcano_name ? s.volcano_name : '',
+          s.confidenceLabel,
+        ]);
+      }
+      
+      traces.push({
+        type: 'scattergl',  // WebGL: a volcano can contribute thousands of sample markers
+        mode: 'markers',
+        x,
+        y,
+        name: material,
+        legendgroup: material,
+        showlegend: showLegend,
+        marker: {
+          size: 8,
+          opacity: 0.7,
+          symbol: shape,
+          color: color,
+        },
+        // Plotly formats the hover label from these fields only when a point is hovered
+        customdata,
+        hovertemplate:
+          `%{customdata[0]}<br>` +
+          `Rock Type: ${rockType}<br>` +
+          `Material: ${material}<br>` +
+          `FeOT: %{customdata[1]:.2f}%<br>` +
+          `MgO: %{customdata[2]:.2f}%<br>` +
+          `Alkali: %{customdata[3]:.2f}%<br>` +
+          `Volcano: %{customdata[4]}<br>` +
+          `Confidence: %{customdata[5]}<extra></extra>`,
+      });
     }
-    acc[key].push(sample);
-    return acc;
-  }, {} as Record<string, typeof sampleData>);
+
+    return traces;
+  }, [samplesByRockTypeAndMaterial]);
 
   if (error) {
     return (
@@ -161,78 +280,10 @@ export const AFMPlot: React.FC<AFMPlotProps> = React.memo(({
   }
 
   // Prepare Plotly data
-  const plotlyData: Plotly.Data[] = [];
-
-  // Draw triangle edges
-  const triangleX = [0, 1, 0.5, 0];
-  const triangleY = [0, 0, Math.sqrt(3) / 2, 0];
-  
-  plotlyData.push({
-    type: 'scatter',
-    mode: 'lines',
-    x: triangleX,
-    y: triangleY,
-    line: { color: 'black' },
-    name: 'Triangle',
-    hoverinfo: 'skip',
-    showlegend: false,
-  });
-
-  // Add grid lines and percentage labels
-  // Grid lines parallel to each edge at 20%, 40%, 60%, 80%
-  const gridPercentages = [20, 40, 60, 80];
-  
-  for (const pct of gridPercentages) {
-    // Lines parallel to bottom edge (constant FeOT)
-    // From (Alkali=100-pct, FeOT=pct, MgO=0) to (Alkali=0, FeOT=pct, MgO=100-pct)
-    const p1 = ternaryToCartesian(100 - pct, pct, 0);
-    const p2 = ternaryToCartesian(0, pct, 100 - pct);
-    plotlyData.push({
-      type: 'scatter',
-      mode: 'lines',
-      x: [p1.x, p2.x],
-      y: [p1.y, p2.y],
-      line: { color: 'lightgray', width: 1, dash: 'dot' },
-      hoverinfo: 'skip',
-      showlegend: false,
-    });
-    
-    // Lines parallel to left edge (constant MgO)
-    // From (Alkali=100-pct, FeOT=0, MgO=pct) to (Alkali=0, FeOT=100-pct, MgO=pct)
-    const p3 = ternaryToCartesian(100 - pct, 0, pct);
-    const p4 = ternaryToCartesian(0, 100 - pct, pct);
-    plotlyData.push({
-      type: 'scatter',
-      mode: 'lines',
-      x: [p3.x, p4.x],
-      y: [p3.y, p4.y],
-      line: { color: 'lightgray', width: 1, dash: 'dot' },
-      hoverinfo: 'skip',
-      showlegend: false,
-    });
-    
-    // Lines parallel to right edge (constant Alkali)
-    // From (Alkali=pct, FeOT=100-pct, MgO=0) to (Alkali=pct, FeOT=0, MgO=100-pct)
-    const p5 = ternaryToCartesian(pct, 100 - pct, 0);
-    const p6 = ternaryToCartesian(pct, 0, 100 - pct);
-    plotlyData.push({
-      type: 'scatter',
-      mode: 'lines',
-      x: [p5.x, p6.x],
-      y: [p5.y, p6.y],
-      line: { color: 'lightgray', width: 1, dash: 'dot' },
-      hoverinfo: 'skip',
-      showlegend: false,
-    });
-  }
+  const plotlyData: Plotly.Data[] = [...AFM_FRAME_TRACES];
 
   // Add tholeiitic/calc-alkaline boundary (Irvine & Baragar, 1971)
-  // Boundary data loaded from backend API
-  const boundaryCoords = boundaryData.length > 0
-    ? boundaryData.map(p => ternaryToCartesian(p.a, p.f, p.m))
-    : [];
-  
-  // Only add boundary line if data is loaded
+  // Boundary data loaded from backend API; only add boundary line if data is loaded
   if (boundaryCoords.length > 0) {
     plotlyData.push({
       type: 'scatter',
@@ -246,47 +297,7 @@ export const AFMPlot: React.FC<AFMPlotProps> = React.memo(({
     });
   }
 
-  // Track which materials have been added to legend
-  const materialLegendShown = new Set<string>();
-
-  // Add sample points grouped by rock_type (colors) and material (shapes)
-  for (const [key, samples] of Object.entries(samplesByRockTypeAndMaterial)) {
-    const [rockType, material] = key.split('|');
-    const shape = materialShapes[material] || materialShapes['Unknown'];
-    const color = rockTypeColors[rockType] || '#999999';
-    const showLegend = !materialLegendShown.has(material);
-    
-    if (showLegend) {
-      materialLegendShown.add(material);
-    }
-    
-    plotlyData.push({
-      type: 'scatter',
-      mode: 'markers',
-      x: samples.map(s => s.x),
-      y: samples.map(s => s.y),
-      name: material,
-      legendgroup: material,
-      showlegend: showLegend,
-      marker: {
-        size: 8,
-        opacity: 0.7,
-        symbol: shape,
-        color: color,
-      },
-      text: samples.map(s => 
-        `${s.sample_code}<br>`+
-        `Rock Type: ${s.rock_type}<br>` +
-        `Material: ${s.material}<br>` +
-        `FeOT: ${s.feot.toFixed(2)}%<br>` +
-        `MgO: ${s.mgo.toFixed(2)}%<br>` +
-        `Alkali: ${s.alkali.toFixed(2)}%<br>`+
-        `Volcano: ${s.volcano_name ? s.volcano_name : ''}<br>`+
-        `Confidence: ${s.confidenceLabel}`
-      ),
-      hoverinfo: 'text',
-    });
-  }
+  plotlyData.push(...sampleTraces);
 
   return (
     <div className="w-full h-full">
@@ -336,7 +347,7 @@ export const AFMPlot: React.FC<AFMPlotProps> = React.memo(({
             },
             {
               x: 0.5,
-              y: Math.sqrt(3) / 2 + 0.08,
+              y: TRIANGLE_HEIGHT + 0.08,
               text: '<b>FeOT (wt%)</b>',
               showarrow: false,
               xanchor: 'center',
@@ -45,9 +45,18 @@ const EruptionFrequencyChart: React.FC<EruptionFrequencyChartProps> = ({
   // Sort periods chronologically
   const sortedPeriods = Array.from(grouped.keys()).sort((a, b) => a - b);
 
-  // Prepare data for plotting
-  const xLabels = sortedPeriods.map((p) => (period === 'decade' ? formatDecade(p) : formatCentury(p)));
-  const yCounts = sortedPeriods.map((p) => grouped.get(p) || 0);
+  // Prepare data for plotting; the bar label is built once per period and reused by
+  // the hover template instead of concatenating a second hover string per bar
+  const formatPeriod = period === 'decade' ? formatDecade : formatCentury;
+  const xLabels: string[] = [];
+  const yCounts: number[] = [];
+  const barText: string[] = [];
+  for (const p of sortedPeriods) {
+    const count = grouped.get(p) || 0;
+    xLabels.push(formatPeriod(p));
+    yCounts.push(count);
+    barText.push(`${count} eruption${count === 1 ? '' : 's'}`);
+  }
 
   // Find most active period
   const maxCount = Math.max(...yCounts);
@@ -61,9 +70,8 @@ const EruptionFrequencyChart: React.FC<EruptionFrequencyChartProps> = ({
       color: barColors,
       line: { width: 1, color: '#1f2937' },
     },
-    text: yCounts.map((count) => `${count} eruption${count === 1 ? '' : 's'}`),
-    hoverinfo: 'text',
-    hovertext: yCounts.map((count, i) => `<b>${xLabels[i]}</b><br>${count} eruption${count === 1 ? '' : 's'}`),
+    text: barText,
+    hovertemplate: '<b>%{x}</b><br>%{text}<extra></extra>',
   };
 
   const layout: Partial<Plotly.Layout> = {
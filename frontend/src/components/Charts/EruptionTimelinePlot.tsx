@@ -8,6 +8,20 @@ interface EruptionTimelinePlotProps {
   volcanoName: string;
 }
 
+// VEI color mapping (yellow → orange → red), -1 marks unknown VEI
+const VEI_COLORS: Record<number, string> = {
+  '-1': '#94a3b8',
+  '0': '#fef3c7',
+  '1': '#fde68a',
+  '2': '#fcd34d',
+  '3': '#fbbf24',
+  '4': '#f59e0b',
+  '5': '#f97316',
+  '6': '#ef4444',
+  '7': '#dc2626',
+  '8': '#991b1b',
+};
+
 /**
  * Timeline scatter plot showing eruption dates vs VEI
  * X-axis: Year (handles BCE dates)
@@ -26,24 +40,29 @@ const EruptionTimelinePlot: React.FC<EruptionTimelinePlotProps> = ({
     );
   }
 
-  // Extract data from eruptions
-  const plotData = eruptions
-    .map((eruption) => {
-      const year = dateInfoToYear(eruption.start_date);
-      if (year === null) return null;
+  // Build the per-VEI trace columns straight from the eruption date fields in one
+  // pass, without an intermediate record per eruption that is filtered and regrouped
+  const veiGroups = new Map<number, { x: number[]; customdata: string[][] }>();
+  for (const eruption of eruptions) {
+    const year = dateInfoToYear(eruption.start_date);
+    if (year === null) continue;
 
-      return {
-        year,
-        vei: eruption.vei ?? -1,
-        startDate: formatDateInfo(eruption.start_date, true),
-        endDate: eruption.end_date ? formatDateInfo(eruption.end_date, true) : null,
-        category: eruption.eruption_category || 'Unknown',
-        areaOfActivity: eruption.area_of_activity || 'Unknown',
-      };
-    })
-    .filter((d): d is NonNullable<typeof d> => d !== null);
+    const vei = eruption.vei ?? -1;
+    let group = veiGroups.get(vei);
+    if (!group) {
+      group = { x: [], customdata: [] };
+      veiGroups.set(vei, group);
+    }
+    group.x.push(year);
+    group.customdata.push([
+      formatDateInfo(eruption.start_date, true),
+      eruption.eruption_category || 'Unknown',
+      eruption.area_of_activity || 'Unknown',
+      eruption.end_date ? `<br>End: ${formatDateInfo(eruption.end_date, true)}` : '',
+    ]);
+  }
 
-  if (plotData.length === 0) {
+  if (veiGroups.size === 0) {
     return (
       <div className="bg-white">
         <p className="text-gray-500 text-center py-8">No eruptions with known dates</p>
@@ -51,57 +70,31 @@ const EruptionTimelinePlot: React.FC<EruptionTimelinePlotProps> = ({
     );
   }
 
-  // VEI color mapping
-  const veiColors: Record<number, string> = {
-    '-1': '#94a3b8',
-    '0': '#fef3c7',
-    '1': '#fde68a',
-    '2': '#fcd34d',
-    '3': '#fbbf24',
-    '4': '#f59e0b',
-    '5': '#f97316',
-    '6': '#ef4444',
-    '7': '#dc2626',
-    '8': '#991b1b',
-  };
-
-  // Group by VEI
-  const veiGroups: Record<number, typeof plotData> = {};
-  for (const d of plotData) {
-    const vei = d.vei;
-    if (!veiGroups[vei]) {
-      veiGroups[vei] = [];
-    }
-    veiGroups[vei].push(d);
-  }
-
-  // Create traces
-  const traces = Object.entries(veiGroups)
-    .sort(([a], [b]) => Number(a) - Number(b))
-    .map(([veiStr, data]) => {
-      const vei = Number(veiStr);
+  // Create traces. Every point in a trace shares its VEI, so the hover label is a
+  // per-trace template filled from customdata instead of a string built per eruption.
+  const traces = Array.from(veiGroups.keys())
+    .sort((a, b) => a - b)
+    .map((vei) => {
+      const { x, customdata } = veiGroups.get(vei)!;
       const veiLabel = vei === -1 ? 'Unknown' : `VEI ${vei}`;
 
       return {
-        x: data.map((d) => d.year),
-        y: data.map((d) => (d.vei === -1 ? -0.5 : d.vei)),
+        x,
+        y: new Array(x.length).fill(vei === -1 ? -0.5 : vei),
         mode: 'markers',
         type: 'scatter',
         name: veiLabel,
         marker: {
           size: 8,
-          color: veiColors[vei] || '#94a3b8',
+          color: VEI_COLORS[vei] || '#94a3b8',
           line: { width: 1, color: '#1f2937' },
         },
-        text: data.map(
-          (d) =>
-            `<b>${d.startDate}</b><br>` +
-            `VEI: ${d.vei === -1 ? 'Unknown' : d.vei}<br>` +
-            `Category: ${d.category}<br>` +
-            `Area: ${d.areaOfActivity}` +
-            (d.endDate ? `<br>End: ${d.endDate}` : '')
-        ),
-        hoverinfo: 'text',
+        customdata,
+        hovertemplate:
+          `<b>%{customdata[0]}</b><br>` +
+          `VEI: ${vei === -1 ? 'Unknown' : vei}<br>` +
+          `Category: %{customdata[1]}<br>` +
+          `Area: %{customdata[2]}%{customdata[3]}<extra></extra>`,
       } as Plotly.Data;
     });
 
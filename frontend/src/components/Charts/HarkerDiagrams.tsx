@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo } from 'react';
 import Plot from 'react-plotly.js';
 import { normalizeConfidence, getConfidenceLabel } from '../../utils/confidence';
 import type { MatchingMetadata, Petro } from '../../types';
@@ -31,6 +31,15 @@ interface HarkerDiagramsProps {
   volcanoes: VolcanoHarkerData[];
 }
 
+/** Points of one volcano that carry a given oxide, ready to become a trace */
+interface HarkerSeries {
+  volcano: VolcanoHarkerData;
+  x: Float32Array;  // Oxide wt% only needs two decimals, so single precision halves the buffers
+  y: Float32Array;
+  text: string[];
+  customdata: string[][];
+}
+
 /**
  * Harker Diagram Configuration
  * Defines the 8 major oxide variation diagrams vs SiO2
@@ -86,6 +95,12 @@ const HARKER_DIAGRAMS = [
   },
 ];
 
+// Axis labels with the HTML markup stripped, used in hover text and titles. Looked up
+// per diagram instead of running the tag-stripping regex for every trace on every render.
+const HARKER_PLAIN_LABELS = new Map(
+  HARKER_DIAGRAMS.map(({ oxide, yaxis }) => [oxide, yaxis.replace(/<[^>]*>/g, '')])
+);
+
 /**
  * HarkerDiagrams Component
  * 
@@ -117,6 +132,53 @@ export const HarkerDiagrams: React.FC<HarkerDiagramsProps> = React.memo(({ volca
     };
   }, []);
 
+  // Split every volcano's points into per-oxide series in a single pass, so each
+  // sample's hover metadata is computed once instead of once per diagram
+  const seriesByOxide = useMemo(() => {
+    const series = new Map<keyof HarkerDataPoint, HarkerSeries[]>();
+    for (const { oxide } of HARKER_DIAGRAMS) series.set(oxide, []);
+
+    for (const volcano of volcanoes) {
+      const buckets = HARKER_DIAGRAMS.map(() => ({
+        x: [] as number[], y: [] as number[], text: [] as string[], customdata: [] as string[][],
+      }));
+
+      for (const d of volcano.harkerData) {
+        let customdata: string[] | null = null;
+
+        for (let i = 0; i < HARKER_DIAGRAMS.length; i++) {
+          const value = d[HARKER_DIAGRAMS[i].oxide];
+          if (value === null || value === undefined) continue;
+
+          customdata ??= [
+            d.petro?.rock_type || 'Unknown',
+            d.material,
+            d.confidenceLabel || getConfidenceLabel(normalizeConfidence(d.matching_metadata?.confidence_level, d.matching_metadata)),
+            d.volcano_name || volcano.volcanoName
+          ];
+          const bucket = buckets[i];
+          bucket.x.push(d['SIO2']);
+          bucket.y.push(value as number);
+          bucket.text.push(d.sample_code);
+          bucket.customdata.push(customdata);
+        }
+      }
+
+      buckets.forEach(({ x, y, text, customdata }, i) => {
+        if (x.length === 0) return;
+        series.get(HARKER_DIAGRAMS[i].oxide)!.push({
+          volcano,
+          x: Float32Array.from(x),
+          y: Float32Array.from(y),
+          text,
+          customdata,
+        });
+      });
+    }
+
+    return series;
+  }, [volcanoes]);
+
   // Calculate total data points for performance info
   const totalDataPoints = volcanoes.reduce((sum, v) => sum + v.harkerData.length, 0);
   const isLargeDataset = totalDataPoints > 10000;
@@ -169,46 +231,34 @@ export const HarkerDiagrams: React.FC<HarkerDiagramsProps> = React.memo(({ volca
       {diagramsReady && (
         <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-4">
           {HARKER_DIAGRAMS.map(({ oxide, yaxis, range, description }) => {
-          // Create traces (one per volcano) with sampled data
-          const traces = volcanoes.map((volcano) => {
-            // Filter data points that have this oxide
-            const validData = volcano.harkerData.filter(
-              (d) => d[oxide] !== null && 
-                     d[oxide] !== undefined
-            );
-
-            if (validData.length === 0) return null;
-
+          const plainLabel = HARKER_PLAIN_LABELS.get(oxide)!;
+          // Create traces (one per volcano that has this oxide)
+          const traces = (seriesByOxide.get(oxide) ?? []).map(({ volcano, x, y, text, customdata }) => {
             return {
               type: 'scattergl' as const,  // WebGL for GPU acceleration - handles 100k+ points
               mode: 'markers' as const,
               name: volcano.volcanoName,
-              x: validData.map((d) => d['SIO2']),
-              y: validData.map((d) => d[oxide] as number),
+              x,
+              y,
               marker: {
                 color: volcano.color,
                 size: 3,                     // Smaller markers = faster rendering
                 opacity: 0.7,
                 line: { width: 0 }           // No borders = much faster
               },
-              text: validData.map((d) => d.sample_code),
-              customdata: validData.map((d) => [
-                d.petro?.rock_type || 'Unknown', 
-                d.material,
-                d.confidenceLabel || getConfidenceLabel(normalizeConfidence(d.matching_metadata?.confidence_level, d.matching_metadata)),
-                d.volcano_name || volcano.volcanoName
-              ]),
+              text,
+              customdata,
               hovertemplate:
                 `<b>%{customdata[3]}</b><br>` +
                 `Sample: %{text}<br>` +
                 `SiO₂: %{x:.2f} wt%<br>` +
-                `${yaxis.replace(/<[^>]*>/g, '')}: %{y:.2f} wt%<br>` +
+                `${plainLabel}: %{y:.2f} wt%<br>` +
                 `Rock Type: %{customdata[0]}<br>` +
                 `Material: %{customdata[1]}<br>` +
                 `Confidence: %{customdata[2]}<br>` +
                 `<extra></extra>`
             };
-          }).filter(trace => trace !== null);
+          });
 
           // Skip if no data for any volcano
           if (traces.length === 0) {
@@ -227,7 +277,7 @@ export const HarkerDiagrams: React.FC<HarkerDiagramsProps> = React.memo(({ volca
                 data={traces}
                 layout={{
                   title: { 
-                    text: `${yaxis.replace(/<[^>]*>/g, '')} vs SiO₂`,
+                    text: `${plainLabel} vs SiO₂`,
                     font: { size: 12 }
                   },
                   xaxis: { 
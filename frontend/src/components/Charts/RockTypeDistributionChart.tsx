@@ -48,64 +48,71 @@ export const RockTypeDistributionChart: React.FC<RockTypeDistributionChartProps>
     </div>
   );
 
-  // Collect all unique rock types across all volcanoes
-  const allRockTypes = new Set<string>();
-  volcanoes.forEach(v => {
-    Object.keys(v.rockTypes).forEach(rt => allRockTypes.add(rt));
-  });
+  // Overall frequency of each rock type (sum across all volcanoes); the map's keys are
+  // also the set of rock types seen across all volcanoes
+  const rockTypeFrequency = new Map<string, number>();
 
-  // Calculate total samples and percentages for each volcano
+  // Calculate total samples, percentages and rock type diversity for each volcano from
+  // one read of its counts, so the insights below reuse them instead of recounting
   const volcanoStats = volcanoes.map(v => {
-    const total = Object.values(v.rockTypes).reduce((sum, count) => sum + count, 0);
-    const percentages = Object.fromEntries(
-      Object.entries(v.rockTypes).map(([rockType, count]) => [
-        rockType,
-        { count, percentage: (count / total) * 100 }
-      ])
-    );
-    return { ...v, total, percentages };
-  });
-
-  // Sort rock types by overall frequency (sum across all volcanoes)
-  const rockTypeFrequency = new Map<string, number>();
-  volcanoes.forEach(v => {
-    Object.entries(v.rockTypes).forEach(([rockType, count]) => {
+    const entries = Object.entries(v.rockTypes);
+    let total = 0;
+    for (const [, count] of entries) {
+      total += count;
+    }
+    const percentages: Record<string, { count: number; percentage: number }> = {};
+    for (const [rockType, count] of entries) {
+      percentages[rockType] = { count, percentage: (count / total) * 100 };
       rockTypeFrequency.set(rockType, (rockTypeFrequency.get(rockType) || 0) + count);
-    });
-  });
-  
-  const sortedRockTypes = Array.from(allRockTypes).sort((a, b) => {
-    return (rockTypeFrequency.get(b) || 0) - (rockTypeFrequency.get(a) || 0);
+    }
+    return { ...v, total, percentages, diversity: entries.length };
   });
 
-  // Create traces (one per volcano)
-  const traces = volcanoStats.map(volcano => ({
-    type: 'bar' as const,
-    name: volcano.volcanoName,
-    y: sortedRockTypes,
-    x: sortedRockTypes.map(rt => volcano.percentages[rt]?.percentage || 0),
-    orientation: 'h' as const,
-    marker: {
-      color: volcano.color,
-      opacity: 0.8
-    },
-    text: sortedRockTypes.map(rt => {
-      const stats = volcano.percentages[rt];
-      return stats ? `${stats.percentage.toFixed(1)}% (n=${stats.count})` : '';
-    }),
-    textposition: 'none' as const,
-    hovertemplate:
-      `<b>${volcano.volcanoName}</b><br>` +
-      'Rock Type: %{y}<br>' +
-      'Percentage: %{x:.1f}%<br>' +
-      'Count: %{text}<br>' +
-      '<extra></extra>',
-    customdata: sortedRockTypes.map(rt => volcano.percentages[rt]?.count || 0),
-    hovertext: sortedRockTypes.map(rt => {
+  // Sort rock types by overall frequency, sorting the [rockType, frequency] entries so
+  // each comparison reads both counts directly instead of doing two map lookups
+  const sortedRockTypes = Array.from(rockTypeFrequency.entries())
+    .sort((left, right) => right[1] - left[1])
+    .map(([rockType]) => rockType);
+
+  const mostDiverse = getMostDiverse(volcanoStats);
+
+  // Create traces (one per volcano). Each rock type's stats are looked up once and
+  // every per-bar array (value, label, count, hover text) is filled from that lookup.
+  const traces = volcanoStats.map(volcano => {
+    const x: number[] = [];
+    const text: string[] = [];
+    const customdata: number[] = [];
+    const hovertext: string[] = [];
+    for (const rt of sortedRockTypes) {
       const stats = volcano.percentages[rt];
-      return stats ? `${stats.count} samples` : '0 samples';
-    })
-  }));
+      x.push(stats?.percentage || 0);
+      text.push(stats ? `${stats.percentage.toFixed(1)}% (n=${stats.count})` : '');
+      customdata.push(stats?.count || 0);
+      hovertext.push(stats ? `${stats.count} samples` : '0 samples');
+    }
+
+    return {
+      type: 'bar' as const,
+      name: volcano.volcanoName,
+      y: sortedRockTypes,
+      x,
+      orientation: 'h' as const,
+      marker: {
+        color: volcano.color,
+        opacity: 0.8
+      },
+      text,
+      textposition: 'none' as const,
+      hovertemplate:
+        `<b>${volcano.volcanoName}</b><br>` +
+        'Rock Type: %{y}<br>' +
+        'Percentage: %{x:.1f}%<br>' +
+        'Count: %{text}<br>' +
+        '<extra></extra>',
+      customdata,
+      hovertext,
+    };
+  });
 
   return (
     <div className="bg-white rounded-lg shadow-sm border border-gray-200 p-4">
@@ -370,8 +377,8 @@ export const RockTypeDistributionChart: React.FC<RockTypeDistributionChartProps>
             {/* Most Diverse */}
             <div className="bg-white rounded-lg p-4 shadow">
               <p className="text-sm text-gray-600 mb-1">Most Diverse</p>
-              <p className="text-lg font-bold" style={{ color: getMostDiverseColor(volcanoStats) }}>
-                {getMostDiverseVolcano(volcanoStats)}
+              <p className="text-lg font-bold" style={{ color: mostDiverse.color }}>
+                {mostDiverse.label}
               </p>
               <p className="text-xs text-gray-500 mt-1">Unique rock types</p>
             </div>
@@ -432,38 +439,20 @@ function getRockTypeSimilarity(volcanoStats: Array<{ volcanoName: string; total:
   return totalWeight === 0 ? 0 : Math.round(weightedSimilarity / totalWeight);
 }
 
-function getMostDiverseVolcano(volcanoStats: Array<{ volcanoName: string; rockTypes: Record<string, number>; color: string }>): string {
-  if (volcanoStats.length === 0) return 'None';
-
-  let maxDiversity = 0;
-  let mostDiverse = volcanoStats[0].volcanoName;
-
-  for (const volcano of volcanoStats) {
-    const diversity = Object.keys(volcano.rockTypes).length;
-    if (diversity > maxDiversity) {
-      maxDiversity = diversity;
-      mostDiverse = volcano.volcanoName;
-    }
-  }
-
-  return `${mostDiverse} (${maxDiversity} types)`;
-}
-
-function getMostDiverseColor(volcanoStats: Array<{ volcanoName: string; rockTypes: Record<string, number>; color: string }>): string {
-  if (volcanoStats.length === 0) return '#6B7280';
+function getMostDiverse(volcanoStats: Array<{ volcanoName: string; color: string; diversity: number }>): { label: string; color: string } {
+  if (volcanoStats.length === 0) return { label: 'None', color: '#6B7280' };
 
+  let mostDiverse = volcanoStats[0];
   let maxDiversity = 0;
-  let color = volcanoStats[0].color;
 
   for (const volcano of volcanoStats) {
-    const diversity = Object.keys(volcano.rockTypes).length;
-    if (diversity > maxDiversity) {
-      maxDiversity = diversity;
-      color = volcano.color;
+    if (volcano.diversity > maxDiversity) {
+      maxDiversity = volcano.diversity;
+      mostDiverse = volcano;
     }
   }
 
-  return color;
+  return { label: `${mostDiverse.volcanoName} (${maxDiversity} types)`, color: mostDiverse.color };
 }
 
 function getCommonDominantRockType(volcanoStats: Array<{ volcanoName: string; rockTypes: Record<string, number>; total: number; percentages: Record<string, { count: number; percentage: number }> }>): string {
@@ -8,7 +8,8 @@ interface RockTypeRadarChartProps {
 }
 
 interface PreparedSeries extends RockTypeRadarSeries {
-  percentages: Record<string, number>;
+  /** Percentage per category, aligned by index with the prepared categories */
+  percentages: number[];
 }
 
 const hexToRgba = (hex: string, alpha: number) => {
@@ -41,9 +42,7 @@ const prepareRockTypes = (
   const preparedSeries = series.map(entry => {
     const total = Math.max(entry.sampleCount, 1);
 
-    const percentages = Object.fromEntries(
-      sortedCategories.map(category => [category, ((entry.rockTypes[category] || 0) / total) * 100])
-    );
+    const percentages = sortedCategories.map(category => ((entry.rockTypes[category] || 0) / total) * 100);
 
     return {
       ...entry,
@@ -84,7 +83,7 @@ export const RockTypeRadarChart: React.FC<RockTypeRadarChartProps> = React.memo(
     mode: 'lines+markers' as const,
     name: entry.label,
     theta,
-    r: [...chartData.categories.map(category => entry.percentages[category] || 0), entry.percentages[chartData.categories[0]] || 0],
+    r: [...entry.percentages, entry.percentages[0]],
     line: {
       color: entry.color,
       width: 3,
@@ -178,7 +177,7 @@ export const RockTypeRadarChart: React.FC<RockTypeRadarChartProps> = React.memo(
                   const count = entry.rockTypes[category] || 0;
                   return (
                     <td key={entry.label} className="text-right py-2 px-3 text-gray-700">
-                      <span className="font-semibold">{(entry.percentages[category] || 0).toFixed(1)}%</span>
+                      <span className="font-semibold">{entry.percentages[index].toFixed(1)}%</span>
                       <span className="text-gray-500 text-xs ml-1">({count})</span>
                     </td>
                   );
@@ -1,4 +1,4 @@
-import React, { useEffect, useState } from 'react';
+import React, { useEffect, useMemo, useState } from 'react';
 import Plot from 'react-plotly.js';
 import type { Sample } from '../../types';
 import { getRockTypeColor, getVEIColor } from '../../utils/colors';
@@ -32,6 +32,37 @@ interface TASData {
   };
 }
 
+// Marker symbol per sample material, shared by every trace and render
+const MATERIAL_SHAPES: Record<string, string> = {
+  'WR': 'circle',
+  'GL': 'square',
+  'MIN': 'diamond',
+  'INC': 'triangle-up',
+  'Unknown': 'x',
+};
+
+// TAS polygon definitions are static, so every TASPlot on the page shares one request
+let tasDataPromise: Promise<TASData> | null = null;
+
+const loadTASData = (): Promise<TASData> => {
+  tasDataPromise ??= fetch('/api/analytics/tas-polygons', {
+    cache: 'no-store',
+    headers: {
+      'Cache-Control': 'no-cache',
+    },
+  })
+    .then(response => {
+      if (!response.ok) throw new Error('Failed to fetch TAS data');
+      return response.json() as Promise<TASData>;
+    })
+    .catch(err => {
+      // Allow a later mount to retry after a failed request
+      tasDataPromise = null;
+      throw err;
+    });
+  return tasDataPromise;
+};
+
 /**
  * TAS (Total Alkali-Silica) Plot Component
  * 
@@ -53,14 +84,7 @@ export const TASPlot: React.FC<TASPlotProps> = React.memo(({
   useEffect(() => {
     const fetchTASData = async () => {
       try {
-        const response = await fetch('/api/analytics/tas-polygons', {
-          cache: 'no-store',
-          headers: {
-            'Cache-Control': 'no-cache',
-          },
-        });
-        if (!response.ok) throw new Error('Failed to fetch TAS data');
-        const data = await response.json();
+        const data = await loadTASData();
         setTasData(data);
       } catch (err) {
         setError(err instanceof Error ? err.message : 'Unknown error');
@@ -71,7 +95,7 @@ export const TASPlot: React.FC<TASPlotProps> = React.memo(({
   }, []);
 
   // Process sample data for plotting
-  const prepareSampleData = () => {
+  const sampleData = useMemo(() => {
     return samples
       .filter(s => s.oxides?.['SIO2'] && s.oxides?.['NA2O'] && s.oxides?.['K2O'])
       .map(s => {
@@ -92,117 +116,64 @@ export const TASPlot: React.FC<TASPlotProps> = React.memo(({
           confidenceLabel: confidenceLabel,
         };
       });
-  };
-
-  const sampleData = prepareSampleData();
-
-  // Material shapes mapping
-  const materialShapes: Record<string, string> = {
-    'WR': 'circle',
-    'GL': 'square',
-    'MIN': 'diamond',
-    'INC': 'triangle-up',
-    'Unknown': 'x',
-  };
-
-  if (error) {
-    return (
-      <div className="flex items-center justify-center h-full">
-        <div className="text-red-600">Error loading TAS diagram: {error}</div>
-      </div>
-    );
-  }
-
-  if (loading || !tasData) {
-    return (
-      <div className="flex items-center justify-center h-full">
-        <div className="text-gray-500">Loading TAS diagram...</div>
-      </div>
-    );
-  }
-
-  if (sampleData.length === 0) {
-    return (
-      <div className="flex items-center justify-center h-full">
-        <div className="text-gray-500">No samples with oxide data to plot</div>
-      </div>
-    );
-  }
-
-  // Prepare Plotly data
-  const plotlyData: Plotly.Data[] = [];
-
-  // Add classification polygons
-  for (const polygon of tasData.polygons) {
-    const x = polygon.coordinates.map(coord => coord[0]);
-    const y = polygon.coordinates.map(coord => coord[1]);
-    
-    plotlyData.push({
-      type: 'scatter',
-      mode: 'lines',
-      x,
-      y,
-      fill: 'toself',
-      fillcolor: `rgba(200, 200, 200, 0.1)`,
-      line: { color: 'rgba(150, 150, 150, 0.5)', width: 1 },
-      hoverinfo: 'text',
-      text: polygon.name,
-      name: polygon.name,
-      showlegend: false,
-    });
-  }
-
-  // Add alkali/subalkalic line
-  const alkaliX = tasData.alkali_line.coordinates.map(coord => coord[0]);
-  const alkaliY = tasData.alkali_line.coordinates.map(coord => coord[1]);
-  plotlyData.push({
-    type: 'scatter',
-    mode: 'lines',
-    x: alkaliX,
-    y: alkaliY,
-    line: { color: 'black', width: 2, dash: 'dash' },
-    name: 'Alkali/Subalkalic',
-    showlegend: true,
-    hoverinfo: 'name',
-  });
-
-  // Grouping strategy: Group by rock_type|material or vei|material
-  if (colorBy === 'rock_type') {
-    // ROCK TYPE MODE: Group by rock_type|material
-    // Legend shows materials (WR, GL, MIN, INC), colors show rock types
-    const uniqueRockTypes = Array.from(new Set(sampleData.map(s => s.rock_type)));
-    const rockTypeColors: Record<string, string> = {};
-    
-    for (const rockType of uniqueRockTypes) {
-      rockTypeColors[rockType] = getRockTypeColor(rockType);
-    }
+  }, [samples]);
 
-    const samplesByRockTypeAndMaterial = sampleData.reduce((acc, sample) => {
-      const key = `${sample.rock_type}|${sample.material}`;
-      if (!acc[key]) {
-        acc[key] = [];
+  // Grouping strategy: Group by rock_type|material or vei|material in a single pass.
+  // Legend shows materials (WR, GL, MIN, INC), colors show rock types or VEI
+  const sampleGroups = useMemo(() => {
+    const groups = new Map<string, { material: string; color: string; points: typeof sampleData }>();
+    for (const sample of sampleData) {
+      const colorKey = colorBy === 'vei'
+        ? (sample.vei !== undefined ? sample.vei.toString() : 'Unknown')
+        : sample.rock_type;
+      const key = `${colorKey}|${sample.material}`;
+      let group = groups.get(key);
+      if (!group) {
+        const color = colorBy === 'vei'
+          ? (sample.vei !== undefined ? getVEIColor(sample.vei) : '#808080')
+          : getRockTypeColor(colorKey);
+        group = { material: sample.material, color: color || '#808080', points: [] };
+        groups.set(key, group);
       }
-      acc[key].push(sample);
-      return acc;
-    }, {} as Record<string, typeof sampleData>);
+      group.points.push(sample);
+    }
+    return Array.from(groups.values());
+  }, [sampleData, colorBy]);
 
+  // Sample marker traces, rebuilt only when the groups or the coloring change rather
+  // than on every render. Each group's coordinate and hover columns are filled in one
+  // pass instead of one map() per column.
+  const sampleTraces = useMemo(() => {
+    const traces: Plotly.Data[] = [];
     const materialLegendShown = new Set<string>();
 
-    for (const [key, samples] of Object.entries(samplesByRockTypeAndMaterial)) {
-      const [rockType, material] = key.split('|');
-      const shape = materialShapes[material] || materialShapes['Unknown'];
-      const color = rockTypeColors[rockType] || '#808080';
+    for (const { material, color, points } of sampleGroups) {
+      const shape = MATERIAL_SHAPES[material] || MATERIAL_SHAPES['Unknown'];
       const showLegend = !materialLegendShown.has(material);
       
       if (showLegend) {
         materialLegendShown.add(material);
       }
+
+      const x: number[] = [];
+      const y: number[] = [];
+      const customdata: (string | number)[][] = [];
+      for (const s of points) {
+        x.push(s.sio2);
+        y.push(s.alkali);
+        customdata.push([
+          s.sample_code,
+          colorBy === 'vei' ? (s.vei !== undefined ? s.vei : 'Unknown') : s.rock_type,
+          s.volcano_name ? `<br>Volcano: ${s.volcano_name}` : '',
+          s.confidenceLabel,
+        ]);
+      }
       
-      plotlyData.push({
-        type: 'scatter',
+      traces.push({
+        type: 'scattergl',  // WebGL: a volcano can contribute thousands of sample markers
         mode: 'markers',
-        x: samples.map(s => s.sio2),
-        y: samples.map(s => s.alkali),
+        x,
+        y,
         name: material,
         legendgroup: material,
         showlegend: showLegend,
@@ -212,80 +183,90 @@ export const TASPlot: React.FC<TASPlotProps> = React.memo(({
           symbol: shape,
           color: color,
         },
-        text: samples.map(s => 
-          `${s.sample_code}<br>`+
-          `Rock Type: ${s.rock_type}<br>`+
-          `Material: ${s.material}<br>`+
-          `SiO2: ${s.sio2.toFixed(2)}%<br>`+
-          `Alkali: ${s.alkali.toFixed(2)}%${s.volcano_name ? `<br>`+
-          `Volcano: ${s.volcano_name}` : ''}<br>`+
-          `Confidence: ${s.confidenceLabel}`
-        ),
-        hoverinfo: 'text',
+        // Plotly formats the hover label from these fields only when a point is hovered
+        customdata,
+        hovertemplate:
+          `%{customdata[0]}<br>` +
+          `${colorBy === 'vei' ? 'VEI' : 'Rock Type'}: %{customdata[1]}<br>` +
+          `Material: ${material}<br>` +
+          `SiO2: %{x:.2f}%<br>` +
+          `Alkali: %{y:.2f}%%{customdata[2]}<br>` +
+          `Confidence: %{customdata[3]}<extra></extra>`,
       });
     }
-  } else if (colorBy === 'vei') {
-    // VEI MODE: Group by vei|material
-    // Legend shows materials (WR, GL, MIN, INC), colors show VEI
-    const uniqueVEIs = Array.from(new Set(sampleData.map(s => s.vei).filter(v => v !== undefined))) as number[];
-    const veiColors: Record<string, string> = {};
-    
-    for (const vei of uniqueVEIs) {
-      veiColors[vei.toString()] = getVEIColor(vei);
-    }
-    // Add color for unknown VEI
-    veiColors['Unknown'] = '#808080';
 
-    const samplesByVEIAndMaterial = sampleData.reduce((acc, sample) => {
-      const veiKey = sample.vei !== undefined ? sample.vei.toString() : 'Unknown';
-      const key = `${veiKey}|${sample.material}`;
-      if (!acc[key]) {
-        acc[key] = [];
-      }
-      acc[key].push(sample);
-      return acc;
-    }, {} as Record<string, typeof sampleData>);
+    return traces;
+  }, [sampleGroups, colorBy]);
 
-    const materialLegendShown = new Set<string>();
+  // Classification polygons and the alkali line only depend on the TAS definitions
+  const referenceTraces = useMemo(() => {
+    const traces: Plotly.Data[] = [];
+    if (!tasData) return traces;
 
-    for (const [key, samples] of Object.entries(samplesByVEIAndMaterial)) {
-      const [veiKey, material] = key.split('|');
-      const shape = materialShapes[material] || materialShapes['Unknown'];
-      const color = veiColors[veiKey] || '#808080';
-      const showLegend = !materialLegendShown.has(material);
-      
-      if (showLegend) {
-        materialLegendShown.add(material);
-      }
+    // Add classification polygons
+    for (const polygon of tasData.polygons) {
+      const x = polygon.coordinates.map(coord => coord[0]);
+      const y = polygon.coordinates.map(coord => coord[1]);
       
-      plotlyData.push({
+      traces.push({
         type: 'scatter',
-        mode: 'markers',
-        x: samples.map(s => s.sio2),
-        y: samples.map(s => s.alkali),
-        name: material,
-        legendgroup: material,
-        showlegend: showLegend,
-        marker: {
-          size: 8,
-          opacity: 0.7,
-          symbol: shape,
-          color: color,
-        },
-        text: samples.map(s => 
-          `${s.sample_code}<br>`+
-          `VEI: ${s.vei !== undefined ? s.vei : 'Unknown'}<br>`+
-          `Material: ${s.material}<br>`+
-          `SiO2: ${s.sio2.toFixed(2)}%<br>`+
-          `Alkali: ${s.alkali.toFixed(2)}%${s.volcano_name ? `<br>`+
-          `Volcano: ${s.volcano_name}` : ''}<br>`+
-          `Confidence: ${s.confidenceLabel}`
-        ),
+        mode: 'lines',
+        x,
+        y,
+        fill: 'toself',
+        fillcolor: `rgba(200, 200, 200, 0.1)`,
+        line: { color: 'rgba(150, 150, 150, 0.5)', width: 1 },
         hoverinfo: 'text',
+        text: polygon.name,
+        name: polygon.name,
+        showlegend: false,
       });
     }
+
+    // Add alkali/subalkalic line
+    const alkaliX = tasData.alkali_line.coordinates.map(coord => coord[0]);
+    const alkaliY = tasData.alkali_line.coordinates.map(coord => coord[1]);
+    traces.push({
+      type: 'scatter',
+      mode: 'lines',
+      x: alkaliX,
+      y: alkaliY,
+      line: { color: 'black', width: 2, dash: 'dash' },
+      name: 'Alkali/Subalkalic',
+      showlegend: true,
+      hoverinfo: 'name',
+    });
+
+    return traces;
+  }, [tasData]);
+
+  if (error) {
+    return (
+      <div className="flex items-center justify-center h-full">
+        <div className="text-red-600">Error loading TAS diagram: {error}</div>
+      </div>
+    );
+  }
+
+  if (loading || !tasData) {
+    return (
+      <div className="flex items-center justify-center h-full">
+        <div className="text-gray-500">Loading TAS diagram...</div>
+      </div>
+    );
+  }
+
+  if (sampleData.length === 0) {
+    return (
+      <div className="flex items-center justify-center h-full">
+        <div className="text-gray-500">No samples with oxide data to plot</div>
+      </div>
+    );
   }
 
+  // Prepare Plotly data
+  const plotlyData: Plotly.Data[] = [...referenceTraces, ...sampleTraces];
+
   return (
     <div className="w-full h-full">
       <Plot
@@ -10,6 +10,11 @@ interface VEIBarChartProps {
   color: string;
 }
 
+// VEI levels in order (0-8 + unknown) with their bar labels; these never change,
+// so they are built once here instead of on every render
+const VEI_LEVELS = ['0', '1', '2', '3', '4', '5', '6', '7', '8', 'unknown'];
+const VEI_BAR_LABELS = VEI_LEVELS.map(level => (level === 'unknown' ? 'Unknown' : `VEI ${level}`));
+
 /**
  * VEI (Volcanic Explosivity Index) Bar Chart Component
  * 
@@ -21,40 +26,36 @@ export const VEIBarChart: React.FC<VEIBarChartProps> = ({
   volcanoName,
   color,
 }) => {
-  // VEI levels in order (0-8 + unknown)
-  const veiLevels = ['0', '1', '2', '3', '4', '5', '6', '7', '8', 'unknown'];
-  
-  // Normalize VEI counts keys (convert '1.0' to '1', etc.)
-  const normalizedCounts: Record<string, number> = {};
+  // Accumulate counts into a fixed slot per VEI level (0-8, then unknown), normalizing
+  // keys such as '1.0' to their level; a preallocated typed array replaces the
+  // intermediate record keyed by normalized strings
+  const UNKNOWN_SLOT = VEI_LEVELS.length - 1;
+  const yValues = new Uint32Array(VEI_LEVELS.length);
+  let totalEruptions = 0;
   for (const [key, value] of Object.entries(veiCounts)) {
+    totalEruptions += value;
     if (key === 'unknown') {
-      normalizedCounts['unknown'] = value;
-    } else {
-      // Convert '1.0' to '1', '2.0' to '2', etc.
-      const normalized = String(Math.floor(Number(key)));
-      normalizedCounts[normalized] = (normalizedCounts[normalized] || 0) + value;
+      yValues[UNKNOWN_SLOT] += value;
+      continue;
+    }
+    const level = Math.floor(Number(key));  // Convert '1.0' to 1, etc.
+    if (level >= 0 && level < UNKNOWN_SLOT) {
+      yValues[level] += value;
     }
   }
   
-  // Prepare data for Plotly
-  const xValues: string[] = [];
-  const yValues: number[] = [];
+  // Prepare hover text for Plotly
   const hoverText: string[] = [];
   
-  const totalEruptions = Object.values(normalizedCounts).reduce((sum, count) => sum + count, 0);
-  
-  for (const level of veiLevels) {
-    const count = normalizedCounts[level] || 0;
-    xValues.push(level === 'unknown' ? 'Unknown' : `VEI ${level}`);
-    yValues.push(count);
-    
+  VEI_LEVELS.forEach((level, slot) => {
+    const count = yValues[slot];
     const percentage = totalEruptions > 0 ? ((count / totalEruptions) * 100).toFixed(1) : '0.0';
     hoverText.push(
       `VEI ${level === 'unknown' ? 'Unknown' : level}<br>` +
       `Eruptions: ${count}<br>` +
       `Percentage: ${percentage}%`
     );
-  }
+  });
   
   // Check if there's any data
   const hasData = yValues.some(v => v > 0);
@@ -73,7 +74,7 @@ export const VEIBarChart: React.FC<VEIBarChartProps> = ({
   const plotlyData: Plotly.Data[] = [
     {
       type: 'bar',
-      x: xValues,
+      x: VEI_BAR_LABELS,
       y: yValues,
       marker: {
         color: color,
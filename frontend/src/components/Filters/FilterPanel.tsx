@@ -1,7 +1,8 @@
-import React, { useState, useCallback, useEffect } from 'react';
+import React, { useState, useCallback, useEffect, useMemo } from 'react';
 import { X, Filter, RotateCcw } from 'lucide-react';
 import type { SampleFilters, VolcanoFilters } from '../../types';
 import { fetchSampleTectonicSettings, fetchVolcanoTectonicSettings, fetchRockTypes, fetchCountries, fetchRegions, fetchVolcanoNames } from '../../api/metadata';
+import { buildNameSearchIndex, searchNames } from '../../utils/nameSearch';
 
 interface FilterPanelProps {
   /** Current sample filters */
@@ -54,6 +55,9 @@ export const FilterPanel: React.FC<FilterPanelProps> = ({
   const [countries, setCountries] = useState<string[]>([]);
   const [regions, setRegions] = useState<string[]>([]);
   const [volcanoNames, setVolcanoNames] = useState<string[]>([]);
+  const countryIndex = useMemo(() => buildNameSearchIndex(countries), [countries]);
+  const regionIndex = useMemo(() => buildNameSearchIndex(regions), [regions]);
+  const volcanoNameIndex = useMemo(() => buildNameSearchIndex(volcanoNames), [volcanoNames]);
   const [loadingMetadata, setLoadingMetadata] = useState(true);
 
   // Autocomplete state
@@ -230,21 +234,21 @@ export const FilterPanel: React.FC<FilterPanelProps> = ({
    * Get filtered country suggestions
    */
   const filteredCountries = countryInput
-    ? countries.filter(c => c.toLowerCase().includes(countryInput.toLowerCase()))
+    ? searchNames(countryIndex, countryInput)
     : countries;
 
   /**
    * Get filtered region suggestions
    */
   const filteredRegions = regionInput
-    ? regions.filter(r => r.toLowerCase().includes(regionInput.toLowerCase()))
+    ? searchNames(regionIndex, regionInput)
     : regions;
 
   /**
    * Get filtered volcano name suggestions
    */
   const filteredVolcanoNames = volcanoInput
-    ? volcanoNames.filter(v => v.toLowerCase().includes(volcanoInput.toLowerCase()))
+    ? searchNames(volcanoNameIndex, volcanoInput)
     : volcanoNames;
 
   if (!isOpen) return null;
@@ -267,6 +271,12 @@ export const FilterPanel: React.FC<FilterPanelProps> = ({
       ? [localVolcanoFilters.tectonic_setting]
       : [];
 
+  // Membership sets for the checkbox lists, so rendering each option is a hash
+  // lookup instead of a scan of the selected values
+  const selectedRockTypeSet = new Set(selectedRockTypes);
+  const selectedSampleTectonicSettingSet = new Set(selectedSampleTectonicSettings);
+  const selectedVolcanoTectonicSettingSet = new Set(selectedVolcanoTectonicSettings);
+
   return (
     <>
       {/* Backdrop */}
@@ -340,7 +350,7 @@ export const FilterPanel: React.FC<FilterPanelProps> = ({
                     <label key={type} className="flex items-center gap-2 hover:bg-gray-50 px-2 py-1 rounded cursor-pointer">
                       <input
                         type="checkbox"
-                        checked={selectedRockTypes.includes(type)}
+                        checked={selectedRockTypeSet.has(type)}
                         onChange={() => toggleRockType(type)}
                         className="w-4 h-4 text-volcano-600 border-gray-300 rounded focus:ring-volcano-500"
                       />
@@ -369,7 +379,7 @@ export const FilterPanel: React.FC<FilterPanelProps> = ({
                     <label key={setting} className="flex items-center gap-2 hover:bg-gray-50 px-2 py-1 rounded cursor-pointer">
                       <input
                         type="checkbox"
-                        checked={selectedSampleTectonicSettings.includes(setting)}
+                        checked={selectedSampleTectonicSettingSet.has(setting)}
                         onChange={() => toggleSampleTectonicSetting(setting)}
                         className="w-4 h-4 text-volcano-600 border-gray-300 rounded focus:ring-volcano-500"
                       />
@@ -558,7 +568,7 @@ export const FilterPanel: React.FC<FilterPanelProps> = ({
                     <label key={setting} className="flex items-center gap-2 hover:bg-gray-50 px-2 py-1 rounded cursor-pointer">
                       <input
                         type="checkbox"
-                        checked={selectedVolcanoTectonicSettings.includes(setting)}
+                        checked={selectedVolcanoTectonicSettingSet.has(setting)}
                         onChange={() => toggleVolcanoTectonicSetting(setting)}
                         className="w-4 h-4 text-volcano-600 border-gray-300 rounded focus:ring-volcano-500"
                       />
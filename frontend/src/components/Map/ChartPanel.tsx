@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useMemo, useState } from 'react';
 import { ChevronUp, ChevronDown, X } from 'lucide-react';
 import { TASPlot } from '../Charts/TASPlot';
 import { AFMPlot } from '../Charts/AFMPlot';
@@ -69,21 +69,22 @@ export const ChartPanel: React.FC<ChartPanelProps> = ({
 }) => {
   const [activeTab, setActiveTab] = useState<ChartTab>('both');
 
-  // Apply confidence filtering to samples
-  const filteredSamples = filterSamplesByConfidence(samples, selectedConfidenceLevels);
-
-  // Filter samples with required oxide data
-  const tasValidSamples = filteredSamples.filter(
-    s => s.oxides?.['SIO2'] && s.oxides?.['NA2O'] && s.oxides?.['K2O']
-  );
-  
-  const afmValidSamples = filteredSamples.filter(
-    s => s.oxides?.['FEOT'] && s.oxides?.['MGO'] && s.oxides?.['NA2O'] && s.oxides?.['K2O']
-  );
-
-  const radarValidSamples = filteredSamples.filter(
-    sample => sample.material === 'WR' && !!sample.petro?.rock_type
-  );
+  // Apply confidence filtering, then split samples by the oxide data each chart
+  // needs in a single pass instead of rescanning the list once per chart
+  const { tasValidSamples, afmValidSamples, radarValidSamples } = useMemo(() => {
+    const tas: Sample[] = [];
+    const afm: Sample[] = [];
+    const radar: Sample[] = [];
+    for (const s of filterSamplesByConfidence(samples, selectedConfidenceLevels)) {
+      const ox = s.oxides;
+      if (ox?.['NA2O'] && ox['K2O']) {
+        if (ox['SIO2']) tas.push(s);
+        if (ox['FEOT'] && ox['MGO']) afm.push(s);
+      }
+      if (s.material === 'WR' && s.petro?.rock_type) radar.push(s);
+    }
+    return { tasValidSamples: tas, afmValidSamples: afm, radarValidSamples: radar };
+  }, [samples, selectedConfidenceLevels]);
 
   if (!isOpen) {
     return (
@@ -1,8 +1,8 @@
-import React, { useState, useCallback } from 'react';
+import React, { useState, useCallback, useMemo } from 'react';
 import DeckGL from '@deck.gl/react';
 import { Map as MapboxMap } from 'react-map-gl/mapbox';
 import { ScatterplotLayer, GeoJsonLayer, IconLayer } from '@deck.gl/layers';
-import type { BBox, Sample, Volcano, TectonicBoundary } from '../../types';
+import type { BBox, Sample, SampleCluster, Volcano, TectonicBoundary } from '../../types';
 import { 
   normalizeConfidence, 
   getConfidenceColor, 
@@ -11,9 +11,43 @@ import {
   getVolcanoName,
   type ConfidenceLevel 
 } from '../../utils/confidence';
+import { DATABASE_COLORS, getDatabaseColor, hexToRgbArray } from '../../utils/colors';
 
 import 'mapbox-gl/dist/mapbox-gl.css';
 
+type RGBAColor = [number, number, number, number];
+
+/**
+ * Sample attributes read by the sample layer accessors, derived once per sample
+ */
+interface SampleDisplayAttributes {
+  confidence: ConfidenceLevel;
+  fillColor: RGBAColor;
+  lineColor: RGBAColor;
+  volcanoName?: string;
+}
+
+const UNKNOWN_FILL_COLOR = getConfidenceColor('unknown');
+const UNKNOWN_LINE_COLOR: RGBAColor = [UNKNOWN_FILL_COLOR[0], UNKNOWN_FILL_COLOR[1], UNKNOWN_FILL_COLOR[2], 255];
+// Orange with higher opacity for samples of the selected volcano
+const SELECTED_VOLCANO_FILL_COLOR: RGBAColor = [255, 140, 0, 200];
+
+// Tectonic boundary line colors by boundary type
+const BOUNDARY_TYPE_COLORS: Record<string, [number, number, number]> = {
+  ridge: [255, 165, 0],  // Orange
+  trench: [255, 0, 0],   // Red
+};
+const OTHER_BOUNDARY_COLOR: [number, number, number] = [128, 128, 128];  // Gray
+
+// Sample cluster fill colors by source database
+const CLUSTER_FILL_COLORS: Record<string, RGBAColor> = Object.fromEntries(
+  Object.entries(DATABASE_COLORS).map(([database, hex]) => [database, hexToRgbArray(hex, 160)])
+);
+const OTHER_CLUSTER_FILL_COLOR: RGBAColor = hexToRgbArray(getDatabaseColor(undefined), 160);
+// Cluster marker radius in pixels per square root of its sample count, so that
+// marker area grows linearly with the number of samples
+const CLUSTER_RADIUS_SCALE = 1.5;
+
 type ViewState = {
   longitude: number;
   latitude: number;
@@ -28,6 +62,8 @@ type ViewState = {
 interface MapProps {
   /** Array of samples to display on the map */
   samples?: Sample[];
+  /** Aggregated sample clusters to display, sized by their sample count */
+  sampleClusters?: SampleCluster[];
   /** Array of volcanoes to display on the map */
   volcanoes?: Volcano[];
   /** Tectonic boundaries to display */
@@ -89,6 +125,7 @@ const INITIAL_VIEW_STATE: ViewState = {
  * Features:
  * - Volcano triangles (PolygonLayer) with VEI-based sizing
  * - Sample points (ScatterplotLayer) for individual selection
+ * - Sample clusters (ScatterplotLayer) sized by sample count for zoomed-out overviews
  * - Tectonic boundaries (GeoJsonLayer)
  * - Click and hover interactions
  * - Performance optimized for 100k+ samples
@@ -96,6 +133,7 @@ const INITIAL_VIEW_STATE: ViewState = {
  */
 export const VolcanoMap: React.FC<MapProps> = ({
   samples = [],
+  sampleClusters = [],
   volcanoes = [],
   tectonicBoundaries = [],
   viewState: externalViewState,
@@ -139,6 +177,8 @@ export const VolcanoMap: React.FC<MapProps> = ({
     confidence_label?: string;
     confidence_description?: string;
     confidence_icon?: string;
+    database?: string;
+    sample_count?: number;
   };
   const [hoverInfo, setHoverInfo] = useState<{
     x: number;
@@ -212,6 +252,25 @@ export const VolcanoMap: React.FC<MapProps> = ({
     });
   }, [volcanoes, showVolcanoes, onVolcanoClick]);
 
+  // Per-sample display attributes (confidence level, its fill and border colors, and
+  // the matched volcano name), derived once per samples array so the layer accessors
+  // re-run on volcano selection changes as plain lookups instead of re-parsing metadata
+  const sampleAttributes = useMemo(() => {
+    const attributes = new Map<Sample, SampleDisplayAttributes>();
+    for (const sample of samples) {
+      const confidence = normalizeConfidence(sample.matching_metadata?.confidence_level, sample.matching_metadata);
+      const fillColor = getConfidenceColor(confidence);
+      attributes.set(sample, {
+        confidence,
+        fillColor,
+        // Border uses the confidence color at full opacity
+        lineColor: [fillColor[0], fillColor[1], fillColor[2], 255],
+        volcanoName: getVolcanoName(sample.matching_metadata),
+      });
+    }
+    return attributes;
+  }, [samples]);
+
   /**
    * Sample points layer for individual sample visualization and selection
    * 
@@ -236,39 +295,34 @@ export const VolcanoMap: React.FC<MapProps> = ({
       getPosition: (d: Sample) => d.geometry.coordinates,
       getRadius: 3000, // 3km radius points
       getFillColor: (d: Sample) => {
+        const attributes = sampleAttributes.get(d);
         // PRIORITY 1: Highlight samples from the selected volcano with orange color
         // This ALWAYS takes precedence over confidence coloring for the FILL
-        if (selectedVolcanoName && getVolcanoName(d.matching_metadata) === selectedVolcanoName) {
-          return [255, 140, 0, 200]; // Orange with higher opacity for selected volcano
+        if (selectedVolcanoName && attributes?.volcanoName === selectedVolcanoName) {
+          return SELECTED_VOLCANO_FILL_COLOR;
         }
         
         // PRIORITY 2: Use confidence-based coloring for non-selected samples
         // Provides subtle data quality indication without overwhelming the visualization
-        const confidence = normalizeConfidence(d.matching_metadata?.confidence_level, d.matching_metadata);
-        return getConfidenceColor(confidence);
+        return attributes?.fillColor ?? UNKNOWN_FILL_COLOR;
       },
       // NEW: Line color (stroke/border) always shows confidence level
       // This allows selected volcano samples to display data quality via border
-      getLineColor: (d: Sample) => {
-        const confidence = normalizeConfidence(d.matching_metadata?.confidence_level, d.matching_metadata);
-        const color = getConfidenceColor(confidence);
-        // Return RGB with full opacity for visible border
-        return [color[0], color[1], color[2], 255];
-      },
+      getLineColor: (d: Sample) => sampleAttributes.get(d)?.lineColor ?? UNKNOWN_LINE_COLOR,
       // Enable stroke and set width
       stroked: true,
       lineWidthMinPixels: 1,
       lineWidthMaxPixels: 2,
       getLineWidth: (d: Sample) => {
         // Thicker border for selected volcano samples to make confidence more visible
-        if (selectedVolcanoName && getVolcanoName(d.matching_metadata) === selectedVolcanoName) {
+        if (selectedVolcanoName && sampleAttributes.get(d)?.volcanoName === selectedVolcanoName) {
           return 2;
         }
         return 1;
       },
       updateTriggers: {
         getFillColor: [selectedVolcanoName], // Force re-render when selected volcano changes
-        getLineColor: [selectedVolcanoName], // Update borders too
+        // Borders only depend on confidence, so they are not recomputed on selection
         getLineWidth: [selectedVolcanoName],
       },
       pickable: true,
@@ -284,14 +338,14 @@ export const VolcanoMap: React.FC<MapProps> = ({
       onHover: (info: any) => {
         if (info.object) {
           const sample = info.object as Sample;
-          const confidence = normalizeConfidence(sample.matching_metadata?.confidence_level, sample.matching_metadata);
+          const confidence = sampleAttributes.get(sample)?.confidence ?? 'unknown';
           
           setHoverInfo({
             x: info.x,
             y: info.y,
             object: {
               type: 'sample',
-              volcano_name: getVolcanoName(sample.matching_metadata),
+              volcano_name: sampleAttributes.get(sample)?.volcanoName,
               rock_name: sample.petro?.rock_type,
               longitude: sample.geometry.coordinates[0],
               latitude: sample.geometry.coordinates[1],
@@ -307,34 +361,81 @@ export const VolcanoMap: React.FC<MapProps> = ({
         }
       },
     });
-  }, [samples, showSamplePoints, selectedVolcanoName, onSampleClick]);
+  }, [samples, sampleAttributes, showSamplePoints, selectedVolcanoName, onSampleClick]);
+
+  /**
+   * Sample clusters layer for the zoomed-out overview of filtered samples
+   * 
+   * Each marker stands for all samples of one source database within a grid cell,
+   * colored by database with its area proportional to the number of samples.
+   */
+  const sampleClustersLayer = useCallback(() => {
+    if (!showSamplePoints || sampleClusters.length === 0) return null;
+
+    return new ScatterplotLayer({
+      id: 'sample-clusters',
+      data: sampleClusters,
+      getPosition: (d: SampleCluster) => [d.lon, d.lat],
+      getRadius: (d: SampleCluster) => Math.sqrt(d.count),
+      radiusUnits: 'pixels',
+      radiusScale: CLUSTER_RADIUS_SCALE,
+      radiusMinPixels: 2,
+      radiusMaxPixels: 30,
+      getFillColor: (d: SampleCluster) =>
+        (d.db && CLUSTER_FILL_COLORS[d.db.toUpperCase()]) || OTHER_CLUSTER_FILL_COLOR,
+      stroked: true,
+      getLineColor: [255, 255, 255, 120],
+      lineWidthMinPixels: 1,
+      pickable: true,
+      onHover: (info: any) => {
+        if (info.object) {
+          const cluster = info.object as SampleCluster;
+          setHoverInfo({
+            x: info.x,
+            y: info.y,
+            object: {
+              type: 'cluster',
+              database: cluster.db,
+              sample_count: cluster.count,
+              longitude: cluster.lon,
+              latitude: cluster.lat,
+            },
+          });
+        } else {
+          setHoverInfo(null);
+        }
+      },
+    });
+  }, [sampleClusters, showSamplePoints]);
 
   /**
    * Tectonic boundaries GeoJsonLayer
    * Lines for ridges, trenches, and transforms
    */
+  // Group boundaries by type for different colors, once per boundary set. Layers are
+  // recreated on every render, and handing them the same per-type arrays lets deck.gl
+  // keep the tessellated lines instead of reprocessing every boundary each time.
+  const boundariesByType = useMemo(() => {
+    const groups = new Map<string, TectonicBoundary[]>();
+    for (const boundary of tectonicBoundaries) {
+      const type = boundary.properties?.boundary_type || 'unknown';
+      let group = groups.get(type);
+      if (!group) {
+        group = [];
+        groups.set(type, group);
+      }
+      group.push(boundary);
+    }
+    return groups;
+  }, [tectonicBoundaries]);
+
   const tectonicLayer = useCallback(() => {
     if (!showTectonicBoundaries || tectonicBoundaries.length === 0) return null;
 
-    // Group boundaries by type for different colors
-    const boundariesByType = tectonicBoundaries.reduce((acc, boundary) => {
-      const type = boundary.properties?.boundary_type || 'unknown';
-      if (!acc[type]) acc[type] = [];
-      acc[type].push(boundary);
-      return acc;
-    }, {} as Record<string, TectonicBoundary[]>);
-
     // Create a layer for each boundary type
-    const layers = Object.entries(boundariesByType).map(([type, boundaries]) => {
+    const layers = Array.from(boundariesByType, ([type, boundaries]) => {
       // Determine color based on boundary type
-      let color: [number, number, number];
-      if (type === 'ridge') {
-        color = [255, 165, 0]; // Orange
-      } else if (type === 'trench') {
-        color = [255, 0, 0]; // Red
-      } else {
-        color = [128, 128, 128]; // Gray
-      }
+      const color = BOUNDARY_TYPE_COLORS[type] ?? OTHER_BOUNDARY_COLOR;
 
       return new GeoJsonLayer({
         id: `tectonic-${type}`,
@@ -365,7 +466,7 @@ export const VolcanoMap: React.FC<MapProps> = ({
     });
 
     return layers;
-  }, [tectonicBoundaries, showTectonicBoundaries]);
+  }, [tectonicBoundaries, boundariesByType, showTectonicBoundaries]);
 
   // Combine all layers
   // Drawing bbox layer (for real-time preview during drawing)
@@ -448,6 +549,12 @@ export const VolcanoMap: React.FC<MapProps> = ({
     }
   }
   
+  // Add sample clusters layer
+  const sampleClustersOverview = sampleClustersLayer();
+  if (sampleClustersOverview) {
+    layers.push(sampleClustersOverview);
+  }
+  
   // Add sample points layer
   const samplePoints = samplePointsLayer();
   if (samplePoints) {
@@ -577,6 +684,33 @@ export const VolcanoMap: React.FC<MapProps> = ({
       );
     }
 
+    // Sample cluster tooltip
+    if ('type' in object && object.type === 'cluster') {
+      return (
+        <div
+          style={{
+            position: 'absolute',
+            left: x,
+            top: y,
+            pointerEvents: 'none',
+            padding: '8px',
+            background: 'rgba(0, 0, 0, 0.8)',
+            color: 'white',
+            borderRadius: '4px',
+            fontSize: '12px',
+            zIndex: 1000,
+          }}
+        >
+          <div><strong>{object.sample_count?.toLocaleString()} samples</strong></div>
+          <div>Database: {object.database || 'N/A'}</div>
+          <div>Location: {object.latitude?.toFixed(2)}°, {object.longitude?.toFixed(2)}°</div>
+          <div style={{ fontSize: '10px', color: 'rgba(255, 255, 255, 0.7)', marginTop: '2px' }}>
+            Zoom in and draw a bounding box to load individual samples
+          </div>
+        </div>
+      );
+    }
+
     // Tectonic boundary tooltip
     if ('type' in object && object.type === 'tectonic') {
       return (
@@ -5,7 +5,7 @@ import { RockTypeRadarChart } from '../Charts';
 import { fetchRockTypeDistribution } from '../../api/analytics';
 import { fetchVolcanoes } from '../../api/volcanoes';
 import { formatBboxForAPI } from '../../hooks/useBboxDraw';
-import { calculateRockTypeDistribution, filterSamplesByConfidence } from '../../utils/confidence';
+import { addWholeRockType, filterSamplesByConfidence } from '../../utils/confidence';
 import type {
   BBox,
   RockTypeComparisonMode,
@@ -80,20 +80,19 @@ export const RockTypeRadarPanel: React.FC<RockTypeRadarPanelProps> = ({
   const [selectedVolcano, setSelectedVolcano] = useState<VolcanoOption | null>(null);
   const [showSuggestions, setShowSuggestions] = useState(false);
 
-  const primarySamples = useMemo(
-    () => filterSamplesByConfidence(samples, selectedConfidenceLevels).filter(sample => sample.material === 'WR'),
-    [samples, selectedConfidenceLevels]
-  );
-
-  const primaryRockTypes = useMemo(
-    () => calculateRockTypeDistribution(primarySamples),
-    [primarySamples]
-  );
-
-  const primarySampleCount = useMemo(
-    () => Object.values(primaryRockTypes).reduce((sum, count) => sum + count, 0),
-    [primaryRockTypes]
-  );
+  // Whole-rock samples are selected before the confidence filter so only they pay for
+  // confidence normalization; rock types and their total are then counted in one pass
+  const { primaryRockTypes, primarySampleCount } = useMemo(() => {
+    const wholeRock = samples.filter(sample => sample.material === 'WR');
+    const rockTypes: Record<string, number> = {};
+    let sampleCount = 0;
+    for (const sample of filterSamplesByConfidence(wholeRock, selectedConfidenceLevels)) {
+      if (addWholeRockType(rockTypes, sample)) {
+        sampleCount++;
+      }
+    }
+    return { primaryRockTypes: rockTypes, primarySampleCount: sampleCount };
+  }, [samples, selectedConfidenceLevels]);
 
   const primarySeries = useMemo<RockTypeRadarSeries>(() => ({
     label: primaryDatasetLabel,
@@ -1,4 +1,4 @@
-import React, { useRef, useState, useEffect, useCallback } from 'react';
+import React, { useRef, useState, useEffect, useCallback, useReducer } from 'react';
 import * as turf from '@turf/turf';
 import { WebMercatorViewport } from '@deck.gl/core';
 import type { Sample } from '../../types';
@@ -43,7 +43,10 @@ export const SelectionOverlay: React.FC<SelectionOverlayProps> = ({
 }) => {
   const canvasRef = useRef<HTMLCanvasElement>(null);
   const [isDrawing, setIsDrawing] = useState(false);
-  const [points, setPoints] = useState<{ x: number; y: number }[]>([]);
+  // The lasso path grows on every mouse move, so it is appended in place rather than
+  // copied into a new state array each time; pathVersion triggers the redraw.
+  const pointsRef = useRef<{ x: number; y: number }[]>([]);
+  const [pathVersion, bumpPathVersion] = useReducer((version: number) => version + 1, 0);
   const [startPoint, setStartPoint] = useState<{ x: number; y: number } | null>(null);
 
   /**
@@ -75,7 +78,8 @@ export const SelectionOverlay: React.FC<SelectionOverlayProps> = ({
 
     setIsDrawing(true);
     setStartPoint({ x, y });
-    setPoints([{ x, y }]);
+    pointsRef.current = [{ x, y }];
+    bumpPathVersion();
   };
 
   /**
@@ -91,17 +95,21 @@ export const SelectionOverlay: React.FC<SelectionOverlayProps> = ({
     const y = e.clientY - rect.top;
 
     if (mode === 'lasso') {
-      setPoints((prev) => [...prev, { x, y }]);
+      pointsRef.current.push({ x, y });
     } else if (mode === 'box' && startPoint) {
       // For box, we only need start and current point
-      setPoints([startPoint, { x, y }]);
+      pointsRef.current = [startPoint, { x, y }];
+    } else {
+      return;
     }
+    bumpPathVersion();
   };
 
   /**
    * Handle mouse up - complete drawing and select samples
    */
   const handleMouseUp = () => {
+    const points = pointsRef.current;
     if (!isDrawing || points.length < 2) {
       setIsDrawing(false);
       return;
@@ -139,18 +147,22 @@ export const SelectionOverlay: React.FC<SelectionOverlayProps> = ({
 
     // Create turf polygon
     const turfPolygon = turf.polygon([polygon]);
+    const [minLon, minLat, maxLon, maxLat] = turf.bbox(turfPolygon);
 
-    // Find samples within the polygon
+    // Find samples within the polygon. The bounding-box comparison rejects most
+    // samples cheaply, so only candidates inside it pay for the polygon test.
     const selectedSamples = samples.filter((sample) => {
-      const point = turf.point(sample.geometry.coordinates);
-      return turf.booleanPointInPolygon(point, turfPolygon);
+      const [lon, lat] = sample.geometry.coordinates;
+      if (lon < minLon || lon > maxLon || lat < minLat || lat > maxLat) return false;
+      return turf.booleanPointInPolygon(sample.geometry.coordinates, turfPolygon);
     });
 
     // Complete selection
     onSelectionComplete(selectedSamples);
     
     // Reset state
-    setPoints([]);
+    pointsRef.current = [];
+    bumpPathVersion();
     setStartPoint(null);
   };
 
@@ -181,6 +193,7 @@ export const SelectionOverlay: React.FC<SelectionOverlayProps> = ({
     // Clear canvas
     ctx.clearRect(0, 0, width, height);
 
+    const points = pointsRef.current;
     if (points.length === 0) return;
 
     // Draw the selection shape
@@ -209,7 +222,7 @@ export const SelectionOverlay: React.FC<SelectionOverlayProps> = ({
 
     ctx.stroke();
     ctx.fill();
-  }, [points, startPoint, isDrawing, mode, width, height]);
+  }, [pathVersion, startPoint, isDrawing, mode, width, height]);
 
   return (
     <div className="absolute inset-0 z-20" style={{ cursor: 'crosshair' }}>
@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useMemo, useState } from 'react';
 import { BarChart3, ChevronUp, ChevronDown } from 'lucide-react';
 import type { Sample, Volcano } from '../../types';
 
@@ -24,19 +24,28 @@ export const SummaryStats: React.FC<SummaryStatsProps> = ({
   loading = false,
 }) => {
   const [isExpanded, setIsExpanded] = useState(true);
-  // Calculate unique values
-  const uniqueRockTypes = new Set(
-    samples.filter(s => s.petro?.rock_type).map(s => s.petro?.rock_type)
-  ).size;
+  // Calculate unique values, adding straight into each Set instead of building
+  // filtered/mapped copies and concatenating them first
+  const { uniqueRockTypes, uniqueCountries, uniqueTectonicSettings } = useMemo(() => {
+    const rockTypes = new Set<string>();
+    const countries = new Set<string>();
+    const tectonicSettings = new Set<unknown>();
 
-  const uniqueCountries = new Set(
-    volcanoes.filter(v => v.country).map(v => v.country)
-  ).size;
+    for (const s of samples) {
+      if (s.petro?.rock_type) rockTypes.add(s.petro.rock_type);
+      if (s.tecto) tectonicSettings.add(typeof s.tecto === 'object' ? s.tecto?.ui : s.tecto);
+    }
+    for (const v of volcanoes) {
+      if (v.country) countries.add(v.country);
+      if (v.tectonic_setting) tectonicSettings.add(v.tectonic_setting);
+    }
 
-  const uniqueTectonicSettings = new Set([
-    ...samples.filter(s => s.tecto).map(s => typeof s.tecto === 'object' ? s.tecto?.ui : s.tecto),
-    ...volcanoes.filter(v => v.tectonic_setting).map(v => v.tectonic_setting),
-  ]).size;
+    return {
+      uniqueRockTypes: rockTypes.size,
+      uniqueCountries: countries.size,
+      uniqueTectonicSettings: tectonicSettings.size,
+    };
+  }, [samples, volcanoes]);
 
   // Format large numbers
   const formatNumber = (num: number) => {
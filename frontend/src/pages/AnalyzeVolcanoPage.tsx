@@ -1,213 +1,22 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo } from 'react';
 import { Mountain, Download, TrendingUp } from 'lucide-react';
 import { TASPlot } from '../components/Charts/TASPlot';
 import { AFMPlot } from '../components/Charts/AFMPlot';
 import { RockTypeDistributionChart } from '../components/Charts/RockTypeDistributionChart';
 import { exportSamplesToCSV } from '../utils/csvExport';
+import { buildNameSearchIndex, searchNames } from '../utils/nameSearch';
 import { useKeyboardShortcuts, commonShortcuts } from '../hooks/useKeyboardShortcuts';
 import { showError } from '../utils/toast';
 import { CardSkeleton, ChartSkeleton } from '../components/LoadingSkeleton';
 import { EmptyState } from '../components/EmptyState';
 import { ConfidenceFilter } from '../components/Filters';
-import type { Sample, MatchingMetadata, TectonicSettingSample, Petro } from '../types';
+import type { Sample } from '../types';
 import type { ConfidenceLevel } from '../utils/confidence';
-import { filterSamplesByConfidence, calculateRockTypeDistribution } from '../utils/confidence';
-
-interface ChemicalAnalysisData {
-  volcano_number: number;
-  volcano_name: string;
-  samples_count: number;
-  tas_data: Array<{
-    sample_code: string;
-    sample_id: string;
-    db: string;
-    petro?: Petro;
-    material: string;
-    tecto?: TectonicSettingSample;
-    geometry?: { type: 'Point'; coordinates: [number, number] };
-    matching_metadata?: MatchingMetadata;
-    references?: string;
-    SIO2: number;
-    NA2O: number;
-    K2O: number;
-    FEOT?: number;
-    MGO?: number;
-    TIO2?: number;
-    AL2O3?: number;
-    CAO?: number;
-    P2O5?: number;
-    MNO?: number;
-  }>;
-  afm_data: Array<{
-    sample_code: string;
-    sample_id: string;
-    db: string;
-    petro?: Petro;
-    material: string;
-    tecto?: TectonicSettingSample;
-    geometry?: { type: 'Point'; coordinates: [number, number] };
-    matching_metadata?: MatchingMetadata;
-    references?: string;
-    FEOT: number;
-    NA2O: number;
-    K2O: number;
-    MGO: number;
-    SIO2?: number;
-    TIO2?: number;
-    AL2O3?: number;
-    CAO?: number;
-    P2O5?: number;
-    MNO?: number;
-  }>;
-  all_samples?: Array<{
-    sample_code: string;
-    sample_id: string;
-    db: string;
-    petro?: Petro;
-    material: string;
-    tectonic_setting?: string;
-    geometry?: { type: 'Point'; coordinates: [number, number] };
-    matching_metadata?: MatchingMetadata;
-    references?: string;
-    SIO2?: number;
-    NA2O?: number;
-    K2O?: number;
-    FEOT?: number;
-    MGO?: number;
-    TIO2?: number;
-    AL2O3?: number;
-    CAO?: number;
-    P2O5?: number;
-    MNO?: number;
-  }>;
-  rock_types: Record<string, number>;
-  rock_types_wr: Record<string, number>;  // Rock types for Whole Rock (WR) samples only
-}
-
-/**
- * Transform all_samples array (includes ALL samples regardless of oxide completeness)
- */
-const transformAllSamples = (
-  allSamples: ChemicalAnalysisData['all_samples'],
-): Sample[] => {
-  if (!allSamples) return [];
-  
-  return allSamples.map(sample => {
-    const oxides: Record<string, number> = {};
-    if (sample['SIO2'] !== undefined) oxides['SIO2'] = sample['SIO2'];
-    if (sample['NA2O'] !== undefined) oxides['NA2O'] = sample['NA2O'];
-    if (sample['K2O'] !== undefined) oxides['K2O'] = sample['K2O'];
-    if (sample['FEOT'] !== undefined) oxides['FEOT'] = sample['FEOT'];
-    if (sample['MGO'] !== undefined) oxides['MGO'] = sample['MGO'];
-    if (sample['TIO2'] !== undefined) oxides['TIO2'] = sample['TIO2'];
-    if (sample['AL2O3'] !== undefined) oxides['AL2O3'] = sample['AL2O3'];
-    if (sample['CAO'] !== undefined) oxides['CAO'] = sample['CAO'];
-    if (sample['P2O5'] !== undefined) oxides['P2O5'] = sample['P2O5'];
-    if (sample['MNO'] !== undefined) oxides['MNO'] = sample['MNO'];
-
-    return {
-      _id: sample.sample_id,
-      sample_id: sample.sample_id,
-      sample_code: sample.sample_code,
-      db: sample.db,
-      material: sample.material,
-      petro: sample.petro,
-      tectonic_setting: sample.tectonic_setting,
-      geometry: sample.geometry || { type: 'Point', coordinates: [0, 0] },
-      matching_metadata: sample.matching_metadata,
-      references: sample.references,
-      oxides: Object.keys(oxides).length > 0 ? oxides : undefined,
-    };
-  });
-};
-
-/**
- * Transform backend chemical analysis data to Sample[] format for chart components
- * Now preserves MongoDB field names without conversion
- */
-const transformToSamples = (data: ChemicalAnalysisData): Sample[] => {
-  const sampleMap = new Map<string, Sample>();
-
-  // Process TAS data
-  for (const tas of data.tas_data) {
-    const oxides: Record<string, number> = {
-      'SIO2': tas['SIO2'],
-      'NA2O': tas['NA2O'],
-      'K2O': tas['K2O'],
-    };
-    // Add all other oxides if present
-    if (tas['FEOT'] !== undefined) oxides['FEOT'] = tas['FEOT'];
-    if (tas['MGO'] !== undefined) oxides['MGO'] = tas['MGO'];
-    if (tas['TIO2'] !== undefined) oxides['TIO2'] = tas['TIO2'];
-    if (tas['AL2O3'] !== undefined) oxides['AL2O3'] = tas['AL2O3'];
-    if (tas['CAO'] !== undefined) oxides['CAO'] = tas['CAO'];
-    if (tas['P2O5'] !== undefined) oxides['P2O5'] = tas['P2O5'];
-    if (tas['MNO'] !== undefined) oxides['MNO'] = tas['MNO'];
-
-    const sample: Sample = {
-      _id: tas.sample_id,
-      sample_id: tas.sample_id,
-      sample_code: tas.sample_code,
-      db: tas.db,
-      material: tas.material,
-      petro: tas.petro,
-      tecto: tas.tecto,
-      geometry: tas.geometry || { type: 'Point', coordinates: [0, 0] },
-      matching_metadata: tas.matching_metadata,
-      references: tas.references,
-      oxides,
-    };
-    sampleMap.set(tas.sample_code, sample);
-  }
-
-  // Merge AFM data
-  for (const afm of data.afm_data) {
-    const existing = sampleMap.get(afm.sample_code);
-    if (existing?.oxides) {
-      existing.oxides['FEOT'] = afm['FEOT'];
-      existing.oxides['MGO'] = afm['MGO'];
-      if (!existing.oxides['NA2O']) existing.oxides['NA2O'] = afm['NA2O'];
-      if (!existing.oxides['K2O']) existing.oxides['K2O'] = afm['K2O'];
-      if (afm['SIO2'] !== undefined && !existing.oxides['SIO2']) existing.oxides['SIO2'] = afm['SIO2'];
-      if (afm['TIO2'] !== undefined && !existing.oxides['TIO2']) existing.oxides['TIO2'] = afm['TIO2'];
-      if (afm['AL2O3'] !== undefined && !existing.oxides['AL2O3']) existing.oxides['AL2O3'] = afm['AL2O3'];
-      if (afm['CAO'] !== undefined && !existing.oxides['CAO']) existing.oxides['CAO'] = afm['CAO'];
-      if (afm['P2O5'] !== undefined && !existing.oxides['P2O5']) existing.oxides['P2O5'] = afm['P2O5'];
-      if (afm['MNO'] !== undefined && !existing.oxides['MNO']) existing.oxides['MNO'] = afm['MNO'];
-    } else {
-      // Sample only in AFM data
-      const oxides: Record<string, number> = {
-        'FEOT': afm['FEOT'],
-        'MGO': afm['MGO'],
-        'NA2O': afm['NA2O'],
-        'K2O': afm['K2O'],
-      };
-      if (afm['SIO2'] !== undefined) oxides['SIO2'] = afm['SIO2'];
-      if (afm['TIO2'] !== undefined) oxides['TIO2'] = afm['TIO2'];
-      if (afm['AL2O3'] !== undefined) oxides['AL2O3'] = afm['AL2O3'];
-      if (afm['CAO'] !== undefined) oxides['CAO'] = afm['CAO'];
-      if (afm['P2O5'] !== undefined) oxides['P2O5'] = afm['P2O5'];
-      if (afm['MNO'] !== undefined) oxides['MNO'] = afm['MNO'];
-
-      const sample: Sample = {
-        _id: afm.sample_id,
-        sample_id: afm.sample_id,
-        sample_code: afm.sample_code,
-        db: afm.db,
-        material: afm.material,
-        petro: afm.petro,
-        tecto: afm.tecto,
-        geometry: afm.geometry || { type: 'Point', coordinates: [0, 0] },
-        matching_metadata: afm.matching_metadata,
-        references: afm.references,
-        oxides,
-      };
-      sampleMap.set(afm.sample_code, sample);
-    }
-  }
-
-  return Array.from(sampleMap.values());
-};
+import { addWholeRockType, filterSamplesByConfidence } from '../utils/confidence';
+import { transformAllSamples, transformToSamples } from '../utils/chemicalAnalysis';
+import type { ChemicalAnalysisData } from '../utils/chemicalAnalysis';
+import { loadVolcanoDirectory } from '../api/volcanoes';
+import type { VolcanoDirectoryEntry } from '../api/volcanoes';
 
 /**
  * AnalyzeVolcanoPage - Comprehensive chemical analysis for a selected volcano
@@ -221,7 +30,8 @@ const transformToSamples = (data: ChemicalAnalysisData): Sample[] => {
  */
 const AnalyzeVolcanoPage: React.FC = () => {
   const [volcanoNames, setVolcanoNames] = useState<string[]>([]);
-  const [volcanoes, setVolcanoes] = useState<Array<{ volcano_number: number; volcano_name: string }>>([]);
+  const volcanoNameIndex = useMemo(() => buildNameSearchIndex(volcanoNames), [volcanoNames]);
+  const [volcanoByName, setVolcanoByName] = useState<Map<string, VolcanoDirectoryEntry>>(() => new Map());
   const [selectedVolcano, setSelectedVolcano] = useState<string>('');
   const [searchInput, setSearchInput] = useState('');
   const [showSuggestions, setShowSuggestions] = useState(false);
@@ -242,14 +52,9 @@ const AnalyzeVolcanoPage: React.FC = () => {
   useEffect(() => {
     const loadVolcanoes = async () => {
       try {
-        const response = await fetch('/api/volcanoes/summary');
-        const data = await response.json();
-        setVolcanoes(data.data || []);
-        const names = (data.data as Array<{volcano_name: string}>)
-          .map(v => v.volcano_name)
-          .filter(Boolean)
-          .sort((a, b) => a.localeCompare(b));
-        setVolcanoNames(names);
+        const directory = await loadVolcanoDirectory();
+        setVolcanoByName(directory.byName);
+        setVolcanoNames(directory.names);
       } catch (err) {
         console.error('Failed to load volcanoes:', err);
       }
@@ -257,6 +62,13 @@ const AnalyzeVolcanoPage: React.FC = () => {
     loadVolcanoes();
   }, []);
 
+  // Resolve the selected name to its volcano once; both data effects below share it
+  // instead of each scanning the full volcano list
+  const selectedVolcanoEntry = useMemo(
+    () => volcanoByName.get(selectedVolcano),
+    [volcanoByName, selectedVolcano]
+  );
+
   // Fetch chemical analysis data when volcano is selected
   useEffect(() => {
     if (!selectedVolcano) {
@@ -271,7 +83,7 @@ const AnalyzeVolcanoPage: React.FC = () => {
       
       try {
         // Find volcano number from name
-        const volcano = volcanoes.find(v => v.volcano_name === selectedVolcano);
+        const volcano = selectedVolcanoEntry;
         if (!volcano) {
           throw new Error('Volcano not found');
         }
@@ -304,7 +116,7 @@ const AnalyzeVolcanoPage: React.FC = () => {
     };
 
     loadChemicalData();
-  }, [selectedVolcano, volcanoes]);
+  }, [selectedVolcano, selectedVolcanoEntry]);
 
   // Fetch samples with VEI when volcano is selected
   useEffect(() => {
@@ -316,7 +128,7 @@ const AnalyzeVolcanoPage: React.FC = () => {
     const loadVEIData = async () => {
       setVeiLoading(true);
       try {
-        const volcano = volcanoes.find(v => v.volcano_name === selectedVolcano);
+        const volcano = selectedVolcanoEntry;
         if (!volcano) return;
 
         const response = await fetch(
@@ -336,11 +148,11 @@ const AnalyzeVolcanoPage: React.FC = () => {
     };
 
     loadVEIData();
-  }, [selectedVolcano, volcanoes]);
+  }, [selectedVolcano, selectedVolcanoEntry]);
 
   // Filter volcano suggestions
   const filteredVolcanoNames = searchInput
-    ? volcanoNames.filter(name => name.toLowerCase().includes(searchInput.toLowerCase())).slice(0, 10)
+    ? searchNames(volcanoNameIndex, searchInput, 10)
     : [];
 
   const handleVolcanoSelect = (volcanoName: string) => {
@@ -349,13 +161,33 @@ const AnalyzeVolcanoPage: React.FC = () => {
     setShowSuggestions(false);
   };
 
-  // Filter samples by confidence level
-  const filteredSamples = filterSamplesByConfidence(samples, selectedConfidenceLevels);
-  const filteredSamplesWithVEI = filterSamplesByConfidence(samplesWithVEI, selectedConfidenceLevels);
+  // Filter samples by confidence level; memoized so re-renders from typing in the
+  // volcano search box do not rescan either sample set
+  const filteredSamples = useMemo(
+    () => filterSamplesByConfidence(samples, selectedConfidenceLevels),
+    [samples, selectedConfidenceLevels]
+  );
+  const filteredSamplesWithVEI = useMemo(
+    () => filterSamplesByConfidence(samplesWithVEI, selectedConfidenceLevels),
+    [samplesWithVEI, selectedConfidenceLevels]
+  );
   
-  // Calculate rock type distribution for WR samples only, filtered by confidence level
-  const wrSamples = filteredSamples.filter(s => s.material === 'WR');
-  const filteredRockTypes = calculateRockTypeDistribution(wrSamples);
+  // Count TAS/AFM-ready samples and the WR-only rock type distribution in a single pass
+  // over the confidence-filtered samples
+  const { filteredRockTypes, tasCount, afmCount } = useMemo(() => {
+    const rockTypes: Record<string, number> = {};
+    let tas = 0;
+    let afm = 0;
+    for (const s of filteredSamples) {
+      const ox = s.oxides;
+      if (ox?.['NA2O'] && ox['K2O']) {
+        if (ox['SIO2']) tas++;
+        if (ox['FEOT'] && ox['MGO']) afm++;
+      }
+      addWholeRockType(rockTypes, s);
+    }
+    return { filteredRockTypes: rockTypes, tasCount: tas, afmCount: afm };
+  }, [filteredSamples]);
 
   const handleDownloadCSV = () => {
     if (filteredSamples.length === 0) return;
@@ -487,7 +319,7 @@ const AnalyzeVolcanoPage: React.FC = () => {
                 <div className="bg-gray-50 rounded-lg p-4 transition-shadow duration-300 hover:shadow-md">
                   <p className="text-sm text-gray-600">TAS Data Points</p>
                   <p className="text-2xl font-bold text-gray-900">
-                    {filteredSamples.filter(s => s.oxides?.['SIO2'] && s.oxides?.['NA2O'] && s.oxides?.['K2O']).length}
+                    {tasCount}
                   </p>
                   {filteredSamples.length < samples.length && (
                     <p className="text-xs text-gray-500 mt-1">of {chemicalData.tas_data.length} total</p>
@@ -496,7 +328,7 @@ const AnalyzeVolcanoPage: React.FC = () => {
                 <div className="bg-gray-50 rounded-lg p-4 transition-shadow duration-300 hover:shadow-md">
                   <p className="text-sm text-gray-600">AFM Data Points</p>
                   <p className="text-2xl font-bold text-gray-900">
-                    {filteredSamples.filter(s => s.oxides?.['FEOT'] && s.oxides?.['MGO'] && s.oxides?.['NA2O'] && s.oxides?.['K2O']).length}
+                    {afmCount}
                   </p>
                   {filteredSamples.length < samples.length && (
                     <p className="text-xs text-gray-500 mt-1">of {chemicalData.afm_data.length} total</p>
@@ -1,9 +1,11 @@
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useMemo } from 'react';
 import { Mountain, Download } from 'lucide-react';
 import { VEIBarChart } from '../components/Charts/VEIBarChart';
-import { fetchVolcanoVEIDistribution, fetchVolcanoRockTypes } from '../api/volcanoes';
+import { fetchVolcanoVEIDistribution, fetchVolcanoRockTypes, loadVolcanoDirectory } from '../api/volcanoes';
+import type { VolcanoDirectoryEntry } from '../api/volcanoes';
 import { RockTypeBadges } from '../components/RockTypeBadges';
 import { showError, showSuccess } from '../utils/toast';
+import { buildNameSearchIndex, searchNames } from '../utils/nameSearch';
 import { useKeyboardShortcuts, commonShortcuts } from '../hooks/useKeyboardShortcuts';
 import { CardSkeleton, ChartSkeleton } from '../components/LoadingSkeleton';
 import { EmptyState } from '../components/EmptyState';
@@ -22,7 +24,8 @@ const VOLCANO_COLORS = ['#DC2626', '#2563EB', '#16A34A']; // red, blue, green
 
 const CompareVEIPage = () => {
   const [volcanoNames, setVolcanoNames] = useState<string[]>([]);
-  const [volcanoes, setVolcanoes] = useState<Array<{ volcano_number: number; volcano_name: string }>>([]);
+  const volcanoNameIndex = useMemo(() => buildNameSearchIndex(volcanoNames), [volcanoNames]);
+  const [volcanoByName, setVolcanoByName] = useState<Map<string, VolcanoDirectoryEntry>>(() => new Map());
   const [searchInputs, setSearchInputs] = useState<string[]>(['', '']);
   const [showSuggestions, setShowSuggestions] = useState<boolean[]>([false, false]);
   
@@ -35,14 +38,9 @@ const CompareVEIPage = () => {
   useEffect(() => {
     const loadVolcanoes = async () => {
       try {
-        const response = await fetch('/api/volcanoes/summary');
-        const data = await response.json();
-        setVolcanoes(data.data || []);
-        const names = (data.data as Array<{volcano_name: string}>)
-          .map(v => v.volcano_name)
-          .filter(Boolean)
-          .sort((a, b) => a.localeCompare(b));
-        setVolcanoNames(names);
+        const directory = await loadVolcanoDirectory();
+        setVolcanoByName(directory.byName);
+        setVolcanoNames(directory.names);
       } catch (err) {
         console.error('Failed to load volcanoes:', err);
       }
@@ -209,30 +207,22 @@ const CompareVEIPage = () => {
                     const newInputs = [...searchInputs];
                     newInputs[index] = e.target.value;
                     setSearchInputs(newInputs);
-                    const newShow = [...showSuggestions];
-                    newShow[index] = true;
-                    setShowSuggestions(newShow);
+                    setShowSuggestions(prev => prev.map((v, i) => (i === index ? true : v)));
                   }}
                   onFocus={() => {
-                    const newShow = [...showSuggestions];
-                    newShow[index] = true;
-                    setShowSuggestions(newShow);
+                    setShowSuggestions(prev => prev.map((v, i) => (i === index ? true : v)));
                   }}
                   onBlur={() => {
                     setTimeout(() => {
-                      const newShow = [...showSuggestions];
-                      newShow[index] = false;
-                      setShowSuggestions(newShow);
+                      setShowSuggestions(prev => prev.map((v, i) => (i === index ? false : v)));
                     }, 200);
                   }}
                 />
                 {showSuggestions[index] && searchInputs[index] && (
                   <div className="absolute z-10 w-full mt-1 bg-white border border-gray-300 rounded-lg shadow-lg max-h-60 overflow-y-auto">
-                    {volcanoNames
-                      .filter(name => name.toLowerCase().includes(searchInputs[index].toLowerCase()))
-                      .slice(0, 10)
+                    {searchNames(volcanoNameIndex, searchInputs[index], 10)
                       .map((name) => {
-                        const volcano = volcanoes.find(v => v.volcano_name === name);
+                        const volcano = volcanoByName.get(name);
                         return (
                           <button
                             key={name}
@@ -242,9 +232,7 @@ const CompareVEIPage = () => {
                                 const newInputs = [...searchInputs];
                                 newInputs[index] = name;
                                 setSearchInputs(newInputs);
-                                const newShow = [...showSuggestions];
-                                newShow[index] = false;
-                                setShowSuggestions(newShow);
+                                setShowSuggestions(prev => prev.map((v, i) => (i === index ? false : v)));
                               }
                             }}
                             className="w-full px-4 py-2 text-left hover:bg-blue-50 transition-colors"
@@ -486,16 +474,21 @@ export default CompareVEIPage;
 // Helper Functions
 
 function getVEIRange(veiCounts: Record<string, number>): string {
-  // Normalize VEI keys (handle '1.0' format from API)
-  const numericVEIs = Object.keys(veiCounts)
-    .filter((k) => k !== 'unknown' && veiCounts[k] > 0)
-    .map((k) => Math.floor(Number(k)))  // Convert '1.0' to 1, etc.
-    .filter((n) => !Number.isNaN(n))
-    .sort((a, b) => a - b);
-
-  if (numericVEIs.length === 0) return 'Unknown';
-  if (numericVEIs.length === 1) return `VEI ${numericVEIs[0]}`;
-  return `VEI ${numericVEIs[0]} - ${numericVEIs.at(-1)}`;
+  // Normalize each VEI key once (handle '1.0' format from API) and keep running
+  // bounds; only the two ends of the range are needed, so nothing is sorted
+  let minVEI = Infinity;
+  let maxVEI = -Infinity;
+  for (const [key, count] of Object.entries(veiCounts)) {
+    if (key === 'unknown' || !(count > 0)) continue;
+    const vei = Math.floor(Number(key));  // Convert '1.0' to 1, etc.
+    if (Number.isNaN(vei)) continue;
+    if (vei < minVEI) minVEI = vei;
+    if (vei > maxVEI) maxVEI = vei;
+  }
+
+  if (minVEI === Infinity) return 'Unknown';
+  if (minVEI === maxVEI) return `VEI ${minVEI}`;
+  return `VEI ${minVEI} - ${maxVEI}`;
 }
 
 function getDominantVEI(veiCounts: Record<string, number>): string {
@@ -518,9 +511,17 @@ function getDominantVEI(veiCounts: Record<string, number>): string {
   return `${dominantVEI} (${maxCount} eruptions)`;
 }
 
-function formatDateRange(dateRange?: { start?: string; end?: string }): string {
+function formatDateRange(dateRange?: VEIDistribution['date_range']): string {
   if (!dateRange?.start || !dateRange?.end) return 'Unknown';
   
+  // The backend sends the numeric years, so the ISO strings only need parsing
+  // when talking to an older API that does not include them
+  if (dateRange.start_year !== undefined && dateRange.end_year !== undefined) {
+    const startStr = dateRange.start_year < 0 ? `${Math.abs(dateRange.start_year)} BCE` : String(dateRange.start_year);
+    const endStr = dateRange.end_year < 0 ? `${Math.abs(dateRange.end_year)} BCE` : String(dateRange.end_year);
+    return `${startStr} - ${endStr}`;
+  }
+  
   try {
     // Parse ISO 8601 dates (e.g., "-032-12-31T00:00:00Z" or "2022-11-27T00:00:00Z")
     const startDate = new Date(dateRange.start);
@@ -5,106 +5,19 @@ import { AFMPlot } from '../components/Charts/AFMPlot';
 import { RockTypeDistributionChart } from '../components/Charts/RockTypeDistributionChart';
 import { HarkerDiagrams } from '../components/Charts/HarkerDiagrams';
 import { exportSamplesToCSV } from '../utils/csvExport';
+import { buildNameSearchIndex, searchNames } from '../utils/nameSearch';
 import { useKeyboardShortcuts, commonShortcuts } from '../hooks/useKeyboardShortcuts';
 import { showError } from '../utils/toast';
 import { CardSkeleton } from '../components/LoadingSkeleton';
 import { EmptyState } from '../components/EmptyState';
 import { ConfidenceFilter } from '../components/Filters';
-import type { Sample, MatchingMetadata, TectonicSettingSample, Petro } from '../types';
+import type { Sample } from '../types';
 import type { ConfidenceLevel } from '../utils/confidence';
-import { filterSamplesByConfidence, calculateRockTypeDistribution } from '../utils/confidence';
-
-interface ChemicalAnalysisData {
-  volcano_number: number;
-  volcano_name: string;
-  samples_count: number;
-  tas_data: Array<{
-    sample_code: string;
-    sample_id: string;
-    db: string;
-    petro?: Petro;
-    material: string;
-    tecto?: TectonicSettingSample;
-    geometry?: { type: 'Point'; coordinates: [number, number] };
-    matching_metadata?: MatchingMetadata;
-    references?: string;
-    SIO2: number;
-    NA2O: number;
-    K2O: number;
-    FEOT?: number;
-    MGO?: number;
-    TIO2?: number;
-    AL2O3?: number;
-    CAO?: number;
-    P2O5?: number;
-    MNO?: number;
-  }>;
-  afm_data: Array<{
-    sample_code: string;
-    sample_id: string;
-    db: string;
-    petro?: Petro;
-    material: string;
-    tecto?: TectonicSettingSample;
-    geometry?: { type: 'Point'; coordinates: [number, number] };
-    matching_metadata?: MatchingMetadata;
-    references?: string;
-    FEOT: number;
-    NA2O: number;
-    K2O: number;
-    MGO: number;
-    SIO2?: number;
-    TIO2?: number;
-    AL2O3?: number;
-    CAO?: number;
-    P2O5?: number;
-    MNO?: number;
-  }>;
-  harker_data?: Array<{
-    sample_code: string;
-    sample_id: string;
-    db: string;
-    SIO2: number;
-    petro?: Petro;
-    material: string;
-    tecto?: TectonicSettingSample;
-    geometry?: { type: 'Point'; coordinates: [number, number] };
-    matching_metadata?: MatchingMetadata;
-    references?: string;
-    TIO2?: number;
-    AL2O3?: number;
-    FEOT?: number;
-    MGO?: number;
-    CAO?: number;
-    NA2O?: number;
-    K2O?: number;
-    P2O5?: number;
-    MNO?: number;
-  }>;
-  all_samples?: Array<{
-    sample_code: string;
-    sample_id: string;
-    db: string;
-    petro?: Petro;
-    material: string;
-    tecto?: TectonicSettingSample;
-    geometry?: { type: 'Point'; coordinates: [number, number] };
-    matching_metadata?: MatchingMetadata;
-    references?: string;
-    SIO2?: number;
-    NA2O?: number;
-    K2O?: number;
-    FEOT?: number;
-    MGO?: number;
-    TIO2?: number;
-    AL2O3?: number;
-    'CAO'?: number;
-    'P2O5'?: number;
-    'MNO'?: number;
-  }>;
-  rock_types: Record<string, number>;
-  rock_types_wr: Record<string, number>;  // Rock types for Whole Rock (WR) samples only
-}
+import { addWholeRockType, filterSamplesByConfidence } from '../utils/confidence';
+import { transformAllSamples, transformToSamples } from '../utils/chemicalAnalysis';
+import type { ChemicalAnalysisData } from '../utils/chemicalAnalysis';
+import { loadVolcanoDirectory } from '../api/volcanoes';
+import type { VolcanoDirectoryEntry } from '../api/volcanoes';
 
 interface VolcanoSelection {
   name: string;
@@ -117,130 +30,10 @@ interface VolcanoSelection {
 
 const VOLCANO_COLORS = ['#DC2626', '#2563EB', '#16A34A'];
 
-/**
- * Transform all_samples array (includes ALL samples regardless of oxide completeness)
- */
-const transformAllSamples = (
-  allSamples: ChemicalAnalysisData['all_samples'],
-): Sample[] => {
-  if (!allSamples) return [];
-  
-  return allSamples.map(sample => {
-    const oxides: Record<string, number> = {};
-    if (sample['SIO2'] !== undefined) oxides['SIO2'] = sample['SIO2'];
-    if (sample['NA2O'] !== undefined) oxides['NA2O'] = sample['NA2O'];
-    if (sample['K2O'] !== undefined) oxides['K2O'] = sample['K2O'];
-    if (sample['FEOT'] !== undefined) oxides['FEOT'] = sample['FEOT'];
-    if (sample['MGO'] !== undefined) oxides['MGO'] = sample['MGO'];
-    if (sample['TIO2'] !== undefined) oxides['TIO2'] = sample['TIO2'];
-    if (sample['AL2O3'] !== undefined) oxides['AL2O3'] = sample['AL2O3'];
-    if (sample['CAO'] !== undefined) oxides['CAO'] = sample['CAO'];
-    if (sample['P2O5'] !== undefined) oxides['P2O5'] = sample['P2O5'];
-    if (sample['MNO'] !== undefined) oxides['MNO'] = sample['MNO'];
-
-    return {
-      _id: sample.sample_id,
-      sample_id: sample.sample_id,
-      sample_code: sample.sample_code,
-      db: sample.db,
-      material: sample.material,
-      petro: sample.petro,
-      tecto: sample.tecto,
-      geometry: sample.geometry || { type: 'Point', coordinates: [0, 0] },
-      matching_metadata: sample.matching_metadata,
-      references: sample.references,
-      oxides: Object.keys(oxides).length > 0 ? oxides : undefined,
-    };
-  });
-};
-
-/**
- * Transform backend chemical analysis data to Sample[] format
- * Now preserves MongoDB field names without conversion
- */
-const transformToSamples = (data: ChemicalAnalysisData): Sample[] => {
-  const sampleMap = new Map<string, Sample>();
-
-  for (const tas of data.tas_data) {
-    const oxides: Record<string, number> = {
-      'SIO2': tas['SIO2'],
-      'NA2O': tas['NA2O'],
-      'K2O': tas['K2O'],
-    };
-    if (tas['FEOT'] !== undefined) oxides['FEOT'] = tas['FEOT'];
-    if (tas['MGO'] !== undefined) oxides['MGO'] = tas['MGO'];
-    if (tas['TIO2'] !== undefined) oxides['TIO2'] = tas['TIO2'];
-    if (tas['AL2O3'] !== undefined) oxides['AL2O3'] = tas['AL2O3'];
-    if (tas['CAO'] !== undefined) oxides['CAO'] = tas['CAO'];
-    if (tas['P2O5'] !== undefined) oxides['P2O5'] = tas['P2O5'];
-    if (tas['MNO'] !== undefined) oxides['MNO'] = tas['MNO'];
-
-    const sample: Sample = {
-      _id: tas.sample_id,
-      sample_id: tas.sample_id,
-      sample_code: tas.sample_code,
-      db: tas.db,
-      material: tas.material,
-      petro: tas.petro,
-      tecto: tas.tecto,
-      geometry: tas.geometry || { type: 'Point', coordinates: [0, 0] },
-      matching_metadata: tas.matching_metadata,
-      references: tas.references,
-      oxides,
-    };
-    sampleMap.set(tas.sample_code, sample);
-  }
-
-  for (const afm of data.afm_data) {
-    const existing = sampleMap.get(afm.sample_code);
-    if (existing?.oxides) {
-      existing.oxides['FEOT'] = afm['FEOT'];
-      existing.oxides['MGO'] = afm['MGO'];
-      if (!existing.oxides['NA2O']) existing.oxides['NA2O'] = afm['NA2O'];
-      if (!existing.oxides['K2O']) existing.oxides['K2O'] = afm['K2O'];
-      if (afm['SIO2'] !== undefined && !existing.oxides['SIO2']) existing.oxides['SIO2'] = afm['SIO2'];
-      if (afm['TIO2'] !== undefined && !existing.oxides['TIO2']) existing.oxides['TIO2'] = afm['TIO2'];
-      if (afm['AL2O3'] !== undefined && !existing.oxides['AL2O3']) existing.oxides['AL2O3'] = afm['AL2O3'];
-      if (afm['CAO'] !== undefined && !existing.oxides['CAO']) existing.oxides['CAO'] = afm['CAO'];
-      if (afm['P2O5'] !== undefined && !existing.oxides['P2O5']) existing.oxides['P2O5'] = afm['P2O5'];
-      if (afm['MNO'] !== undefined && !existing.oxides['MNO']) existing.oxides['MNO'] = afm['MNO'];
-    } else {
-      const oxides: Record<string, number> = {
-        'FEOT': afm['FEOT'],
-        'MGO': afm['MGO'],
-        'NA2O': afm['NA2O'],
-        'K2O': afm['K2O'],
-      };
-      if (afm['SIO2'] !== undefined) oxides['SIO2'] = afm['SIO2'];
-      if (afm['TIO2'] !== undefined) oxides['TIO2'] = afm['TIO2'];
-      if (afm['AL2O3'] !== undefined) oxides['AL2O3'] = afm['AL2O3'];
-      if (afm['CAO'] !== undefined) oxides['CAO'] = afm['CAO'];
-      if (afm['P2O5'] !== undefined) oxides['P2O5'] = afm['P2O5'];
-      if (afm['MNO'] !== undefined) oxides['MNO'] = afm['MNO'];
-
-      const sample: Sample = {
-        _id: afm.sample_id,
-        sample_id: afm.sample_id,
-        sample_code: afm.sample_code,
-        db: afm.db,
-        material: afm.material,
-        petro: afm.petro,
-        tecto: afm.tecto,
-        geometry: afm.geometry || { type: 'Point', coordinates: [0, 0] },
-        matching_metadata: afm.matching_metadata,
-        references: afm.references,
-        oxides,
-      };
-      sampleMap.set(afm.sample_code, sample);
-    }
-  }
-
-  return Array.from(sampleMap.values());
-};
-
 const CompareVolcanoesPage: React.FC = () => {
   const [volcanoNames, setVolcanoNames] = useState<string[]>([]);
-  const [volcanoes, setVolcanoes] = useState<Array<{ volcano_number: number; volcano_name: string }>>([]);
+  const volcanoNameIndex = useMemo(() => buildNameSearchIndex(volcanoNames), [volcanoNames]);
+  const [volcanoByName, setVolcanoByName] = useState<Map<string, VolcanoDirectoryEntry>>(() => new Map());
   
   const [selections, setSelections] = useState<VolcanoSelection[]>([
     { name: '', number: 0, data: null, samples: [], loading: false, error: null },
@@ -257,14 +50,9 @@ const CompareVolcanoesPage: React.FC = () => {
   useEffect(() => {
     const loadVolcanoes = async () => {
       try {
-        const response = await fetch('/api/volcanoes/summary');
-        const data = await response.json();
-        setVolcanoes(data.data || []);
-        const names = (data.data as Array<{volcano_name: string}>)
-          .map(v => v.volcano_name)
-          .filter(Boolean)
-          .sort((a, b) => a.localeCompare(b));
-        setVolcanoNames(names);
+        const directory = await loadVolcanoDirectory();
+        setVolcanoByName(directory.byName);
+        setVolcanoNames(directory.names);
       } catch (err) {
         console.error('Failed to load volcanoes:', err);
       }
@@ -273,7 +61,7 @@ const CompareVolcanoesPage: React.FC = () => {
   }, []);
 
   const handleVolcanoSelect = async (index: number, volcanoName: string) => {
-    const volcano = volcanoes.find(v => v.volcano_name === volcanoName);
+    const volcano = volcanoByName.get(volcanoName);
     if (!volcano) return;
 
     // Update search input
@@ -281,9 +69,7 @@ const CompareVolcanoesPage: React.FC = () => {
     newSearchInputs[index] = volcanoName;
     setSearchInputs(newSearchInputs);
 
-    const newShowSuggestions = [...showSuggestions];
-    newShowSuggestions[index] = false;
-    setShowSuggestions(newShowSuggestions);
+    setShowSuggestions(prev => prev.map((v, i) => (i === index ? false : v)));
 
     // Update selection with loading state
     const newSelections = [...selections];
@@ -346,9 +132,7 @@ const CompareVolcanoesPage: React.FC = () => {
 
   const getFilteredVolcanoNames = (index: number) => {
     if (!searchInputs[index]) return [];
-    return volcanoNames
-      .filter(name => name.toLowerCase().includes(searchInputs[index].toLowerCase()))
-      .slice(0, 10);
+    return searchNames(volcanoNameIndex, searchInputs[index], 10);
   };
 
   const handleDownloadCSV = () => {
@@ -373,23 +157,6 @@ const CompareVolcanoesPage: React.FC = () => {
   const selectedCount = selections.filter(s => s.name).length;
   const isLoading = selections.some(s => s.loading);
 
-  // Memoize expensive chart data preparations to prevent unnecessary re-renders
-  const rockTypeChartData = useMemo(() => {
-    return selections
-      .filter((v: VolcanoSelection) => v.samples && v.samples.length > 0)
-      .map((v: VolcanoSelection, idx: number) => {
-        // Filter by confidence level AND material=WR for accurate rock type comparison
-        const filteredSamples = filterSamplesByConfidence(v.samples, selectedConfidenceLevels);
-        const wrSamples = filteredSamples.filter(s => s.material === 'WR');
-        const rockTypes = calculateRockTypeDistribution(wrSamples);
-        return {
-          volcanoName: v.name,
-          rockTypes,
-          color: VOLCANO_COLORS[idx]
-        };
-      })
-      .filter(v => Object.keys(v.rockTypes).length > 0);
-  }, [selections, selectedConfidenceLevels]);
 
   const harkerChartData = useMemo(() => {
     return selections
@@ -402,14 +169,38 @@ const CompareVolcanoesPage: React.FC = () => {
   }, [selections, selectedConfidenceLevels]);
 
   // Memoize sampled data for TAS/AFM plots to improve performance with large datasets
-  // Apply confidence filtering
+  // Apply confidence filtering, then count the plottable samples and the whole-rock (WR)
+  // rock types of each volcano in one pass, so the selector cards, the plot headers and
+  // the rock type chart do not rescan the samples
   const sampledSelectionsData = useMemo(() => {
-    return selections.map(selection => ({
-      ...selection,
-      sampledSamples: filterSamplesByConfidence(selection.samples, selectedConfidenceLevels)
-    }));
+    return selections.map(selection => {
+      const sampledSamples = filterSamplesByConfidence(selection.samples, selectedConfidenceLevels);
+      const wrRockTypes: Record<string, number> = {};
+      let tasCount = 0;
+      let afmCount = 0;
+      for (const s of sampledSamples) {
+        addWholeRockType(wrRockTypes, s);
+        const oxides = s.oxides;
+        if (!oxides?.['NA2O'] || !oxides['K2O']) continue;
+        if (oxides['SIO2']) tasCount++;
+        if (oxides['FEOT'] && oxides['MGO']) afmCount++;
+      }
+      return { ...selection, sampledSamples, wrRockTypes, tasCount, afmCount };
+    });
   }, [selections, selectedConfidenceLevels]);
 
+  // Rock type comparison uses WR samples only, for accurate rock type comparison
+  const rockTypeChartData = useMemo(() => {
+    return sampledSelectionsData
+      .filter(v => v.samples && v.samples.length > 0)
+      .map((v, idx) => ({
+        volcanoName: v.name,
+        rockTypes: v.wrRockTypes,
+        color: VOLCANO_COLORS[idx]
+      }))
+      .filter(v => Object.keys(v.rockTypes).length > 0);
+  }, [sampledSelectionsData]);
+
   return (
     <div className="min-h-screen bg-gray-50">
       {/* Header */}
@@ -469,20 +260,14 @@ const CompareVolcanoesPage: React.FC = () => {
                     const newInputs = [...searchInputs];
                     newInputs[index] = e.target.value;
                     setSearchInputs(newInputs);
-                    const newShow = [...showSuggestions];
-                    newShow[index] = true;
-                    setShowSuggestions(newShow);
+                    setShowSuggestions(prev => prev.map((v, i) => (i === index ? true : v)));
                   }}
                   onFocus={() => {
-                    const newShow = [...showSuggestions];
-                    newShow[index] = true;
-                    setShowSuggestions(newShow);
+                    setShowSuggestions(prev => prev.map((v, i) => (i === index ? true : v)));
                   }}
                   onBlur={() => {
                     setTimeout(() => {
-                      const newShow = [...showSuggestions];
-                      newShow[index] = false;
-                      setShowSuggestions(newShow);
+                      setShowSuggestions(prev => prev.map((v, i) => (i === index ? false : v)));
                     }, 200);
                   }}
                   placeholder="Type to search volcanoes..."
@@ -517,9 +302,7 @@ const CompareVolcanoesPage: React.FC = () => {
               )}
 
               {selection.data && (() => {
-                const filteredSamples = filterSamplesByConfidence(selection.samples, selectedConfidenceLevels);
-                const tasCount = filteredSamples.filter(s => s.oxides?.['SIO2'] && s.oxides?.['NA2O'] && s.oxides?.['K2O']).length;
-                const afmCount = filteredSamples.filter(s => s.oxides?.['FEOT'] && s.oxides?.['MGO'] && s.oxides?.['NA2O'] && s.oxides?.['K2O']).length;
+                const { sampledSamples: filteredSamples, tasCount, afmCount } = sampledSelectionsData[index];
                 return (
                   <div className="mt-4 grid grid-cols-3 gap-3">
                     <div className="bg-gray-50 rounded p-2">
@@ -613,7 +396,7 @@ const CompareVolcanoesPage: React.FC = () => {
                     <div className="bg-gray-50 rounded p-3">
                       <p className="text-xs text-gray-600 mb-1">TAS Data</p>
                       <p className="text-xl font-bold" style={{ color: VOLCANO_COLORS[index] }}>
-                        {selection.sampledSamples.filter(s => s.oxides?.['SIO2'] && s.oxides?.['NA2O'] && s.oxides?.['K2O']).length}
+                        {selection.tasCount}
                       </p>
                       {selection.sampledSamples.length < selection.samples.length && (
                         <p className="text-xs text-gray-500">of {selection.data?.tas_data.length || 0} total</p>
@@ -622,7 +405,7 @@ const CompareVolcanoesPage: React.FC = () => {
                     <div className="bg-gray-50 rounded p-3">
                       <p className="text-xs text-gray-600 mb-1">AFM Data</p>
                       <p className="text-xl font-bold" style={{ color: VOLCANO_COLORS[index] }}>
-                        {selection.sampledSamples.filter(s => s.oxides?.['FEOT'] && s.oxides?.['MGO'] && s.oxides?.['NA2O'] && s.oxides?.['K2O']).length}
+                        {selection.afmCount}
                       </p>
                       {selection.sampledSamples.length < selection.samples.length && (
                         <p className="text-xs text-gray-500">of {selection.data?.afm_data.length || 0} total</p>
@@ -13,8 +13,8 @@ import { ErrorMessage } from '../components/Common/ErrorMessage';
 import { exportSamplesToCSV } from '../utils/csvExport';
 import { useKeyboardShortcuts, commonShortcuts } from '../hooks/useKeyboardShortcuts';
 import { formatBboxForAPI } from '../hooks/useBboxDraw';
-import { fetchSamples } from '../api/samples';
-import type { Volcano, Sample, SampleFilters, VolcanoFilters, BBox } from '../types';
+import { fetchSamples, fetchSampleClusters } from '../api/samples';
+import type { Volcano, Sample, SampleCluster, SampleFilters, VolcanoFilters, BBox } from '../types';
 import type { ConfidenceLevel } from '../utils/confidence';
 
 const INITIAL_VIEWPORT = {
@@ -23,6 +23,10 @@ const INITIAL_VIEWPORT = {
   zoom: 2,
 };
 
+// Below this zoom level, filtered samples outside a bbox or volcano selection are
+// shown as server-side grid clusters rather than downloading every sample
+const CLUSTER_MAX_ZOOM = 8;
+
 type BboxDrawMode = 'none' | 'primary' | 'comparison';
 
 interface APIErrorResponse {
@@ -56,6 +60,7 @@ const MapPage = () => {
   const [loadingBboxSamples, setLoadingBboxSamples] = useState(false);
   const [volcanoSamplesError, setVolcanoSamplesError] = useState<string | null>(null);
   const [bboxSamplesError, setBboxSamplesError] = useState<string | null>(null);
+  const [sampleClusters, setSampleClusters] = useState<SampleCluster[]>([]);
 
   // Chart panel state
   const [chartPanelOpen, setChartPanelOpen] = useState(false);
@@ -108,21 +113,25 @@ const MapPage = () => {
   const samples = useMemo(() => {
     // If we have both, merge and deduplicate by sample _id
     if (volcanoSamples.length > 0 && bboxSamples.length > 0) {
-      const sampleMap = new Map<string, Sample>();
-      
-      // Add volcano samples first
-      volcanoSamples.forEach(sample => {
-        if (sample._id) sampleMap.set(sample._id, sample);
-      });
-      
-      // Add bbox samples (won't overwrite duplicates)
-      bboxSamples.forEach(sample => {
-        if (sample._id && !sampleMap.has(sample._id)) {
-          sampleMap.set(sample._id, sample);
+      // Volcano samples come first and are kept as they are; bbox samples are appended
+      // to the same array unless their _id was already seen, so only ids are hashed and
+      // the merged list is not copied back out of a map
+      const seenIds = new Set<string>();
+      const merged: Sample[] = [];
+      for (const sample of volcanoSamples) {
+        if (sample._id && !seenIds.has(sample._id)) {
+          seenIds.add(sample._id);
+          merged.push(sample);
         }
-      });
+      }
+      for (const sample of bboxSamples) {
+        if (sample._id && !seenIds.has(sample._id)) {
+          seenIds.add(sample._id);
+          merged.push(sample);
+        }
+      }
       
-      return Array.from(sampleMap.values());
+      return merged;
     }
     
     // If only one source has samples, return that
@@ -225,13 +234,49 @@ const MapPage = () => {
     fetchBboxSamples();
   }, [currentBbox, sampleFilters]);
   
+  const hasNonLimitFilters = useMemo(
+    () => Object.keys(sampleFilters).some(
+      key => key !== 'limit' && key !== 'offset' && key !== 'bbox' && key !== 'volcano_number'
+    ),
+    [sampleFilters]
+  );
+
+  // Zoomed-out overview of filtered samples: while no bbox or volcano selection
+  // asks for full sample records, only per-cell counts are fetched for the
+  // current zoom level
+  const clusterZoom = Math.floor(viewport.zoom);
+  const showSampleClusters = showSamplePoints
+    && hasNonLimitFilters
+    && !currentBbox
+    && !volcanoFilters.volcano_name
+    && clusterZoom < CLUSTER_MAX_ZOOM;
+
+  useEffect(() => {
+    if (!showSampleClusters) {
+      setSampleClusters([]);
+      return;
+    }
+
+    // Ignore responses for zoom levels or filters that are no longer current
+    let cancelled = false;
+    fetchSampleClusters(clusterZoom, sampleFilters)
+      .then((response) => {
+        if (!cancelled) setSampleClusters(response.data);
+      })
+      .catch((error: unknown) => {
+        if (cancelled) return;
+        console.error('Error fetching sample clusters:', error);
+        setSampleClusters([]);
+      });
+
+    return () => {
+      cancelled = true;
+    };
+  }, [showSampleClusters, clusterZoom, sampleFilters]);
+  
   // Detect when user applies filters from FilterPanel (excluding just limit changes)
   // Also detect when filters are CLEARED (empty object) to prevent unnecessary fetches
   useEffect(() => {
-    const hasNonLimitFilters = Object.keys(sampleFilters).some(
-      key => key !== 'limit' && key !== 'offset' && key !== 'bbox' && key !== 'volcano_number'
-    );
-    
     if (hasNonLimitFilters && !hasAppliedFilters) {
       // User applied filters - allow fetching
       setHasAppliedFilters(true);
@@ -239,7 +284,7 @@ const MapPage = () => {
       // Filters were cleared AND no bbox/volcano - prevent fetching
       setHasAppliedFilters(false);
     }
-  }, [sampleFilters, hasAppliedFilters, currentBbox, volcanoFilters.volcano_name]);
+  }, [hasNonLimitFilters, hasAppliedFilters, currentBbox, volcanoFilters.volcano_name]);
 
   // Loading state
   const isLoading = samplesLoading || volcanoesLoading || tectonicLoading;
@@ -273,11 +318,8 @@ const MapPage = () => {
 
   // Handle adding sample to selection
   const handleAddToSelection = (sample: Sample) => {
-    // Check if sample is already in selection
-    const isAlreadySelected = selectedSamples.some(s => s._id === sample._id);
-    if (!isAlreadySelected) {
-      addSelectedSamples([sample]);
-    }
+    // The selection store skips samples that are already selected
+    addSelectedSamples([sample]);
   };
 
   // Handle viewport changes from map
@@ -535,6 +577,7 @@ const MapPage = () => {
       {/* Map Component */}
       <VolcanoMap
         samples={samples}
+        sampleClusters={sampleClusters}
         volcanoes={volcanoes}
         tectonicBoundaries={tectonicBoundaries}
         viewState={viewport}
@@ -1,12 +1,14 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo } from 'react';
 import { Clock, Download, TrendingUp } from 'lucide-react';
 import EruptionTimelinePlot from '../components/Charts/EruptionTimelinePlot';
 import EruptionFrequencyChart from '../components/Charts/EruptionFrequencyChart';
 import { SampleTimelinePlot } from '../components/Charts/SampleTimelinePlot';
-import { fetchVolcanoSampleTimeline } from '../api/volcanoes';
-import { dateInfoToYear, getDateRange, formatYearRange } from '../utils/dateUtils';
+import { fetchVolcanoSampleTimeline, loadVolcanoDirectory } from '../api/volcanoes';
+import type { VolcanoDirectoryEntry } from '../api/volcanoes';
+import { getDateRange, formatYearRange } from '../utils/dateUtils';
 import { showError } from '../utils/toast';
 import { exportEruptionsToCSV } from '../utils/csvExport';
+import { buildNameSearchIndex, searchNames } from '../utils/nameSearch';
 import { useKeyboardShortcuts } from '../hooks/useKeyboardShortcuts';
 import { ChartSkeleton, CardSkeleton } from '../components/LoadingSkeleton';
 import { EmptyState } from '../components/EmptyState';
@@ -24,7 +26,8 @@ import type { Eruption, SampleTimelineResponse } from '../types';
  */
 const TimelinePage: React.FC = () => {
   const [volcanoNames, setVolcanoNames] = useState<string[]>([]);
-  const [volcanoes, setVolcanoes] = useState<Array<{ volcano_number: number; volcano_name: string }>>([]);
+  const volcanoNameIndex = useMemo(() => buildNameSearchIndex(volcanoNames), [volcanoNames]);
+  const [volcanoByName, setVolcanoByName] = useState<Map<string, VolcanoDirectoryEntry>>(() => new Map());
   const [selectedVolcano, setSelectedVolcano] = useState<string>('');
   const [searchInput, setSearchInput] = useState('');
   const [showSuggestions, setShowSuggestions] = useState(false);
@@ -40,14 +43,9 @@ const TimelinePage: React.FC = () => {
   useEffect(() => {
     const loadVolcanoes = async () => {
       try {
-        const response = await fetch('/api/volcanoes/summary');
-        const data = await response.json();
-        setVolcanoes(data.data || []);
-        const names = (data.data as Array<{ volcano_name: string }>)
-          .map((v) => v.volcano_name)
-          .filter(Boolean)
-          .sort((a, b) => a.localeCompare(b));
-        setVolcanoNames(names);
+        const directory = await loadVolcanoDirectory();
+        setVolcanoByName(directory.byName);
+        setVolcanoNames(directory.names);
       } catch (err) {
         const errorMessage = err instanceof Error ? err.message : 'Failed to load volcanoes';
         console.error('Failed to load volcanoes:', err);
@@ -72,7 +70,7 @@ const TimelinePage: React.FC = () => {
 
       try {
         // Find volcano number from name
-        const volcano = volcanoes.find((v) => v.volcano_name === selectedVolcano);
+        const volcano = volcanoByName.get(selectedVolcano);
         if (!volcano) {
           throw new Error('Volcano not found');
         }
@@ -103,29 +101,41 @@ const TimelinePage: React.FC = () => {
     };
 
     loadData();
-  }, [selectedVolcano, volcanoes]);
-
-  // Calculate statistics
-  const eruptionsWithDates = eruptions.filter((e) => dateInfoToYear(e.start_date) !== null);
-  const dateRange = getDateRange(eruptionsWithDates.map((e) => e.start_date));
-  const eruptionsWithVEI = eruptions.filter((e) => e.vei !== null && e.vei !== undefined);
-  const avgVEI = eruptionsWithVEI.length > 0
-    ? (eruptionsWithVEI.reduce((sum, e) => sum + (e.vei || 0), 0) / eruptionsWithVEI.length).toFixed(1)
-    : 'N/A';
-  
-  // Calculate eruption rate
-  let eruptionRate = 'N/A';
-  if (dateRange && eruptionsWithDates.length > 1) {
-    const yearSpan = dateRange.max - dateRange.min;
-    if (yearSpan > 0) {
-      const rate = (eruptionsWithDates.length / yearSpan) * 100; // per century
-      eruptionRate = `${rate.toFixed(2)} per century`;
+  }, [selectedVolcano, volcanoByName]);
+
+  // Calculate statistics once per eruption list, resolving each start year once;
+  // the search box re-renders the page on every keystroke
+  const { datedCount, dateRange, veiCount, avgVEI, eruptionRate } = useMemo(() => {
+    const dateRange = getDateRange(eruptions.map((e) => e.start_date));
+    const datedCount = dateRange?.count ?? 0;
+
+    let veiCount = 0;
+    let veiSum = 0;
+    for (const e of eruptions) {
+      if (e.vei !== null && e.vei !== undefined) {
+        veiCount++;
+        veiSum += e.vei;
+      }
     }
-  }
+
+    const avgVEI = veiCount > 0 ? (veiSum / veiCount).toFixed(1) : 'N/A';
+
+    // Calculate eruption rate
+    let eruptionRate = 'N/A';
+    if (dateRange && datedCount > 1) {
+      const yearSpan = dateRange.max - dateRange.min;
+      if (yearSpan > 0) {
+        const rate = (datedCount / yearSpan) * 100; // per century
+        eruptionRate = `${rate.toFixed(2)} per century`;
+      }
+    }
+
+    return { datedCount, dateRange, veiCount, avgVEI, eruptionRate };
+  }, [eruptions]);
 
   // Filter volcano suggestions
   const filteredVolcanoNames = searchInput
-    ? volcanoNames.filter((name) => name.toLowerCase().includes(searchInput.toLowerCase())).slice(0, 10)
+    ? searchNames(volcanoNameIndex, searchInput, 10)
     : [];
 
   const handleVolcanoSelect = (volcanoName: string) => {
@@ -244,7 +254,7 @@ const TimelinePage: React.FC = () => {
                   <p className="text-sm text-gray-600">Total Eruptions</p>
                   <p className="text-2xl font-bold text-gray-900">{eruptions.length}</p>
                   <p className="text-xs text-gray-500 mt-1">
-                    {eruptionsWithDates.length} with known dates
+                    {datedCount} with known dates
                   </p>
                 </div>
 
@@ -261,7 +271,7 @@ const TimelinePage: React.FC = () => {
                 <div className="bg-gray-50 rounded-lg p-4">
                   <p className="text-sm text-gray-600">Average VEI</p>
                   <p className="text-2xl font-bold text-gray-900">{avgVEI}</p>
-                  <p className="text-xs text-gray-500 mt-1">{eruptionsWithVEI.length} with known VEI</p>
+                  <p className="text-xs text-gray-500 mt-1">{veiCount} with known VEI</p>
                 </div>
 
                 <div className="bg-gray-50 rounded-lg p-4">
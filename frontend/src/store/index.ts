@@ -134,8 +134,11 @@ export const useSelectionStore = create<SelectionState>((set) => ({
       const existingIds = new Set(state.selectedSamples.map(s => s._id));
       const newSamples = samples.filter(sample => !existingIds.has(sample._id));
       
+      // Nothing new: keep the current array so subscribers do not re-render
+      if (newSamples.length === 0) return state;
+      
       return {
-        selectedSamples: [...state.selectedSamples, ...newSamples],
+        selectedSamples: state.selectedSamples.concat(newSamples),
       };
     }),
   clearSelection: () => set({ selectedSamples: [], selectionMode: 'none' }),
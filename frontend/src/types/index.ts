@@ -224,6 +224,8 @@ export interface VEIDistribution {
   date_range?: {
     start?: string;  // ISO 8601 format: "YYYY-MM-DDTHH:mm:ssZ" or "-YYYY-MM-DDTHH:mm:ssZ" for BCE
     end?: string;    // ISO 8601 format: "YYYY-MM-DDTHH:mm:ssZ"
+    start_year?: number;  // Numeric year of `start` (negative for BCE)
+    end_year?: number;    // Numeric year of `end` (negative for BCE)
   };
 }
 
@@ -312,6 +314,21 @@ export interface SpatialNearbyParams {
   limit?: number;
 }
 
+export interface SampleCluster {
+  lon: number;
+  lat: number;
+  db?: string;
+  count: number;
+}
+
+export interface SampleClusterResponse {
+  zoom: number;
+  cell_size: number; // grid cell width in degrees
+  count: number; // number of clusters
+  total: number; // number of samples across all clusters
+  data: SampleCluster[];
+}
+
 // Tectonic types
 export interface TectonicPlate {
   type: 'Feature';
@@ -0,0 +1,219 @@
+/**
+ * Chemical analysis response handling shared by the volcano analysis and
+ * comparison pages (GET /api/volcanoes/{volcano_number}/chemical-analysis)
+ */
+
+import type { Sample, MatchingMetadata, TectonicSettingSample, Petro } from '../types';
+
+export interface ChemicalAnalysisData {
+  volcano_number: number;
+  volcano_name: string;
+  samples_count: number;
+  tas_data: Array<{
+    sample_code: string;
+    sample_id: string;
+    db: string;
+    petro?: Petro;
+    material: string;
+    tecto?: TectonicSettingSample;
+    geometry?: { type: 'Point'; coordinates: [number, number] };
+    matching_metadata?: MatchingMetadata;
+    references?: string;
+    SIO2: number;
+    NA2O: number;
+    K2O: number;
+    FEOT?: number;
+    MGO?: number;
+    TIO2?: number;
+    AL2O3?: number;
+    CAO?: number;
+    P2O5?: number;
+    MNO?: number;
+  }>;
+  afm_data: Array<{
+    sample_code: string;
+    sample_id: string;
+    db: string;
+    petro?: Petro;
+    material: string;
+    tecto?: TectonicSettingSample;
+    geometry?: { type: 'Point'; coordinates: [number, number] };
+    matching_metadata?: MatchingMetadata;
+    references?: string;
+    FEOT: number;
+    NA2O: number;
+    K2O: number;
+    MGO: number;
+    SIO2?: number;
+    TIO2?: number;
+    AL2O3?: number;
+    CAO?: number;
+    P2O5?: number;
+    MNO?: number;
+  }>;
+  harker_data?: Array<{
+    sample_code: string;
+    sample_id: string;
+    db: string;
+    SIO2: number;
+    petro?: Petro;
+    material: string;
+    tecto?: TectonicSettingSample;
+    geometry?: { type: 'Point'; coordinates: [number, number] };
+    matching_metadata?: MatchingMetadata;
+    references?: string;
+    TIO2?: number;
+    AL2O3?: number;
+    FEOT?: number;
+    MGO?: number;
+    CAO?: number;
+    NA2O?: number;
+    K2O?: number;
+    P2O5?: number;
+    MNO?: number;
+  }>;
+  all_samples?: Array<{
+    sample_code: string;
+    sample_id: string;
+    db: string;
+    petro?: Petro;
+    material: string;
+    tecto?: TectonicSettingSample;
+    geometry?: { type: 'Point'; coordinates: [number, number] };
+    matching_metadata?: MatchingMetadata;
+    references?: string;
+    SIO2?: number;
+    NA2O?: number;
+    K2O?: number;
+    FEOT?: number;
+    MGO?: number;
+    TIO2?: number;
+    AL2O3?: number;
+    CAO?: number;
+    P2O5?: number;
+    MNO?: number;
+  }>;
+  rock_types: Record<string, number>;
+  rock_types_wr: Record<string, number>;  // Rock types for Whole Rock (WR) samples only
+}
+
+/**
+ * Transform all_samples array (includes ALL samples regardless of oxide completeness)
+ */
+export const transformAllSamples = (
+  allSamples: ChemicalAnalysisData['all_samples'],
+): Sample[] => {
+  if (!allSamples) return [];
+  
+  return allSamples.map(sample => {
+    const oxides: Record<string, number> = {};
+    if (sample['SIO2'] !== undefined) oxides['SIO2'] = sample['SIO2'];
+    if (sample['NA2O'] !== undefined) oxides['NA2O'] = sample['NA2O'];
+    if (sample['K2O'] !== undefined) oxides['K2O'] = sample['K2O'];
+    if (sample['FEOT'] !== undefined) oxides['FEOT'] = sample['FEOT'];
+    if (sample['MGO'] !== undefined) oxides['MGO'] = sample['MGO'];
+    if (sample['TIO2'] !== undefined) oxides['TIO2'] = sample['TIO2'];
+    if (sample['AL2O3'] !== undefined) oxides['AL2O3'] = sample['AL2O3'];
+    if (sample['CAO'] !== undefined) oxides['CAO'] = sample['CAO'];
+    if (sample['P2O5'] !== undefined) oxides['P2O5'] = sample['P2O5'];
+    if (sample['MNO'] !== undefined) oxides['MNO'] = sample['MNO'];
+
+    return {
+      _id: sample.sample_id,
+      sample_id: sample.sample_id,
+      sample_code: sample.sample_code,
+      db: sample.db,
+      material: sample.material,
+      petro: sample.petro,
+      tecto: sample.tecto,
+      geometry: sample.geometry || { type: 'Point', coordinates: [0, 0] },
+      matching_metadata: sample.matching_metadata,
+      references: sample.references,
+      oxides: Object.keys(oxides).length > 0 ? oxides : undefined,
+    };
+  });
+};
+
+/**
+ * Transform backend chemical analysis data to Sample[] format
+ * Now preserves MongoDB field names without conversion
+ */
+export const transformToSamples = (data: ChemicalAnalysisData): Sample[] => {
+  const sampleMap = new Map<string, Sample>();
+
+  for (const tas of data.tas_data) {
+    const oxides: Record<string, number> = {
+      'SIO2': tas['SIO2'],
+      'NA2O': tas['NA2O'],
+      'K2O': tas['K2O'],
+    };
+    if (tas['FEOT'] !== undefined) oxides['FEOT'] = tas['FEOT'];
+    if (tas['MGO'] !== undefined) oxides['MGO'] = tas['MGO'];
+    if (tas['TIO2'] !== undefined) oxides['TIO2'] = tas['TIO2'];
+    if (tas['AL2O3'] !== undefined) oxides['AL2O3'] = tas['AL2O3'];
+    if (tas['CAO'] !== undefined) oxides['CAO'] = tas['CAO'];
+    if (tas['P2O5'] !== undefined) oxides['P2O5'] = tas['P2O5'];
+    if (tas['MNO'] !== undefined) oxides['MNO'] = tas['MNO'];
+
+    const sample: Sample = {
+      _id: tas.sample_id,
+      sample_id: tas.sample_id,
+      sample_code: tas.sample_code,
+      db: tas.db,
+      material: tas.material,
+      petro: tas.petro,
+      tecto: tas.tecto,
+      geometry: tas.geometry || { type: 'Point', coordinates: [0, 0] },
+      matching_metadata: tas.matching_metadata,
+      references: tas.references,
+      oxides,
+    };
+    sampleMap.set(tas.sample_code, sample);
+  }
+
+  for (const afm of data.afm_data) {
+    const existing = sampleMap.get(afm.sample_code);
+    if (existing?.oxides) {
+      existing.oxides['FEOT'] = afm['FEOT'];
+      existing.oxides['MGO'] = afm['MGO'];
+      if (!existing.oxides['NA2O']) existing.oxides['NA2O'] = afm['NA2O'];
+      if (!existing.oxides['K2O']) existing.oxides['K2O'] = afm['K2O'];
+      if (afm['SIO2'] !== undefined && !existing.oxides['SIO2']) existing.oxides['SIO2'] = afm['SIO2'];
+      if (afm['TIO2'] !== undefined && !existing.oxides['TIO2']) existing.oxides['TIO2'] = afm['TIO2'];
+      if (afm['AL2O3'] !== undefined && !existing.oxides['AL2O3']) existing.oxides['AL2O3'] = afm['AL2O3'];
+      if (afm['CAO'] !== undefined && !existing.oxides['CAO']) existing.oxides['CAO'] = afm['CAO'];
+      if (afm['P2O5'] !== undefined && !existing.oxides['P2O5']) existing.oxides['P2O5'] = afm['P2O5'];
+      if (afm['MNO'] !== undefined && !existing.oxides['MNO']) existing.oxides['MNO'] = afm['MNO'];
+    } else {
+      const oxides: Record<string, number> = {
+        'FEOT': afm['FEOT'],
+        'MGO': afm['MGO'],
+        'NA2O': afm['NA2O'],
+        'K2O': afm['K2O'],
+      };
+      if (afm['SIO2'] !== undefined) oxides['SIO2'] = afm['SIO2'];
+      if (afm['TIO2'] !== undefined) oxides['TIO2'] = afm['TIO2'];
+      if (afm['AL2O3'] !== undefined) oxides['AL2O3'] = afm['AL2O3'];
+      if (afm['CAO'] !== undefined) oxides['CAO'] = afm['CAO'];
+      if (afm['P2O5'] !== undefined) oxides['P2O5'] = afm['P2O5'];
+      if (afm['MNO'] !== undefined) oxides['MNO'] = afm['MNO'];
+
+      const sample: Sample = {
+        _id: afm.sample_id,
+        sample_id: afm.sample_id,
+        sample_code: afm.sample_code,
+        db: afm.db,
+        material: afm.material,
+        petro: afm.petro,
+        tecto: afm.tecto,
+        geometry: afm.geometry || { type: 'Point', coordinates: [0, 0] },
+        matching_metadata: afm.matching_metadata,
+        references: afm.references,
+        oxides,
+      };
+      sampleMap.set(afm.sample_code, sample);
+    }
+  }
+
+  return Array.from(sampleMap.values());
+};
@@ -50,6 +50,10 @@ const FALLBACK_ROCK_TYPE_COLORS: Record<string, string> = {
 let ROCK_TYPE_COLORS: Record<string, string> = { ...FALLBACK_ROCK_TYPE_COLORS };
 let rockTypesLoaded = false;
 
+// Resolved colors per raw rock type label, so the partial-match scan runs once per label.
+// Cleared whenever ROCK_TYPE_COLORS is replaced.
+const rockTypeColorCache = new Map<string, string>();
+
 /**
  * Fetch rock types from API and generate color mapping
  */
@@ -88,6 +92,7 @@ async function loadRockTypeColors(): Promise<void> {
     }
 
     ROCK_TYPE_COLORS = newColors;
+    rockTypeColorCache.clear();
     rockTypesLoaded = true;
     console.log(`Loaded ${rockTypes.length} rock types with colors from API`);
   } catch (error) {
@@ -98,6 +103,7 @@ async function loadRockTypeColors(): Promise<void> {
       fallbackNormalized[k.toUpperCase()] = v;
     }
     ROCK_TYPE_COLORS = fallbackNormalized;
+    rockTypeColorCache.clear();
   }
 }
 
@@ -153,6 +159,9 @@ const FALLBACK_TECTONIC_COLORS: Record<string, string> = {
 let TECTONIC_SETTING_COLORS: Record<string, string> = { ...FALLBACK_TECTONIC_COLORS };
 let tectonicSettingsLoaded = false;
 
+// Resolved colors per tectonic setting label, cleared whenever TECTONIC_SETTING_COLORS is replaced
+const tectonicColorCache = new Map<string, string>();
+
 /**
  * Generate color for a tectonic setting based on type and crust
  */
@@ -213,21 +222,27 @@ async function loadTectonicSettingColors(): Promise<void> {
     const sampleSettings = samplesResult.data as string[];
     const volcanoSettings = volcanoesResult.data as string[];
     
-    // Combine all unique settings
-    const allSettings = [...new Set([...sampleSettings, ...volcanoSettings])];
+    // Combine all unique settings, adding into one set instead of spreading
+    // both lists into a temporary array and then back out of the set
+    const allSettings = new Set(sampleSettings);
+    for (const setting of volcanoSettings) {
+      allSettings.add(setting);
+    }
     
     // Generate colors for each setting
     const newColors: Record<string, string> = {};
-    allSettings.forEach((setting) => {
+    for (const setting of allSettings) {
       newColors[setting] = generateTectonicColor(setting);
-    });
+    }
     
     TECTONIC_SETTING_COLORS = newColors;
+    tectonicColorCache.clear();
     tectonicSettingsLoaded = true;
-    console.log(`Loaded ${allSettings.length} tectonic settings with colors from API`);
+    console.log(`Loaded ${allSettings.size} tectonic settings with colors from API`);
   } catch (error) {
     console.warn('Failed to load tectonic settings from API, using fallback colors:', error);
     TECTONIC_SETTING_COLORS = { ...FALLBACK_TECTONIC_COLORS };
+    tectonicColorCache.clear();
   }
 }
 
@@ -267,7 +282,16 @@ export const VEI_COLORS: string[] = [
  */
 export function getRockTypeColor(rockType: string | undefined): string {
   if (!rockType) return '#808080'; // Gray for unknown
-  
+
+  let color = rockTypeColorCache.get(rockType);
+  if (color === undefined) {
+    color = resolveRockTypeColor(rockType);
+    rockTypeColorCache.set(rockType, color);
+  }
+  return color;
+}
+
+function resolveRockTypeColor(rockType: string): string {
   // Normalize to uppercase for exact match
   const normalizedRockType = rockType.toUpperCase();
   
@@ -308,7 +332,16 @@ export async function ensureRockTypeColorsLoaded(): Promise<void> {
  */
 export function getTectonicSettingColor(setting: string | undefined): string {
   if (!setting) return '#808080'; // Gray for unknown
-  
+
+  let color = tectonicColorCache.get(setting);
+  if (color === undefined) {
+    color = resolveTectonicSettingColor(setting);
+    tectonicColorCache.set(setting, color);
+  }
+  return color;
+}
+
+function resolveTectonicSettingColor(setting: string): string {
   // Try exact match
   if (setting in TECTONIC_SETTING_COLORS) {
     return TECTONIC_SETTING_COLORS[setting];
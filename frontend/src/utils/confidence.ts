@@ -147,37 +147,36 @@ export const filterSamplesByConfidence = <T extends { matching_metadata?: Matchi
     return [];
   }
   
-  // If all levels selected, return all samples (no filtering needed)
-  if (selectedLevels.length === 4) {
+  // Build the membership set once rather than scanning the selection per sample
+  const selected = new Set<ConfidenceLevel>(selectedLevels);
+  
+  // If all levels selected, return all samples (no filtering needed). Counted on
+  // the set so a selection holding duplicates still takes this fast path.
+  if (selected.size === 4) {
     return samples;
   }
-  
   return samples.filter(sample => {
     const confidence = normalizeConfidence(
       sample.matching_metadata?.confidence_level,
       sample.matching_metadata
     );
-    return selectedLevels.includes(confidence);
+    return selected.has(confidence);
   });
 };
 
 /**
- * Calculate rock type distribution from samples
- * Used to compute rock type counts after applying confidence filtering
+ * Add a sample to a whole-rock (WR) rock type distribution
+ * Lets callers tally rock types inside their own pass over confidence-filtered samples
+ * @returns Whether the sample was counted
  */
-export const calculateRockTypeDistribution = <T extends { petro?: { rock_type?: string } }>(
-  samples: T[]
-): Record<string, number> => {
-  const distribution: Record<string, number> = {};
-  
-  for (const sample of samples) {
-    const rockType = sample.petro?.rock_type;
-    if (rockType) {
-      distribution[rockType] = (distribution[rockType] || 0) + 1;
-    }
-  }
-  
-  return distribution;
+export const addWholeRockType = <T extends { material?: string | null; petro?: { rock_type?: string } }>(
+  distribution: Record<string, number>,
+  sample: T
+): boolean => {
+  const rockType = sample.material === 'WR' ? sample.petro?.rock_type : undefined;
+  if (!rockType) return false;
+  distribution[rockType] = (distribution[rockType] || 0) + 1;
+  return true;
 };
 
 /**
@@ -1,5 +1,11 @@
 import type { DateInfo, GeologicalAge } from '../types';
 
+// Month names are shared by every formatDate call rather than rebuilt per date
+const MONTH_NAMES = [
+  'January', 'February', 'March', 'April', 'May', 'June',
+  'July', 'August', 'September', 'October', 'November', 'December'
+];
+
 /**
  * Format a DateInfo object to a readable string
  * 
@@ -24,22 +30,14 @@ export function formatDate(date: DateInfo | undefined): string {
   
   // Full date with day
   if (month && day) {
-    const monthNames = [
-      'January', 'February', 'March', 'April', 'May', 'June',
-      'July', 'August', 'September', 'October', 'November', 'December'
-    ];
     const uncertaintyStr = uncertainty_days ? ` (±${uncertainty_days} days)` : '';
-    return `${monthNames[month - 1]} ${day}, ${yearAbs}${era}${uncertaintyStr}`;
+    return `${MONTH_NAMES[month - 1]} ${day}, ${yearAbs}${era}${uncertaintyStr}`;
   }
   
   // Year and month
   if (month) {
-    const monthNames = [
-      'January', 'February', 'March', 'April', 'May', 'June',
-      'July', 'August', 'September', 'October', 'November', 'December'
-    ];
     const uncertaintyStr = uncertainty_days ? ` (±${uncertainty_days} days)` : '';
-    return `${monthNames[month - 1]} ${yearAbs}${era}${uncertaintyStr}`;
+    return `${MONTH_NAMES[month - 1]} ${yearAbs}${era}${uncertaintyStr}`;
   }
   
   // Year only
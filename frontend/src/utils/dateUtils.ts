@@ -5,6 +5,10 @@
 
 import type { DateInfo } from '../types';
 
+// Month labels are shared by every formatDateInfo call rather than rebuilt per date
+const MONTH_ABBREVIATIONS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                             'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
+
 /**
  * Parse DateInfo object to JavaScript Date
  * Handles missing fields and BCE dates (negative years)
@@ -70,15 +74,11 @@ export function formatDateInfo(dateInfo: DateInfo | null | undefined, includeDay
 
   if (month && includeDay && day) {
     // Full date with month and day
-    const monthNames = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                       'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
-    const monthStr = monthNames[month - 1] || month;
+    const monthStr = MONTH_ABBREVIATIONS[month - 1] || month;
     dateStr = `${day} ${monthStr} ${yearStr}`;
   } else if (month) {
     // Year and month only
-    const monthNames = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                       'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
-    const monthStr = monthNames[month - 1] || month;
+    const monthStr = MONTH_ABBREVIATIONS[month - 1] || month;
     dateStr = `${monthStr} ${yearStr}`;
   }
 
@@ -170,21 +170,29 @@ export function groupByPeriod(
 /**
  * Calculate date range from array of DateInfo objects
  * @param dates - Array of DateInfo objects
- * @returns Object with min and max years, or null if no valid dates
+ * @returns Object with min and max years and the number of valid dates, or null if no valid dates
  */
-export function getDateRange(dates: (DateInfo | null | undefined)[]): { min: number; max: number } | null {
-  const years = dates
-    .map(dateInfoToYear)
-    .filter((y): y is number => y !== null);
+export function getDateRange(
+  dates: (DateInfo | null | undefined)[]
+): { min: number; max: number; count: number } | null {
+  // Single pass with running bounds: no intermediate year arrays, and no
+  // argument spreading into Math.min/max, which overflows on very long lists
+  let min = Infinity;
+  let max = -Infinity;
+  let count = 0;
+  for (const date of dates) {
+    const year = dateInfoToYear(date);
+    if (year === null) continue;
+    count++;
+    if (year < min) min = year;
+    if (year > max) max = year;
+  }
 
-  if (years.length === 0) {
+  if (count === 0) {
     return null;
   }
 
-  return {
-    min: Math.min(...years),
-    max: Math.max(...years),
-  };
+  return { min, max, count };
 }
 
 /**
@@ -78,6 +78,8 @@ export function isValidCoordinate(lon: number, lat: number): boolean {
   );
 }
 
+const DEG_TO_RAD = Math.PI / 180;
+
 /**
  * Calculate distance between two coordinates (Haversine formula)
  * 
@@ -99,17 +101,19 @@ export function calculateDistance(
 ): number {
   const R = 6371; // Earth's radius in kilometers
   
-  const dLat = (lat2 - lat1) * Math.PI / 180;
-  const dLon = (lon2 - lon1) * Math.PI / 180;
+  const dLat = (lat2 - lat1) * DEG_TO_RAD;
+  const dLon = (lon2 - lon1) * DEG_TO_RAD;
   
+  // Each half-angle sine is evaluated once and squared
+  const sinHalfDLat = Math.sin(dLat / 2);
+  const sinHalfDLon = Math.sin(dLon / 2);
   const a =
-    Math.sin(dLat / 2) * Math.sin(dLat / 2) +
-    Math.cos(lat1 * Math.PI / 180) *
-    Math.cos(lat2 * Math.PI / 180) *
-    Math.sin(dLon / 2) *
-    Math.sin(dLon / 2);
+    sinHalfDLat * sinHalfDLat +
+    Math.cos(lat1 * DEG_TO_RAD) * Math.cos(lat2 * DEG_TO_RAD) * sinHalfDLon * sinHalfDLon;
   
-  const c = 2 * Math.atan2(Math.sqrt(a), Math.sqrt(1 - a));
+  // asin(sqrt(a)) equals atan2(sqrt(a), sqrt(1 - a)) for a in [0, 1] with one square
+  // root fewer; the clamp absorbs rounding that could push a just above 1
+  const c = 2 * Math.asin(Math.min(1, Math.sqrt(a)));
   
   return R * c;
 }
@@ -0,0 +1,46 @@
+/**
+ * Case-insensitive substring search for autocomplete name lists
+ * (volcano names, countries, regions)
+ */
+
+export interface NameSearchIndex {
+  /** Original names, in display order */
+  names: string[];
+  /** Lowercased names, aligned with `names` */
+  lowerNames: string[];
+}
+
+/**
+ * Lowercase every name once so that each keystroke only lowercases the query
+ *
+ * @param names - Names to search
+ * @returns Search index to pass to `searchNames`
+ */
+export function buildNameSearchIndex(names: string[]): NameSearchIndex {
+  return { names, lowerNames: names.map(name => name.toLowerCase()) };
+}
+
+/**
+ * Find names containing the query, ignoring case
+ *
+ * @param index - Index built with `buildNameSearchIndex`
+ * @param query - Text typed by the user
+ * @param limit - Maximum number of matches; scanning stops once reached
+ * @returns Matching names in their original order
+ *
+ * @example
+ * searchNames(buildNameSearchIndex(['Etna', 'Vesuvius']), 'ETN') // ['Etna']
+ */
+export function searchNames(index: NameSearchIndex, query: string, limit: number = Infinity): string[] {
+  const needle = query.toLowerCase();
+  const matches: string[] = [];
+  const { names, lowerNames } = index;
+
+  for (let i = 0; i < lowerNames.length && matches.length < limit; i++) {
+    if (lowerNames[i].includes(needle)) {
+      matches.push(names[i]);
+    }
+  }
+
+  return matches;
+}